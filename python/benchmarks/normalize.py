@@ -0,0 +1,52 @@
+"""Compare the old mask-stripping paths with ``validbr._normalize.only_digits``.
+
+Usage::
+
+    python benchmarks/normalize.py [--number 200000]
+"""
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from validbr._normalize import only_digits  # noqa: E402
+
+INPUTS = {
+    'masked': '123.456.789-09',
+    'unmasked': '12345678909',
+    'garbage': 'cpf: 123 abc 456 def 789 ghi 09 ' * 8,
+}
+
+
+def old_re_sub(value):
+    return re.sub(r'\D', '', value)
+
+
+def old_filter_isdigit(value):
+    return ''.join(filter(str.isdigit, value))
+
+
+IMPLEMENTATIONS = {
+    "re.sub(r'\\D')": old_re_sub,
+    'filter(str.isdigit)': old_filter_isdigit,
+    'only_digits': only_digits,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f'{"input":<10} {"implementation":<22} {"ns/op":>9}')
+    for label, value in INPUTS.items():
+        for name, func in IMPLEMENTATIONS.items():
+            seconds = min(timeit.repeat(lambda: func(value), number=args.number, repeat=3))
+            print(f'{label:<10} {name:<22} {seconds / args.number * 1e9:>9.0f}')
+
+
+if __name__ == '__main__':
+    main()
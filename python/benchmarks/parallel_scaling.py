@@ -0,0 +1,52 @@
+"""Throughput of validbr.parallel as the number of worker processes grows.
+
+Usage::
+
+    python benchmarks/parallel_scaling.py [--rows 2000000] [--chunk-size 20000]
+
+Runs the scalar ``cpf.is_valid`` (``vectorize=False``) so the work per row
+is pure Python and CPU bound; on an otherwise idle machine the speedup
+column should track the worker count closely.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from validbr import validbr  # noqa: E402
+from validbr.parallel import ParallelValidator  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000000)
+    parser.add_argument('--chunk-size', type=int, default=20000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    sample = [validbr.cpf.generate() for _ in range(10000)]
+    cpfs = (sample * (args.rows // len(sample) + 1))[:args.rows]
+
+    workers = [1]
+    while workers[-1] * 2 <= args.max_workers:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != args.max_workers:
+        workers.append(args.max_workers)
+
+    print(f'{"workers":>8} {"seconds":>9} {"rows/s":>12} {"speedup":>8}')
+    baseline = None
+    for n in workers:
+        with ParallelValidator(max_workers=n, chunk_size=args.chunk_size, vectorize=False) as pool:
+            pool.map('cpf.is_valid', sample, chunk_size=len(sample) // n)  # start every worker first
+            start = time.perf_counter()
+            results = pool.map('cpf.is_valid', cpfs)
+            elapsed = time.perf_counter() - start
+        assert all(results)
+        baseline = baseline or elapsed
+        print(f'{n:>8} {elapsed:>9.3f} {args.rows / elapsed:>12,.0f} {baseline / elapsed:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
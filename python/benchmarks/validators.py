@@ -0,0 +1,235 @@
+"""Hot-path benchmarks for every validator, with JSON baselines.
+
+Usage::
+
+    python benchmarks/validators.py                          # print a table
+    python benchmarks/validators.py --save baseline.json     # record a baseline
+    python benchmarks/validators.py --compare baseline.json  # diff against it
+    python benchmarks/validators.py -k cpf --min-time 0.5
+
+Each case calls one validator method on a fixed input: masked and
+unmasked valid values, invalid values and adversarial long strings.
+``ops/s`` is the best of ``--repeat`` timing runs; ``peak B`` is the
+largest amount of memory (per ``tracemalloc``) held during one call.
+``import validbr`` is timed too, as case ``validbr.import[cold]``, in a
+fresh interpreter with ``-X importtime`` (best of ``--repeat``, in
+microseconds).
+With ``--compare``, cases slower than the baseline by more than
+``--max-regression`` are flagged and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, ROOT)
+
+from validbr import ValidBR  # noqa: E402
+
+LONG_DIGITS = '1' * 10000
+LONG_MASK = '.-/ ' * 2500
+LONG_MIXED = 'x1.' * 3000 + '١٢٣' * 300
+LONG_TEXT = 'Maria ' * 2000
+
+# (validator, method, label, args)
+CASES = [
+    ('cpf', 'is_valid', 'masked', ('123.456.789-09',)),
+    ('cpf', 'is_valid', 'unmasked', ('12345678909',)),
+    ('cpf', 'is_valid', 'invalid', ('123.456.789-10',)),
+    ('cpf', 'is_valid', 'repeated', ('111.111.111-11',)),
+    ('cpf', 'is_valid', 'long-digits', (LONG_DIGITS,)),
+    ('cpf', 'is_valid', 'long-mixed', (LONG_MIXED,)),
+    ('cpf', 'apply_mask', 'unmasked', ('12345678909',)),
+    ('cpf', 'remove_mask', 'masked', ('123.456.789-09',)),
+    ('cpf', 'generate', 'default', ()),
+    ('cnpj', 'is_valid', 'masked', ('11.222.333/0001-81',)),
+    ('cnpj', 'is_valid', 'unmasked', ('11222333000181',)),
+    ('cnpj', 'is_valid', 'invalid', ('11.222.333/0001-82',)),
+    ('cnpj', 'is_valid', 'long-mask', (LONG_MASK,)),
+    ('cnpj', 'apply_mask', 'unmasked', ('11222333000181',)),
+    ('cnpj', 'generate', 'default', ()),
+    ('phone', 'is_valid', 'masked', ('(11) 98765-4321',)),
+    ('phone', 'is_valid', 'unmasked', ('11987654321',)),
+    ('phone', 'is_valid', 'invalid-ddd', ('(10) 98765-4321',)),
+    ('phone', 'is_valid', 'long-digits', (LONG_DIGITS,)),
+    ('phone', 'apply_mask', 'unmasked', ('11987654321',)),
+    ('email', 'is_valid', 'valid', ('joao.silva@gmail.com',)),
+    ('email', 'is_valid', 'invalid', ('joao.silva@@gmail',)),
+    ('email', 'is_valid', 'long-local', ('a' * 5000 + '@' + 'b' * 5000,)),
+    ('email', 'is_valid', 'long-dots', ('a.' * 3000 + '@x',)),
+    ('email', 'get_domain', 'valid', ('joao.silva@gmail.com',)),
+    ('name', 'is_valid', 'valid', ('Maria da Silva',)),
+    ('name', 'is_valid', 'invalid', ('M4ria',)),
+    ('name', 'is_valid', 'long-text', (LONG_TEXT,)),
+    ('name', 'get_initials', 'valid', ('Maria da Silva',)),
+    ('birth_date', 'is_valid', 'iso', ('1990-05-15',)),
+    ('birth_date', 'is_valid', 'br', ('15/05/1990',)),
+    ('birth_date', 'is_valid', 'invalid', ('31/02/1990',)),
+    ('birth_date', 'is_valid', 'long-digits', (LONG_DIGITS,)),
+    ('birth_date', 'get_age', 'br', ('15/05/1990',)),
+    ('cep', 'is_valid', 'masked', ('01310-100',)),
+    ('cep', 'is_valid', 'unmasked', ('01310100',)),
+    ('cep', 'is_valid', 'long-mask', (LONG_MASK,)),
+    ('cep', 'apply_mask', 'unmasked', ('01310100',)),
+    ('cep', 'get_state', 'masked', ('01310-100',)),
+    ('rg', 'is_valid', 'masked', ('12.345.678-9',)),
+    ('rg', 'is_valid', 'with-state', ('12.345.678-9', 'SP')),
+    ('rg', 'is_valid', 'long-digits', (LONG_DIGITS,)),
+    ('rg', 'apply_mask', 'unmasked', ('123456789',)),
+    ('ie', 'is_valid', 'sp', ('110.042.490.114', 'SP')),
+    ('ie', 'is_valid', 'mg', ('062.307.904/0081', 'MG')),
+    ('ie', 'is_valid', 'ba', ('123456-63', 'BA')),
+    ('ie', 'is_valid', 'invalid', ('110.042.490.115', 'SP')),
+    ('ie', 'is_valid', 'long-digits', (LONG_DIGITS, 'SP')),
+    ('ie', 'generate', 'sp', ('SP',)),
+    ('cnh', 'is_valid', 'valid', ('02650306461',)),
+    ('cnh', 'is_valid', 'invalid', ('02650306462',)),
+    ('cnh', 'is_valid', 'long-digits', (LONG_DIGITS,)),
+    ('cnh', 'generate', 'default', ()),
+    ('titulo_eleitor', 'is_valid', 'masked', ('6792 4206 7950',)),
+    ('titulo_eleitor', 'is_valid', 'invalid', ('6792 4206 7951',)),
+    ('titulo_eleitor', 'is_valid', 'long-mixed', (LONG_MIXED,)),
+    ('titulo_eleitor', 'apply_mask', 'unmasked', ('679242067950',)),
+    ('titulo_eleitor', 'generate', 'default', ()),
+]
+
+
+def case_name(validator: str, method: str, label: str) -> str:
+    return f'{validator}.{method}[{label}]'
+
+
+# The ``import validbr`` timing, selected with ``-k`` like any other case.
+IMPORT_CASE = case_name('validbr', 'import', 'cold')
+
+
+def selected(pattern: str, name: str) -> bool:
+    return pattern in name
+
+
+def measure_ops(func, args, min_time: float, repeat: int) -> float:
+    timer = timeit.Timer(lambda: func(*args))
+    number, elapsed = 1, timer.timeit(1)
+    while elapsed < min_time:
+        number *= 10 if elapsed < min_time / 10 else 2
+        elapsed = timer.timeit(number)
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return number / best
+
+
+def measure_peak_bytes(func, args) -> int:
+    func(*args)  # warm up lazy imports and caches
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+            tracemalloc.reset_peak()
+        # Older versions: the peak only covers what was traced since start(),
+        # which is just ``base`` at this point.
+        func(*args)
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def measure_import_us(repeat: int) -> int:
+    """Best cumulative ``-X importtime`` of ``import validbr``, in microseconds."""
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import validbr'],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        elapsed = None
+        for line in proc.stderr.splitlines():
+            fields = line.split('|')
+            if line.startswith('import time:') and fields[-1].strip() == 'validbr':
+                elapsed = int(fields[1])
+        if elapsed is None:
+            raise RuntimeError('validbr is missing from the -X importtime report')
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(pattern: str = '', min_time: float = 0.2, repeat: int = 3) -> dict:
+    v = ValidBR()
+    results = {}
+    for validator, method, label, args in CASES:
+        name = case_name(validator, method, label)
+        if not selected(pattern, name):
+            continue
+        func = getattr(getattr(v, validator), method)
+        results[name] = {
+            'ops_per_sec': measure_ops(func, args, min_time, repeat),
+            'peak_bytes': measure_peak_bytes(func, args),
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list:
+    """Names of the cases whose ops/s dropped more than ``max_regression``."""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before and result['ops_per_sec'] < before['ops_per_sec'] * (1 - max_regression):
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-k', dest='pattern', default='', help='only cases containing this text')
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per timing run')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save', metavar='FILE', help='write the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare against a JSON baseline')
+    parser.add_argument('--max-regression', type=float, default=0.2,
+                        help='allowed ops/s drop against the baseline (default: 0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as fh:
+            baseline = json.load(fh)['results']
+
+    results = run(args.pattern, args.min_time, args.repeat)
+    regressions = compare(results, baseline, args.max_regression)
+    import_us = measure_import_us(args.repeat) if selected(args.pattern, IMPORT_CASE) else None
+    before_us = baseline.get(IMPORT_CASE, {}).get('import_us')
+    if import_us and before_us and import_us > before_us * (1 + args.max_regression):
+        regressions.append(IMPORT_CASE)
+
+    header = f'{"case":<40} {"ops/s":>12} {"peak B":>9}'
+    print(header + (f' {"vs base":>8}' if baseline else ''))
+    for name, result in results.items():
+        line = f'{name:<40} {result["ops_per_sec"]:>12,.0f} {result["peak_bytes"]:>9}'
+        if name in baseline:
+            ratio = result['ops_per_sec'] / baseline[name]['ops_per_sec']
+            line += f' {ratio:>7.2f}x' + ('  REGRESSION' if name in regressions else '')
+        print(line)
+    if import_us is not None:
+        line = f'{IMPORT_CASE:<40} {import_us:>10,}us'
+        if before_us:
+            line += f' {" " * 9} {import_us / before_us:>7.2f}x'
+            line += '  REGRESSION' if IMPORT_CASE in regressions else ''
+        print(line)
+
+    if import_us is not None:
+        results[IMPORT_CASE] = {'import_us': import_us}
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as fh:
+            json.dump({
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'machine': platform.machine(),
+                'results': results,
+            }, fh, indent=2, sort_keys=True)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -16,6 +16,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/validbr/validbr",
     packages=find_packages(),
+    package_data={"validbr": ["data/*.csv"]},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -31,11 +32,29 @@ setup(
         "Topic :: Text Processing :: Filters",
     ],
     python_requires=">=3.7",
+    entry_points={
+        "console_scripts": [
+            "validbr=validbr.__main__:main",
+        ],
+    },
     install_requires=[
         "requests>=2.25.0",
+        "urllib3>=1.26.0",  # Retry(allowed_methods=...)
     ],
     extras_require={
+        "numpy": [
+            "numpy>=1.17.0",
+        ],
+        "pandas": [
+            "numpy>=1.17.0",
+            "pandas>=1.0.0",
+        ],
+        "polars": [
+            "numpy>=1.17.0",
+            "polars>=0.20.0",
+        ],
         "dev": [
+            "numpy>=1.17.0",
             "pytest>=6.0.0",
             "pytest-cov>=2.10.0",
             "black>=21.0.0",
@@ -28,6 +28,25 @@ def test_phone():
     assert validbr.phone.get_ddd('(11) 91234-5678') == '11'
     assert validbr.phone.get_state('11') == 'São Paulo'
 
+
+def test_phone_normalize():
+    assert validbr.phone.get_state('(21) 3265-4321') == 'Rio de Janeiro'
+    assert validbr.phone.normalize('+55 (11) 91234-5678') == '+5511912345678'
+    assert validbr.phone.normalize('0 21 11 3265-4321') == '+551132654321'
+    assert validbr.phone.normalize('(011) 91234-5678') == '+5511912345678'
+    assert validbr.phone.normalize('+1 415 555 0100') is None
+
+
+def test_phone_normalize_many():
+    pytest.importorskip('numpy')
+    phones = ['+55 (11) 91234-5678', '0055 21 3265-4321', '015 (48) 99876-5432', '(00) 91234-5678', None]
+    result = validbr.phone.normalize_many(phones)
+    assert result['e164'].tolist() == ['+5511912345678', '+552132654321', '+5548998765432', '', '']
+    assert result['ddd'].tolist() == [11, 21, 48, 0, 0]
+    assert result['state'].tolist() == ['São Paulo', 'Rio de Janeiro', 'Santa Catarina', '', '']
+    assert result['mobile'].tolist() == [True, False, True, False, False]
+    assert result['valid'].tolist() == [p is not None for p in map(validbr.phone.normalize, phones)]
+
 def test_email():
     assert validbr.email.is_valid('user@example.com')
     assert not validbr.email.is_valid('invalid-email')
@@ -35,6 +54,24 @@ def test_email():
     assert validbr.email.get_domain('user@example.com') == 'example.com'
     assert validbr.email.get_username('user@example.com') == 'user'
 
+
+def test_email_domains():
+    assert validbr.email.is_valid('a@uol.com.br') and not validbr.email.is_valid('a@com')
+    assert not validbr.email.is_valid('a@b@example.com') and not validbr.email.is_valid('a@-x.com')
+    assert validbr.email.is_brazilian_provider('joao@uol.com.br')
+
+
+def test_email_tlds_and_many():
+    from validbr.validators.email import EmailValidator
+    v = EmailValidator(tlds=['.io', 'com'])
+    assert v.is_valid('dev@x.io') and not v.is_valid('dev@x.br')
+    v.valid_tlds = v.valid_tlds | {'br'}
+    assert v.is_valid('dev@x.br')
+
+    pytest.importorskip('numpy')
+    emails = ['a@x.io', ' B@X.IO ', 'a b@x.io', 'c@y.org', None, '', 'd@x.br']
+    assert v.is_valid_many(emails).tolist() == [v.is_valid(e) for e in emails]
+
 def test_name():
     assert validbr.name.is_valid('João Silva Santos')
     assert not validbr.name.is_valid('João')
@@ -43,6 +80,25 @@ def test_name():
     assert validbr.name.get_last_name('João Silva Santos') == 'Santos'
     assert validbr.name.get_middle_names('João Silva Santos') == ['Silva']
 
+
+def test_name_parse_and_lexicon(tmp_path):
+    from validbr.validators.name import NameValidator
+    v = NameValidator()
+    assert v.parse('  ana - maria   de souza ') == {
+        'name': 'Ana Maria De Souza', 'first_name': 'Ana', 'middle_names': ['Maria', 'De'],
+        'last_name': 'Souza', 'initials': 'A.M.D.S.', 'common': True,
+    }
+    assert v.parse('x') is None and v.get_initials('Ana - Maria') == 'A.M.'
+    assert not v.has_common_brazilian_name('Zeferino Quixadá')
+    v.add_to_lexicon('Zeferino')
+    assert v.has_common_brazilian_name('Zeferino Quixadá')
+    lexicon = tmp_path / 'nomes.txt'
+    lexicon.write_text('# sobrenomes\nQuixadá\n\n', encoding='utf-8')
+    v.load_lexicon(str(lexicon), replace=True)
+    assert v.lexicon == frozenset(['quixadá'])
+    assert v.normalize_many(['  joão  silva', None, 'x', '  joão  silva']) == ['João Silva', '', '', 'João Silva']
+    assert v.normalize_many(['Ana - Maria Souza', 'ana maria souza']) == ['Ana Maria Souza'] * 2
+
 def test_birth_date():
     assert validbr.birth_date.is_valid('1990-05-15')
     assert not validbr.birth_date.is_valid('2030-05-15')  # Future date
@@ -51,6 +107,25 @@ def test_birth_date():
     assert validbr.birth_date.is_adult('1990-05-15')
     assert validbr.birth_date.is_minor('2010-05-15')
 
+
+def test_birth_date_reference_day():
+    from datetime import date
+    from validbr.validators.birth_date import BirthDateValidator
+    v = BirthDateValidator(today=date(2024, 2, 29))
+    assert v.is_valid('29/02/2024') and not v.is_valid('2024-03-01')
+    assert v.is_valid('1894-02-28') and not v.is_valid('1894-02-27')
+    assert v.get_age('2006-02-28') == 18 and v.get_age('2006-3-1') == 17
+    assert v.parse_date('1990-02-30') is None and v.parse_date('1990-٠5-15') is None
+    assert v.format('5/1/1990', 'DD/MM/YYYY') == '05/01/1990'
+    days = iter([date(2020, 1, 1), date(2021, 1, 1)])
+    v = BirthDateValidator(today=lambda: next(days))
+    assert v.get_age('2000-06-01') == 19 and v.get_age('2000-06-01') == 20
+
+    pytest.importorskip('numpy')
+    v = BirthDateValidator(today=date(2024, 2, 29))
+    values = ['2006-02-28', '01/03/2006', '2006-3-1', '2024-03-01', '1894-02-27', '31/04/2000', '', None]
+    assert v.get_age_many(values).tolist() == [18, 17, 17, -1, -1, -1, -1, -1]
+
 def test_cep():
     assert validbr.cep.is_valid('01234-567')
     assert not validbr.cep.is_valid('123')
@@ -66,12 +141,789 @@ def test_rg():
     assert masked == '12.345.678-9'
     assert validbr.rg.remove_mask(masked) == '123456789'
 
+
+def test_cpf_get_state():
+    # The fiscal region is the ninth digit, not the first.
+    assert validbr.cpf.get_state('111.444.777-35') == 'ES, RJ'
+    assert validbr.cpf.get_state('529.982.247-25') == 'ES, RJ'
+    assert validbr.cpf.get_state('313.113.118-74') == 'SP'
+    assert validbr.cpf.get_state('123.456.789-09') == 'PR, SC'
+    assert validbr.cpf.get_state('111.444.777-36') is None
+
+
+
+IE_EXAMPLES = [
+    ('AC', '01.004.823/001-12'), ('AL', '240000048'), ('AP', '030123459'), ('BA', '123456-63'),
+    ('BA', '1000003-06'), ('CE', '06000001-5'), ('MG', '062.307.904/0081'), ('PR', '123.45678-50'),
+    ('PE', '0321418-40'), ('PE', '18.1.001.0000004-9'), ('RN', '20.040.040-1'), ('RN', '20.0.040.040-0'),
+    ('RS', '224/3658792'), ('RO', '0000000062521-3'), ('RO', '101.62521-3'), ('RR', '24006628-1'),
+    ('SP', '110.042.490.114'), ('SP', 'P-01100424.3/002'), ('TO', '29010227836'),
+]
+
+
 def test_ie():
     assert validbr.ie.is_valid('12345678', 'SP') is False  # Exemplo simplificado
     assert validbr.ie.is_state_supported('SP')
     assert not validbr.ie.is_state_supported('XX')
 
+
+def test_ie_state_rules():
+    for state, ie in IE_EXAMPLES:
+        assert validbr.ie.is_valid(ie, state), (state, ie)
+        assert validbr.ie.is_valid(ie, state.lower())
+    assert not validbr.ie.is_valid('110042490115', 'SP')
+    assert not validbr.ie.is_valid('P-01100424.3/002', 'MG')
+    assert not validbr.ie.is_valid('250000048', 'AL')  # wrong prefix
+    assert not validbr.ie.is_valid('29050227836', 'TO')  # unknown TO type code
+    assert not validbr.ie.is_valid('0623079040081', 'SP')  # MG length
+    assert validbr.ie.remove_mask(' p-0110.042') == 'P0110042'
+    assert set(validbr.ie.get_formats('BA')) == {8, 9}
+    assert validbr.ie.calculate_check_digit('11004249011', 'SP') == 4
+    for state in validbr.ie.get_valid_states():
+        assert validbr.ie.is_valid(validbr.ie.generate(state), state)
+
+
+def test_ie_is_valid_many():
+    pytest.importorskip('numpy')
+    states = [s for s, _ in IE_EXAMPLES] + ['SP', 'XX', 'MG', 'AL']
+    ies = [i for _, i in IE_EXAMPLES] + ['110042490115', '12345678', None, '250000048']
+    expected = [validbr.ie.is_valid(i, s) for i, s in zip(ies, states)]
+    assert validbr.ie.is_valid_many(ies, states).tolist() == expected
+    generated = validbr.ie.generate_many('BA', 500, seed=3)
+    assert validbr.ie.is_valid_many(generated, 'BA').all()
+    assert validbr.ie.is_valid_many(generated, 'RJ').mean() < 0.2
+    with pytest.raises(ValueError):
+        validbr.ie.is_valid_many(ies[:3], ['SP'])
+
 def test_utils():
     assert validbr.sanitize('  test   string  ') == 'test string'
     assert validbr.remove_non_numeric('abc123def456') == '123456'
-    assert validbr.remove_non_alphabetic('abc123def!@#') == 'abcdef'
\ No newline at end of file
+    assert validbr.remove_non_alphabetic('abc123def!@#') == 'abcdef'
+
+
+def test_remove_mask_ascii_digits():
+    assert validbr.remove_non_numeric('١٢3') == '3'
+    assert validbr.ie.remove_mask('12.3٤5') == '1235'
+    assert validbr.cpf.remove_mask('12345678909') == '12345678909'
+    assert validbr.cpf.remove_mask(None) == ''
+
+
+def test_cpf_is_valid_many():
+    np = pytest.importorskip('numpy')
+    cpfs = [validbr.cpf.generate() for _ in range(200)]
+    cpfs += [
+        '12345678909', '123.456.789-09', '123.456.789-10', '111.111.111-11',
+        '00000000000', '1234567890', '123456789091', '', 'abc', None, 12345678909,
+        '١٢٣.٤٥٦.٧٨٩-٠٩', 'cpf: 123 456 789 09',
+    ]
+    expected = [validbr.cpf.is_valid(c) for c in cpfs]
+    result = validbr.cpf.is_valid_many(cpfs)
+    assert result.dtype == bool
+    assert result.tolist() == expected
+
+    as_bytes = np.array([c.encode() for c in cpfs if isinstance(c, str) and c.isascii()])
+    assert validbr.cpf.is_valid_many(as_bytes).tolist() == [
+        validbr.cpf.is_valid(c.decode()) for c in as_bytes
+    ]
+    assert validbr.cpf.is_valid_many([]).tolist() == []
+
+    reasons = validbr.cpf.get_failure_reason_many(cpfs)
+    assert reasons.tolist() == [validbr.cpf.get_failure_reason(c) for c in cpfs]
+    assert [validbr.cpf.failure_reasons[r] for r in reasons[200:205]] == [
+        'valid', 'valid', 'dv1', 'repeated_digits', 'repeated_digits',
+    ]
+
+def test_cnpj_is_valid_many():
+    pytest.importorskip('numpy')
+    from validbr.validators import cnpj as cnpj_module
+    cnpjs = [validbr.cnpj.generate() for _ in range(200)]
+    cnpjs += [
+        '12.345.678/0001-95', '12345678000195', '12.345.678/0001-96',
+        '12.345.678/0001-05', '11.111.111/1111-11', '1234567800019', '', None,
+        '١٢.٣٤٥.٦٧٨/٠٠٠١-٩٥',
+    ]
+    reasons = validbr.cnpj.get_failure_reason_many(cnpjs)
+    assert reasons.dtype.itemsize == 1
+    assert reasons.tolist() == [validbr.cnpj.get_failure_reason(c) for c in cnpjs]
+    assert reasons[-9:].tolist() == [
+        cnpj_module.VALID, cnpj_module.VALID, cnpj_module.INVALID_SECOND_DIGIT,
+        cnpj_module.INVALID_FIRST_DIGIT, cnpj_module.REPEATED_DIGITS,
+        cnpj_module.INVALID_LENGTH, cnpj_module.INVALID_LENGTH,
+        cnpj_module.INVALID_LENGTH, cnpj_module.INVALID_LENGTH,
+    ]
+    assert validbr.cnpj.is_valid_many(cnpjs).tolist() == [validbr.cnpj.is_valid(c) for c in cnpjs]
+
+def test_validate_stream():
+    from validbr.stream import ValidationSummary, validate_stream
+    rows = [
+        {'doc': '123.456.789-09', 'ie': '110042490114', 'uf': 'SP'},
+        {'doc': '123.456.789-10', 'ie': '', 'uf': 'SP'},
+        {'doc': None, 'ie': '12345678', 'uf': 'XX'},
+    ]
+    summary = ValidationSummary()
+    out = list(validate_stream(
+        iter(rows), {'doc': 'cpf', 'ie': 'ie'}, state_column='uf', chunk_size=2, summary=summary,
+    ))
+    assert [r['doc_valid'] for r in out] == [True, False, False]
+    assert [r['ie_valid'] for r in out] == [
+        validbr.ie.is_valid(r['ie'], r['uf']) for r in rows
+    ]
+    assert summary.as_dict()['rows'] == 3
+    assert summary.columns['doc'] == {'validator': 'cpf', 'valid': 1, 'invalid': 2}
+    with pytest.raises(ValueError):
+        list(validate_stream(rows, {'ie': 'ie'}))
+    with pytest.raises(ValueError):
+        list(validate_stream(rows, {'doc': 'cpf'}, chunk_size=0))
+
+
+def test_cli(tmp_path):
+    import json
+    from validbr.__main__ import main
+    source = tmp_path / 'in.csv'
+    source.write_text('nome,cpf,telefone\nJoão,123.456.789-09,(11) 91234-5678\nAna,111,(00) 1234\n', encoding='utf-8')
+    output = tmp_path / 'out.jsonl'
+    summary = tmp_path / 'summary.json'
+    assert main([str(source), '-o', str(output), '--check', 'cpf=cpf',
+                 '--check', 'telefone=phone', '--summary', str(summary)]) == 0
+    rows = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+    assert [(r['nome'], r['cpf_valid'], r['telefone_valid']) for r in rows] == [
+        ('João', True, True), ('Ana', False, False),
+    ]
+    assert json.loads(summary.read_text())['columns']['cpf']['valid'] == 1
+    with pytest.raises(SystemExit):
+        main([str(source), '-o', str(output), '--check', 'cpf=cpf', '--chunk-size', '0'])
+    with pytest.raises(SystemExit):
+        main([str(source), '-o', str(output), '--check', 'cpf=cpf', '--check', 'cpf=cnpj'])
+
+    # JSONL rows with different keys still produce a complete CSV.
+    mixed = tmp_path / 'mixed.jsonl'
+    mixed.write_text(
+        '{"cpf": "123.456.789-09"}\n{"cpf": "111", "extra": 1}\n{"nome": "Ana"}\n', encoding='utf-8',
+    )
+    output = tmp_path / 'mixed.csv'
+    assert main([str(mixed), '-o', str(output), '--check', 'cpf=cpf', '--summary', str(summary)]) == 0
+    assert output.read_text(encoding='utf-8').splitlines() == [
+        'cpf,cpf_valid', '123.456.789-09,True', '111,False', ',False',
+    ]
+
+
+def test_cli_closes_input_on_output_error(tmp_path, monkeypatch):
+    import builtins
+    import validbr.__main__ as cli
+    opened = []
+
+    def tracking_open(*args, **kwargs):
+        opened.append(builtins.open(*args, **kwargs))
+        return opened[-1]
+    monkeypatch.setattr(cli, 'open', tracking_open, raising=False)
+    source = tmp_path / 'in.csv'
+    source.write_text('cpf\n123.456.789-09\n', encoding='utf-8')
+    with pytest.raises(FileNotFoundError):
+        cli.main([str(source), '-o', str(tmp_path / 'missing' / 'out.csv'), '--check', 'cpf=cpf'])
+    assert len(opened) == 1 and opened[0].closed
+
+def test_parallel_validator():
+    from validbr.parallel import ParallelValidator
+    cpfs = [validbr.cpf.generate() for _ in range(50)] + ['123.456.789-10', '', None] * 10
+    ies = ['110042490114', '12345678', '', 'abc'] * 5
+    states = ['SP', 'SP', 'RJ', 'XX'] * 5
+    with ParallelValidator(max_workers=2, chunk_size=7) as pool:
+        assert pool.map('cpf.is_valid', cpfs) == [validbr.cpf.is_valid(c) for c in cpfs]
+        assert pool.map(validbr.cnpj.is_valid, ['12.345.678/0001-95', 'x']) == [True, False]
+        assert pool.map('ie.is_valid', ies, states) == [
+            validbr.ie.is_valid(i, s) for i, s in zip(ies, states)
+        ]
+        assert pool.map('rg.is_valid', ['12.345.678-9', '123'], [None, None]) == [True, False]
+        assert list(pool.imap('cep.apply_mask', iter(['01234567']))) == ['01234-567']
+        with pytest.raises(ValueError):
+            pool.map('ie.is_valid', ies, states[:-1])
+        with pytest.raises(ValueError):
+            pool.map('ie.is_valid', ies[:7], states[:8])
+
+def test_lazy_import():
+    import json
+    import subprocess
+    import sys
+    from validbr import ValidBR, CPFValidator
+    assert isinstance(ValidBR().cpf, CPFValidator)
+
+    # Only the validator actually used should be loaded, never the HTTP stack.
+    # The import time itself is tracked by ``benchmarks/validators.py``.
+    code = (
+        "import sys, json; from validbr import validbr; validbr.cpf.is_valid('12345678909'); "
+        "print(json.dumps(sorted(sys.modules)))"
+    )
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    modules = json.loads(proc.stdout)
+    assert 'validbr.validators.cpf' in modules
+    assert 'validbr.validators.cnpj' not in modules
+    assert 'validbr.validators.cep' not in modules
+    assert not any(name.split('.')[0] in ('requests', 'urllib3', 'ssl') for name in modules)
+
+
+@pytest.fixture
+def viacep_server():
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            cep = self.path.strip('/').split('/')[1]
+            requests_seen.append(cep)
+            body = {'erro': True} if cep.startswith('9') else {'cep': cep, 'uf': 'SP'}
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/ws', requests_seen
+    server.shutdown()
+    server.server_close()
+
+
+def test_cep_client(viacep_server):
+    import asyncio
+    pytest.importorskip('requests')
+    from validbr import ValidBR
+    from validbr.cep_client import CEPClient
+    base_url, seen = viacep_server
+    v = ValidBR()
+    v.cep.client = CEPClient(base_url=base_url, timeout=2, cache_size=100)
+
+    assert v.cep.get_info('01234-567') == {'cep': '01234567', 'uf': 'SP'}
+    assert v.cep.get_info('01234567') == {'cep': '01234567', 'uf': 'SP'}
+    assert v.cep.get_info('90000-000') is None
+    assert v.cep.get_info('90000-000') is None
+    assert v.cep.get_info('123') is None
+    assert seen == ['01234567', '90000000']
+    assert v.cep.client.cache.stats()['hits'] == 2
+
+    ceps = ['01000-001', '01000-002', '01000-001', 'bad', '90000-000']
+    results = asyncio.run(v.cep.get_info_many_async(ceps, concurrency=4))
+    assert [r and r['cep'] for r in results] == ['01000001', '01000002', '01000001', None, None]
+    assert sorted(seen[2:]) == ['01000001', '01000002']
+    v.cep.client.close()
+
+
+def test_cep_client_async_cancel():
+    import asyncio
+    import threading
+    import time
+    from validbr.cep_client import CEPClient
+
+    release = threading.Event()
+    client = CEPClient()
+    client.lookup = lambda cep: release.wait(5)
+
+    async def main():
+        task = asyncio.ensure_future(client.lookup_many_async(['01000001', '01000002']))
+        await asyncio.sleep(0.05)
+        start = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Cancelling must not wait for the blocked lookups to finish.
+        return time.monotonic() - start
+
+    try:
+        assert asyncio.run(main()) < 1
+    finally:
+        release.set()
+
+
+def test_lru_cache():
+    from validbr.cache import LRUCache
+    now = [0.0]
+    cache = LRUCache(maxsize=2, ttl=10, timer=lambda: now[0])
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'b' not in cache and 'a' in cache
+    cache.set('d', None, ttl=1)
+    now[0] = 5
+    assert cache.get('d', 'missing') == 'missing'
+    assert 'c' not in cache
+    assert cache.get('a') == 1
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'evictions': 2, 'size': 1, 'maxsize': 2}
+
+
+def test_cep_range_index(tmp_path):
+    from validbr.cep_index import CEPRangeIndex
+    assert validbr.cep.get_state('30130-010') == 'MG'
+    assert validbr.cep.get_state('69301-000') == 'RR'
+    assert validbr.cep.get_state('00000-000') is None
+    assert validbr.cep.get_city('01310-100') is None
+
+    source = tmp_path / 'ranges.csv'
+    source.write_text(
+        'start,end,uf,city\n'
+        '20000001,23799999,RJ,Rio de Janeiro\n'
+        '01000000,05999999,SP,São Paulo\n'
+        '06000000,09999999,SP,\n',
+        encoding='utf-8',
+    )
+    index = CEPRangeIndex.from_csv(str(source))
+    compiled = tmp_path / 'ranges.idx'
+    index.save(str(compiled))
+    mapped = CEPRangeIndex.open(str(compiled))
+    for idx in (index, mapped):
+        assert idx.lookup('01310-100') == ('SP', 'São Paulo')
+        assert idx.lookup(20000001) == ('RJ', 'Rio de Janeiro')
+        assert idx.lookup('07000000') == ('SP', None)
+        assert idx.lookup('20000000') is None
+        assert idx.lookup('99999999') is None
+    assert list(mapped.names) == index.names and mapped.names[-1] == 'Rio de Janeiro'
+    resaved = tmp_path / 'resaved.idx'
+    mapped.save(str(resaved))
+    assert resaved.read_bytes() == compiled.read_bytes()
+    mapped.close()
+
+    with pytest.raises(ValueError):
+        CEPRangeIndex.from_rows([(1, 10, 'SP', ''), (5, 20, 'RJ', '')])
+
+
+def test_validation_cache():
+    from validbr import ValidBR
+    v = ValidBR()
+    v.enable_cache(maxsize=2, validators=('cpf', 'ie'))
+    assert v.cpf.is_valid('123.456.789-09')
+    assert v.cpf.is_valid('12345678909')
+    assert not v.cpf.is_valid('123.456.789-10')
+    assert not v.cpf.is_valid(None)
+    assert v.cpf.get_state('123.456.789-09') == validbr.cpf.get_state('123.456.789-09')
+    assert v.ie.is_valid('12345678', 'sp') == v.ie.is_valid('12345678', 'SP')
+    stats = v.cache_stats()
+    assert stats['cpf']['hits'] == 2 and stats['cpf']['misses'] == 2
+    assert stats['cpf']['size'] == 2 and stats['ie']['hits'] == 1
+    with pytest.raises(ValueError):
+        v.enable_cache(validators=('birth_date',))
+    v.disable_cache()
+    assert v.cache_stats() == {}
+    assert 'is_valid' not in vars(v.cpf)
+
+
+def test_validation_cache_keywords():
+    from validbr import ValidBR
+    v = ValidBR()
+    v.enable_cache(validators=('ie', 'rg', 'cpf'))
+    state, ie = IE_EXAMPLES[0]
+    assert v.ie.is_valid(ie, state=state) == validbr.ie.is_valid(ie, state)
+    assert v.ie.is_valid(ie=ie, state=state.lower()) == validbr.ie.is_valid(ie, state)
+    assert v.cache_stats()['ie']['hits'] == 1
+    assert v.rg.is_valid('12.345.678-9', state=None)
+    assert v.cpf.is_valid(cpf='111.444.777-35')
+    with pytest.raises(TypeError):
+        v.ie.is_valid(ie, estado='SP')
+
+
+def test_validate_record():
+    schema = {
+        'nome': 'name', 'cpf': 'cpf', 'email': 'email', 'celular': 'phone',
+        'nascimento': 'birth_date', 'cep': 'cep', 'rg': 'rg', 'uf': 'uf',
+    }
+    record = {
+        'nome': '  joão   silva santos ', 'cpf': '123.456.789-09', 'email': ' JOAO@UOL.COM.BR',
+        'celular': '(21) 91234-5678', 'nascimento': '15/05/1990', 'cep': '30130-010',
+        'rg': '12.345.678-9', 'uf': 'sp',
+    }
+    result = validbr.validate_record(schema, record)
+    fields = result['fields']
+    assert fields['nome']['initials'] == 'J.S.S.' and fields['nome']['first_name'] == 'João'
+    assert fields['cpf'] == {'value': '12345678909', 'valid': True, 'region': 'PR, SC', 'validator': 'cpf'}
+    assert fields['email']['domain'] == 'uol.com.br'
+    assert fields['celular']['state'] == 'Rio de Janeiro' and fields['celular']['mobile']
+    assert fields['nascimento']['age'] == validbr.birth_date.get_age('1990-05-15')
+    assert fields['cep']['state'] == 'MG'
+    assert fields['rg']['valid'] == validbr.rg.is_valid('12.345.678-9', 'SP')
+    assert result['valid'] == (result['errors'] == [])
+
+    bad = list(validbr.validate_records({'cpf': 'cpf', 'ie': 'ie'}, [{'cpf': '1'}, {'ie': '123'}]))
+    assert bad[0]['errors'] == ['cpf', 'ie'] and bad[0]['fields']['ie']['missing']
+    assert not bad[1]['fields']['ie']['valid']
+    with pytest.raises(ValueError):
+        validbr.validate_record({'x': 'nope'}, {})
+
+    # Stripped punctuation must not leave empty name parts.
+    name = validbr.validate_record({'n': 'name'}, {'n': 'Ana - Maria Souza'})['fields']['n']
+    assert name['valid'] and name['initials'] == 'A.M.S.' and name['last_name'] == 'Souza'
+
+
+def test_generate_many(tmp_path):
+    pytest.importorskip('numpy')
+    cpfs = validbr.cpf.generate_many(500, seed=42)
+    assert cpfs == validbr.cpf.generate_many(500, seed=42)
+    assert all(validbr.cpf.is_valid(c) and len(c) == 14 for c in cpfs)
+
+    unique = validbr.cpf.generate_many(2000, seed=1, unique=True, region=8, masked=False)
+    assert len(set(unique)) == 2000
+    assert all(validbr.cpf.is_valid(c) and c[8] == '8' and len(c) == 11 for c in unique)
+    with pytest.raises(ValueError):
+        validbr.cpf.generate_many(1, region=11)
+    # Unique bases follow no arithmetic pattern and differ between document types.
+    bases = [int(c[:9]) for c in validbr.cpf.generate_many(6, seed=1, unique=True, masked=False)]
+    assert len({b - a for a, b in zip(bases, bases[1:])}) > 1
+    cnhs = validbr.cnh.generate_many(6, seed=1, unique=True)
+    assert [int(c[:9]) for c in cnhs] != bases
+
+    assert all(validbr.cnpj.is_valid(c) for c in validbr.cnpj.generate_many(500, seed=3, unique=True))
+    assert all(validbr.cnh.is_valid(c) for c in validbr.cnh.generate_many(500, seed=4))
+    assert all(validbr.titulo_eleitor.is_valid(t) for t in validbr.titulo_eleitor.generate_many(500, seed=5, masked=True))
+    for state in ('SP', 'MG', 'RO'):
+        assert all(validbr.ie.is_valid(i, state) for i in validbr.ie.generate_many(state, 200, seed=6))
+    assert validbr.cnh.is_valid(validbr.cnh.generate())
+    assert validbr.titulo_eleitor.is_valid(validbr.titulo_eleitor.generate())
+
+    path = tmp_path / 'cpfs.txt'
+    assert validbr.cpf.generate_many(1000, seed=7, output=str(path)) == 1000
+    lines = path.read_text().splitlines()
+    assert lines == validbr.cpf.generate_many(1000, seed=7)
+
+
+def test_classify():
+    assert validbr.classify('123.456.789-09') == ['cpf']
+    assert validbr.classify('11.222.333/0001-81') == ['cnpj']
+    assert validbr.classify('(11) 98765-4321') == ['phone']
+    assert validbr.classify('12.345.678-9') == ['rg']
+    assert validbr.classify('abc') == [] and validbr.classify(None) == []
+    assert 'cnh' in validbr.classify(validbr.cnh.generate())
+
+
+def test_classify_many():
+    pytest.importorskip('numpy')
+    values = ['123.456.789-09', '11.222.333/0001-81', '(11) 98765-4321', '1132654321',
+              '12.345.678-9', 'abc', None, '']
+    values += [validbr.cnh.generate() for _ in range(50)]
+    values += [validbr.titulo_eleitor.generate() for _ in range(50)]
+    values += [str(n).zfill(11) for n in range(11987654000, 11987654400)]
+    masks = validbr.classify_many(values)
+    assert list(masks) == ['cpf', 'cnpj', 'cnh', 'titulo_eleitor', 'phone', 'rg']
+    for i, value in enumerate(values):
+        assert sorted(n for n in masks if masks[n][i]) == sorted(validbr.classify(value))
+
+
+def test_async_validbr():
+    import asyncio
+    import threading
+    import time
+    from validbr import ValidBR
+    from validbr.aio import AsyncValidBR
+
+    class SlowClient:
+        def __init__(self):
+            self.calls = []
+            self.active = self.peak = 0
+            self.lock = threading.Lock()
+
+        def lookup(self, clean_cep):
+            with self.lock:
+                self.calls.append(clean_cep)
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.02)
+            with self.lock:
+                self.active -= 1
+            return {'cep': clean_cep}
+
+    v = ValidBR()
+    v.cep.client = SlowClient()
+    avalid = AsyncValidBR(v, max_pending=2)
+
+    async def main():
+        assert await avalid.cpf.is_valid('123.456.789-09')
+        assert await avalid.cpf.apply_mask('12345678909') == '123.456.789-09'
+        assert await avalid.classify('11.222.333/0001-81') == ['cnpj']
+        same = await asyncio.gather(*(avalid.cep.get_info('01310-100') for _ in range(5)))
+        assert same == [{'cep': '01310100'}] * 5 and v.cep.client.calls == ['01310100']
+        assert await avalid.cep.get_info('123') is None
+        ceps = [f'0131{i:04d}' for i in range(6)]
+        await asyncio.gather(*(avalid.cep.get_info(c) for c in ceps))
+        assert v.cep.client.peak <= 2 and avalid.pending == 0
+        records = await avalid.validate_records({'cpf': 'cpf'}, [{'cpf': '123.456.789-09'}])
+        assert records[0]['valid']
+        assert avalid.cpf.state_map[8] == 'SP' and avalid.sanitize(' a  b ') == 'a b'
+
+    asyncio.run(main())
+
+
+def test_metrics():
+    from validbr import ValidBR
+    v = ValidBR()
+    metrics = v.enable_metrics(validators=('cpf', 'cnpj'))
+    assert v.cpf.is_valid('123.456.789-09')
+    assert not v.cpf.is_valid('123')
+    assert not v.cnpj.is_valid('11.222.333/0001-82')
+    assert not v.cnpj.is_valid('11.111.111/1111-11')
+    v.cpf.apply_mask('12345678909')
+    data = metrics.as_dict()
+    assert data['cpf']['is_valid']['calls'] == 2
+    assert data['cpf']['is_valid']['valid'] == 1 and data['cpf']['is_valid']['invalid'] == 1
+    assert data['cnpj']['is_valid']['failures'] == {'dv2': 1, 'repeated_digits': 1}
+    assert data['cpf']['is_valid']['failures'] == {'length': 1}
+    assert data['cpf']['apply_mask']['calls'] == 1
+    assert data['cpf']['is_valid']['buckets'][float('inf')] == 2
+    text = metrics.to_prometheus()
+    assert 'validbr_calls_total{validator="cpf",method="is_valid"} 2' in text
+    assert 'validbr_failures_total{validator="cnpj",method="is_valid",reason="dv2"} 1' in text
+    assert 'validbr_duration_seconds_count{validator="cpf",method="is_valid"} 2' in text
+
+    # Metrics and the result cache stack in either order.
+    v.enable_cache(validators=('cpf',))
+    v.cpf.is_valid('123.456.789-09')
+    assert metrics.as_dict()['cpf']['is_valid']['calls'] == 3
+    assert v.cache_stats()['cpf']['misses'] == 1
+    v.disable_cache()
+    v.disable_metrics()
+    assert v.metrics is None and 'is_valid' not in v.cpf.__dict__
+
+    np = pytest.importorskip('numpy')
+    metrics = v.enable_metrics(validators=('cnpj',))
+    mask = v.cnpj.is_valid_many(['11.222.333/0001-81', '11.222.333/0001-82', '1'])
+    assert mask.tolist() == [True, False, False] and mask.dtype == np.bool_
+    stats = metrics.as_dict()['cnpj']['is_valid_many']
+    assert (stats['valid'], stats['invalid']) == (1, 2)
+    assert stats['failures'] == {'dv2': 1, 'length': 1}
+
+
+def test_metrics_lazy_validators():
+    from validbr import VALIDATORS, ValidBR
+    v = ValidBR()
+    metrics = v.enable_metrics()
+    assert not set(VALIDATORS) & set(v.__dict__)
+    assert v.cpf.is_valid('123.456.789-09')
+    v.enable_cache(validators=('cnh',))
+    v.cnh.is_valid('123')
+    data = metrics.as_dict()
+    assert data['cpf']['is_valid']['calls'] == 1
+    assert data['cnh']['is_valid']['calls'] == 1
+    assert set(VALIDATORS) & set(v.__dict__) == {'cpf', 'cnh'}
+    v.disable_metrics()
+    assert 'is_valid' not in v.cpf.__dict__
+
+
+def test_pandas_accessor():
+    pd = pytest.importorskip('pandas')
+    from validbr.dataframe import register
+    register()
+
+    cpfs = pd.Series(['111.444.777-35', '123', None], index=[10, 20, 30], name='cpf')
+    valid = cpfs.validbr.cpf.is_valid()
+    assert str(valid.dtype) == 'boolean' and list(valid.index) == [10, 20, 30]
+    assert valid.tolist() == [True, False, pd.NA]
+    masked = pd.Series(['11144477735', None]).validbr.cpf.apply_mask()
+    assert masked.tolist() == ['111.444.777-35', pd.NA]
+
+    phones = pd.Series(['(11) 98765-4321', '21 3333-4444', None])
+    assert phones.validbr.phone.get_ddd().dtype == 'category'
+    assert phones.validbr.phone.normalize().tolist() == ['+5511987654321', '+552133334444', pd.NA]
+    ages = pd.Series(['1990-01-01', 'x', None]).validbr.birth_date.get_age()
+    assert ages.isna().tolist() == [False, True, True]
+
+    state, ie = IE_EXAMPLES[0]
+    df = pd.DataFrame({'ie': [ie, ie, None], 'uf': [state, 'XX', 'SP'], 'cpf': ['11144477735', None, '1']})
+    assert df.validbr.ie.is_valid('ie', 'uf').tolist() == [True, False, pd.NA]
+    report = df.validbr.validate({'cpf': 'cpf', 'ie': 'ie'}, state_column='uf')
+    assert report['cpf'].tolist() == [True, pd.NA, False]
+    assert report['ie'].tolist() == [True, False, pd.NA]
+
+
+def test_polars_namespace():
+    pl = pytest.importorskip('polars')
+    from validbr.dataframe import register
+    register()
+
+    cpfs = pl.Series('cpf', ['111.444.777-35', '123', None])
+    assert cpfs.validbr.cpf.is_valid().to_list() == [True, False, None]
+    assert cpfs.validbr.cpf.apply_mask().to_list() == ['111.444.777-35', '123', None]
+    raw = pl.Series('cpf', [b'11144477735', None], dtype=pl.Binary)
+    assert raw.validbr.cpf.is_valid().to_list() == [True, None]
+    ddd = pl.Series('fone', ['(11) 98765-4321', None]).validbr.phone.get_ddd()
+    assert ddd.dtype == pl.Categorical and ddd.to_list() == ['11', None]
+
+    state, ie = IE_EXAMPLES[0]
+    df = pl.DataFrame({'ie': [ie, None], 'uf': [state, 'SP'], 'cpf': [None, '11144477735']})
+    assert df.validbr.ie.is_valid('ie', state).to_list() == [True, None]
+    report = df.validbr.validate({'cpf': 'cpf', 'ie': 'ie'}, state_column='uf')
+    assert report.columns == ['cpf', 'ie']
+    assert report['cpf'].to_list() == [None, True]
+    assert df.validbr.ie.is_valid('ie', 'uf').to_list() == [True, None]
+
+    register()  # idempotent
+    ages = pl.Series('nasc', ['1990-01-01', 'x', None]).validbr.birth_date.get_age()
+    assert ages.dtype == pl.Int64 and ages.to_list()[1:] == [None, None]
+    middle = pl.Series('nome', ['Ana Maria Silva', None]).validbr.name.get_middle_names()
+    assert middle.to_list() == [['Maria'], None]
+
+
+def test_dataframe_registration_is_explicit():
+    import subprocess
+    import sys
+    pytest.importorskip('polars')
+    code = (
+        "import polars as pl, validbr; assert not hasattr(pl.Series, 'validbr'); "
+        "import validbr.dataframe; assert not hasattr(pl.Series, 'validbr'); "
+        "validbr.dataframe.register(); assert hasattr(pl.Series, 'validbr')"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_document_int_codec():
+    assert validbr.cpf.to_int('111.444.777-35') == 111444777
+    assert validbr.cpf.from_int(111444777) == '111.444.777-35'
+    assert validbr.cpf.from_int(111444777, masked=False) == '11144477735'
+    assert validbr.cnpj.from_int(validbr.cnpj.to_int('11222333000181')) == '11.222.333/0001-81'
+    for bad in (-1, 10 ** 9, 111111111, '111444777'):
+        with pytest.raises(ValueError):
+            validbr.cpf.from_int(bad)
+    with pytest.raises(ValueError):
+        validbr.cpf.to_int('111.444.777-36')
+
+    np = pytest.importorskip('numpy')
+    from validbr._codec import INVALID_KEY
+    for v, n in ((validbr.cpf, 11), (validbr.cnpj, 14)):
+        docs = v.generate_many(300, seed=5, masked=False)
+        keys = v.to_int_many(docs + ['1' * n, 'x'])
+        assert keys.dtype == np.uint64 and keys[-2:].tolist() == [INVALID_KEY] * 2
+        assert v.from_int_many(keys).tolist() == [v.apply_mask(d) for d in docs] + ['', '']
+        assert v.from_int_many(keys[:3], masked=False).tolist() == docs[:3]
+
+
+def test_document_set():
+    np = pytest.importorskip('numpy')
+    from validbr.docset import DocumentSet, dedupe_mask
+
+    cpfs = validbr.cpf.generate_many(100, seed=9)
+    docs = DocumentSet(cpfs + ['111.444.777-35', '11144477735', 'invalid'])
+    assert len(docs) == 101 and docs.nbytes == 101 * 8
+    assert '11144477735' in docs and 111444777 in docs
+    assert 'invalid' not in docs and '529.982.247-25' not in docs
+    assert docs.contains_many(['111.444.777-35', '529.982.247-25', None]).tolist() == [True, False, False]
+    assert sorted(docs) == sorted(cpfs + ['111.444.777-35'])
+
+    other = DocumentSet(['52998224725', cpfs[0]])
+    assert (docs & other).to_list() == [cpfs[0]]
+    assert len(docs | other) == 102
+    assert list(other - docs) == ['529.982.247-25']
+    assert DocumentSet.from_keys(other.keys) == other
+    assert -1 not in docs and 2 ** 70 not in docs and 2 ** 64 - 1 not in docs
+    assert docs.contains_many(np.array([-1, 111444777], dtype=np.int64)).tolist() == [False, True]
+    assert docs.contains_many([2 ** 70, 111444777]).tolist() == [False, True]
+    assert len(DocumentSet.from_keys(np.array([-1, 111444777]))) == 1
+    with pytest.raises(ValueError):
+        docs & DocumentSet(kind='cnpj')
+
+    mask = dedupe_mask(['111.444.777-35', 'x', '11144477735', '52998224725'])
+    assert mask.tolist() == [True, False, False, True]
+
+
+def test_cpf_bitmap_index(tmp_path):
+    pytest.importorskip('numpy')
+    import pickle
+    from validbr.bitmap import CPFBitmapIndex
+
+    source = tmp_path / 'blocklist.txt'
+    source.write_text('111.444.777-35\n11144477735\ninvalid\n52998224725\n')
+    index = CPFBitmapIndex.build(str(tmp_path / 'blocklist.bits'), str(source))
+    assert len(index) == 2
+    assert '111.444.777-35' in index and index.contains('529.982.247-25')
+    assert '123.456.789-09' not in index and not index.contains(None)
+    mask = index.contains_many(['11144477735', '123.456.789-09', 'x', '529.982.247-25'])
+    assert mask.tolist() == [True, False, False, True]
+
+    with pickle.loads(pickle.dumps(index)) as copy:
+        assert copy.contains('11144477735') and len(copy) == 2
+    index.close()
+    with pytest.raises(ValueError):
+        CPFBitmapIndex.open(str(source))
+
+
+def test_apply_mask_many(tmp_path):
+    np = pytest.importorskip('numpy')
+    cases = {
+        'cpf': ['11144477735', '111.444.777-35', '123'],
+        'cnpj': ['11222333000181', 'x'],
+        'phone': ['11987654321', '(21) 3333-4444', '123'],
+        'cep': ['01310100', '1'],
+        'rg': ['123456789', '12.345.678', '12'],
+        'titulo_eleitor': ['679242067950', '12'],
+    }
+    for name, values in cases.items():
+        v = getattr(validbr, name)
+        masked = v.apply_mask_many(values)
+        assert masked.dtype.kind == 'S'
+        # Formattable rows match apply_mask exactly; the rest are left empty.
+        expected = [v.apply_mask(x) if len(v.remove_mask(x)) > 3 else '' for x in values]
+        assert masked.astype(str).tolist() == expected
+
+        clean = [v.remove_mask(x) for x in values]
+        assert v.apply_mask_many(clean, clean=True).tolist() == masked.tolist()
+        buffer = bytearray(len(values) * masked.dtype.itemsize)
+        assert v.apply_mask_many(values, out=buffer) is buffer
+        assert bytes(buffer) == masked.tobytes()
+        out = np.empty(len(values), dtype='S32')
+        v.apply_mask_many(np.array(values, dtype='S'), out=out)
+        assert out.tolist() == masked.tolist()
+
+        path = tmp_path / f'{name}.txt'
+        assert v.apply_mask_many(values, output=str(path)) == len(values)
+        assert path.read_text().split('\n')[:-1] == expected
+
+    # With ``clean``, rows containing a non-digit stay empty.
+    assert validbr.cpf.apply_mask_many(['1114447773a', '11144477735'], clean=True).tolist() == [
+        b'', b'111.444.777-35',
+    ]
+    with pytest.raises(ValueError):
+        validbr.cpf.apply_mask_many(['11144477735'], out=bytearray(10))
+    assert validbr.titulo_eleitor.apply_mask('6792.4206.7950') == '6792 4206 7950'
+
+
+def test_fixed_width_layout(tmp_path):
+    pytest.importorskip('numpy')
+    from validbr.fixed_width import FixedWidthLayout
+
+    layout = FixedWidthLayout(record_length=57, header=4, fields={
+        'cpf': ('cpf', 0, 14),
+        'cnpj': ('cnpj', 14, 18),
+        'cep': ('cep', 32, 9),
+        'fone': ('phone', 41, 15),
+    })
+    rows = [
+        ('111.444.777-35', '11.222.333/0001-81', '01310-100', '(11) 98765-4321'),
+        ('11144477735   ', '    11222333000181', '01310100 ', '2133334444     '),
+        ('111.444.777-36', '11.222.333/0001-81', '01310-100', '(11) 98765-4321'),
+        ('11144477735   ', '11.222.333/0001-82', '0131010  ', '(10) 98765-4321'),
+    ]
+    data = b'HDR\n' + b''.join(''.join(r).encode('ascii') + b'\n' for r in rows[:3])
+    data += ''.join(rows[3]).encode('ascii')  # no final newline
+
+    assert layout.validate(memoryview(data)).tolist() == [True, True, False, False]
+    by_field = layout.validate(data, by_field=True)
+    assert by_field['cpf'].tolist() == [True, True, False, True]
+    assert by_field['cnpj'].tolist() == [True, True, True, False]
+    assert by_field['cep'].tolist() == [True, True, True, False]
+    assert by_field['fone'].tolist() == [True, True, True, False]
+    assert layout.invalid_records(data).tolist() == [2, 3]
+    assert layout.validate_bitmap(data) == bytes([0b0011])
+
+    path = tmp_path / 'remessa.txt'
+    path.write_bytes(data)
+    assert layout.invalid_records_file(str(path)).tolist() == [2, 3]
+    path.write_bytes(data[:-20])
+    with pytest.raises(ValueError):
+        layout.validate_file(str(path))
+    with pytest.raises(ValueError):
+        layout.validate(data[:-20])
+    with pytest.raises(ValueError):
+        FixedWidthLayout(10, {'cpf': ('cpf', 0, 14)})
+    assert len(layout.validate(b'HDR\n')) == 0
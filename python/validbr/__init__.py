@@ -1,31 +1,172 @@
-from .validators.cpf import CPFValidator
-from .validators.cnpj import CNPJValidator
-from .validators.phone import PhoneValidator
-from .validators.email import EmailValidator
-from .validators.name import NameValidator
-from .validators.birth_date import BirthDateValidator
-from .validators.cep import CEPValidator
-from .validators.rg import RGValidator
-from .validators.ie import IEValidator
-from .validators.cnh import CNHValidator
-from .validators.titulo_eleitor import TituloEleitorValidator
+from importlib import import_module
+
+from ._normalize import only_digits
+
+# Validator attribute name -> (module, class). Modules are only imported the
+# first time the corresponding attribute is used, which keeps
+# ``import validbr`` cheap for callers that only need one or two validators.
+VALIDATORS = {
+    'cpf': ('.validators.cpf', 'CPFValidator'),
+    'cnpj': ('.validators.cnpj', 'CNPJValidator'),
+    'phone': ('.validators.phone', 'PhoneValidator'),
+    'email': ('.validators.email', 'EmailValidator'),
+    'name': ('.validators.name', 'NameValidator'),
+    'birth_date': ('.validators.birth_date', 'BirthDateValidator'),
+    'cep': ('.validators.cep', 'CEPValidator'),
+    'rg': ('.validators.rg', 'RGValidator'),
+    'ie': ('.validators.ie', 'IEValidator'),
+    'cnh': ('.validators.cnh', 'CNHValidator'),
+    'titulo_eleitor': ('.validators.titulo_eleitor', 'TituloEleitorValidator'),
+}
+
+
+def _load_validator_class(name: str):
+    module, class_name = VALIDATORS[name]
+    return getattr(import_module(module, __name__), class_name)
+
+
+class _LazyValidator:
+    """Builds a validator on first access and caches it on the instance."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        validator = _load_validator_class(self.name)()
+        instance.__dict__[self.name] = validator
+        if instance.__dict__.get('_metrics_installed'):
+            instance._install_metrics((self.name,))
+        return validator
 
 
 class ValidBR:
     """Main ValidBR class with all validators."""
-    
-    def __init__(self):
-        self.cpf = CPFValidator()
-        self.cnpj = CNPJValidator()
-        self.phone = PhoneValidator()
-        self.email = EmailValidator()
-        self.name = NameValidator()
-        self.birth_date = BirthDateValidator()
-        self.cep = CEPValidator()
-        self.rg = RGValidator()
-        self.ie = IEValidator()
-        self.cnh = CNHValidator()
-        self.titulo_eleitor = TituloEleitorValidator()
+
+    cpf = _LazyValidator()
+    cnpj = _LazyValidator()
+    phone = _LazyValidator()
+    email = _LazyValidator()
+    name = _LazyValidator()
+    birth_date = _LazyValidator()
+    cep = _LazyValidator()
+    rg = _LazyValidator()
+    ie = _LazyValidator()
+    cnh = _LazyValidator()
+    titulo_eleitor = _LazyValidator()
+
+    # Validators whose ``is_valid`` only depends on the input, so results can
+    # be cached. ``birth_date`` is excluded: its answer changes with the date.
+    CACHEABLE = ('cpf', 'cnpj', 'phone', 'email', 'name', 'cep', 'rg', 'ie', 'cnh', 'titulo_eleitor')
+
+    def enable_cache(self, maxsize: int = 10000, validators=CACHEABLE) -> None:
+        """Memoize ``is_valid`` of the given validators in bounded LRU caches.
+
+        Each validator gets its own thread-safe cache of ``maxsize`` entries,
+        keyed on the normalized input. See ``cache_stats`` for hit/miss counts.
+        """
+        from .cache import LRUCache, cached_is_valid
+        self.disable_cache()
+        self._uninstall_metrics()
+        for name in validators:
+            if name not in self.CACHEABLE:
+                raise ValueError(f'Validator cannot be cached: {name}')
+            cache = LRUCache(maxsize=maxsize)
+            validator = getattr(self, name)
+            validator.is_valid = cached_is_valid(validator, cache)
+            self._caches[name] = cache
+        self._install_metrics()
+
+    def disable_cache(self) -> None:
+        """Remove the caches installed by ``enable_cache``."""
+        self._uninstall_metrics()
+        for name in self.__dict__.pop('_caches', {}):
+            del getattr(self, name).is_valid
+        self._caches = {}
+        self._install_metrics()
+
+    def cache_stats(self) -> dict:
+        """Hits, misses, evictions and size of each enabled cache."""
+        return {name: cache.stats() for name, cache in self.__dict__.get('_caches', {}).items()}
+
+    # The ``Metrics`` collector while ``enable_metrics`` is active.
+    metrics = None
+
+    def enable_metrics(self, validators=None, methods=None, buckets=None):
+        """Count calls, outcomes, failure reasons and latency of validator methods.
+
+        Wraps ``methods`` (default ``metrics.DEFAULT_METHODS``) of the given
+        validators (default: all) on this instance and returns the
+        ``Metrics`` collector, also available as ``self.metrics``. Export it
+        with ``as_dict()`` or ``to_prometheus()``. Nothing is wrapped until
+        this is called, so disabled metrics cost nothing. Validators not used
+        yet are wrapped on first access, so this imports none of them.
+        Failure reasons are only counted for validators that report them
+        (``failure_reasons``: CPF and CNPJ); the others count outcomes only.
+        """
+        from .metrics import DEFAULT_BUCKETS, DEFAULT_METHODS, Metrics
+        self.disable_metrics()
+        for name in validators or ():
+            if name not in VALIDATORS:
+                raise ValueError(f'Unknown validator: {name}')
+        self.metrics = Metrics(buckets or DEFAULT_BUCKETS)
+        self._metered = (tuple(validators or VALIDATORS), tuple(methods or DEFAULT_METHODS))
+        self._install_metrics()
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        """Remove the wrappers installed by ``enable_metrics``."""
+        self._uninstall_metrics()
+        self.__dict__.pop('metrics', None)
+        self.__dict__.pop('_metered', None)
+        self.__dict__.pop('_metrics_installed', None)
+
+    def _install_metrics(self, names=None) -> None:
+        if self.metrics is not None:
+            from .metrics import install
+            validators, methods = self._metered
+            # Only validators already built; ``_LazyValidator`` does the rest.
+            loaded = [n for n in names or validators if n in validators and n in self.__dict__]
+            install(self, self.metrics, loaded, methods)
+            self._metrics_installed = True
+
+    def _uninstall_metrics(self) -> None:
+        if self.metrics is not None:
+            from .metrics import uninstall
+            uninstall(self, *self._metered)
+            self._metrics_installed = False
+
+    def validate_record(self, schema: dict, record: dict) -> dict:
+        """Validate a whole record, normalizing each field only once.
+
+        ``schema`` maps record keys to validator names (plus ``'uf'`` for the
+        state used by ``rg``/``ie``). Returns ``{'valid', 'errors', 'fields'}``
+        where each field has its normalized ``value``, ``valid`` and derived
+        data such as ``age``, ``ddd``/``state``, CPF ``region`` or ``initials``.
+        """
+        from .record import validate_record
+        return validate_record(self, schema, record)
+
+    def validate_records(self, schema: dict, records):
+        """Batch form of ``validate_record``: lazily yields one result per record."""
+        from .record import validate_records
+        return validate_records(self, schema, records)
+
+    def classify(self, value) -> list:
+        """Return the document types ``value`` is valid as, best match first.
+
+        The mask is stripped once and the digit count selects the candidates
+        (11 digits: CPF, CNH or phone; 12: título; 14: CNPJ; 10: phone;
+        8-9: RG), e.g. ``['cpf', 'phone']``. Empty if nothing matches.
+        """
+        from .classify import classify
+        return classify(self, value)
+
+    def classify_many(self, values) -> dict:
+        """Batch form of ``classify``: one NumPy boolean mask per document type."""
+        from .classify import classify_many
+        return classify_many(self, values)
 
     @staticmethod
     def sanitize(input_str: str) -> str:
@@ -37,9 +178,7 @@ class ValidBR:
     @staticmethod
     def remove_non_numeric(input_str: str) -> str:
         """Remove all non-numeric characters from string."""
-        if not input_str or not isinstance(input_str, str):
-            return ""
-        return "".join(filter(str.isdigit, input_str))
+        return only_digits(input_str)
 
     @staticmethod
     def remove_non_alphabetic(input_str: str) -> str:
@@ -50,8 +189,16 @@ class ValidBR:
         return re.sub(r'[^a-zA-ZÀ-ÿ\s]', '', input_str)
 
 
+def __getattr__(name):
+    # Keep ``from validbr import CPFValidator`` working without eager imports.
+    for attr, (_, class_name) in VALIDATORS.items():
+        if class_name == name:
+            return _load_validator_class(attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Create a singleton instance
 validbr = ValidBR()
 
 # Export the main class and instance
-__all__ = ['ValidBR', 'validbr'] 
\ No newline at end of file
+__all__ = ['ValidBR', 'validbr']
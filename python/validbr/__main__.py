@@ -0,0 +1,119 @@
+"""Command line interface: ``python -m validbr``.
+
+Example::
+
+    python -m validbr customers.csv -o checked.csv \
+        --check documento=cpf --check telefone=phone --check ie=ie --state-column uf
+"""
+import argparse
+import contextlib
+import json
+import sys
+from typing import List, Optional
+
+from .stream import (
+    DEFAULT_CHUNK_SIZE, VALIDATOR_NAMES, ValidationSummary, read_csv, read_jsonl,
+    validate_stream, write_csv, write_jsonl,
+)
+
+
+def _parse_check(value: str):
+    column, sep, name = value.rpartition('=')
+    if not sep or not column:
+        raise argparse.ArgumentTypeError(f'expected COLUMN=VALIDATOR, got {value!r}')
+    if name not in VALIDATOR_NAMES:
+        raise argparse.ArgumentTypeError(
+            f'unknown validator {name!r} (choose from {", ".join(VALIDATOR_NAMES)})'
+        )
+    return column, name
+
+
+def _chunk_size(value: str) -> int:
+    size = int(value)
+    if size < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {size}')
+    return size
+
+
+def _detect_format(path: str, default: str = 'csv') -> str:
+    lower = path.lower()
+    if lower.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if lower.endswith(('.csv', '.tsv', '.txt')):
+        return 'csv'
+    return default
+
+
+def _open(stack: contextlib.ExitStack, path: str, mode: str):
+    if path == '-':
+        return sys.stdin if 'r' in mode else sys.stdout
+    return stack.enter_context(open(path, mode, encoding='utf-8', newline=''))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='validbr',
+        description='Validate Brazilian document columns in a CSV or JSONL file.',
+    )
+    parser.add_argument('input', help="input file, or '-' for stdin")
+    parser.add_argument('-o', '--output', default='-', help="output file (default: stdout)")
+    parser.add_argument(
+        '-c', '--check', action='append', type=_parse_check, required=True,
+        metavar='COLUMN=VALIDATOR',
+        help='column to validate and the validator to use; may be repeated',
+    )
+    parser.add_argument('--state-column', help='column holding the UF, used by ie and rg')
+    parser.add_argument('--input-format', choices=('csv', 'jsonl'), help='default: from the file extension')
+    parser.add_argument('--output-format', choices=('csv', 'jsonl'), help='default: same as the input')
+    parser.add_argument('--delimiter', default=',', help='CSV delimiter (default: ,)')
+    parser.add_argument('--chunk-size', type=_chunk_size, default=DEFAULT_CHUNK_SIZE, help='rows validated per batch')
+    parser.add_argument('--summary', help="write the JSON summary to this file instead of stderr")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    columns = {}
+    for column, name in args.check:
+        if column in columns:
+            # Both checks would write the same ``<column>_valid`` field.
+            parser.error(f'column {column!r} is checked more than once')
+        columns[column] = name
+    input_format = args.input_format or _detect_format(args.input)
+    output_format = args.output_format or (
+        _detect_format(args.output, input_format) if args.output != '-' else input_format
+    )
+
+    summary = ValidationSummary()
+    with contextlib.ExitStack() as stack:
+        source = _open(stack, args.input, 'r')
+        target = _open(stack, args.output, 'w')
+        if input_format == 'jsonl':
+            rows = read_jsonl(source)
+        else:
+            rows = read_csv(source, delimiter=args.delimiter)
+        try:
+            annotated = validate_stream(
+                rows, columns, state_column=args.state_column,
+                chunk_size=args.chunk_size, summary=summary,
+            )
+            if output_format == 'jsonl':
+                write_jsonl(annotated, target)
+            else:
+                write_csv(annotated, target, delimiter=args.delimiter)
+        except ValueError as exc:
+            print(f'validbr: error: {exc}', file=sys.stderr)
+            return 2
+
+    report = json.dumps(summary.as_dict(), indent=2, ensure_ascii=False)
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as fh:
+            fh.write(report + '\n')
+    else:
+        print(report, file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Helpers shared by the NumPy-backed batch validators.
+
+NumPy is an optional dependency: it is only imported when a ``*_many``
+method is actually called, so ``import validbr`` keeps working without it.
+"""
+
+
+def require_numpy():
+    """Import and return NumPy, raising a helpful error if it is missing."""
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "Batch validation requires NumPy. Install it with "
+            "'pip install validbr[numpy]'."
+        ) from exc
+    return numpy
+
+
+def as_text_array(values):
+    """Coerce ``values`` to a NumPy ``U`` or ``S`` array.
+
+    NumPy string/bytes arrays are used as-is. Any other iterable is
+    materialized, and items that are not ``str`` become ``''`` so that they
+    fail validation exactly like the scalar ``is_valid`` methods.
+    """
+    np = require_numpy()
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'US':
+        return np.ascontiguousarray(values.ravel())
+    if isinstance(values, np.ndarray):
+        values = values.ravel().tolist()
+    items = [v if isinstance(v, str) else '' for v in values]
+    return np.array(items, dtype=str) if items else np.array([], dtype='U1')
+
+
+def char_codes(arr):
+    """View a ``U``/``S`` array as a 2-D matrix of character codes."""
+    np = require_numpy()
+    if arr.dtype.kind == 'U':
+        width = arr.dtype.itemsize // 4
+        return arr.view(np.uint32).reshape(len(arr), width)
+    return arr.view(np.uint8).reshape(len(arr), arr.dtype.itemsize)
+
+
+def scan_digits(arr):
+    """Locate the ASCII digits of every row of ``arr`` in one pass.
+
+    Returns ``(codes, is_digit, counts)`` for ``take_digits``, so callers
+    that need several widths (e.g. the document classifier) scan only once.
+    """
+    codes = char_codes(arr)
+    is_digit = (codes >= 48) & (codes <= 57)
+    return codes, is_digit, is_digit.sum(axis=1)
+
+
+def take_digits(scan, width):
+    """Digit matrix of the scanned rows with exactly ``width`` digits; see ``extract_digits``."""
+    np = require_numpy()
+    codes, is_digit, counts = scan
+    rows = counts == width
+    digits = (codes[rows][is_digit[rows]] - 48).astype(np.uint8)
+    return digits.reshape(-1, width), rows
+
+
+def extract_digits(arr, width):
+    """Strip the mask from every row of ``arr`` in one vectorized pass.
+
+    Returns ``(digits, rows)``: ``rows`` is a boolean mask of the rows with
+    exactly ``width`` ASCII digits and ``digits`` their ``uint8`` digit
+    matrix of shape ``(rows.sum(), width)``. Like ``only_digits``, anything
+    but ASCII ``0-9`` is treated as mask.
+    """
+    return take_digits(scan_digits(arr), width)
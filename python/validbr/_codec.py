@@ -0,0 +1,122 @@
+"""Integer keys for documents whose last two digits are mod-11 check digits.
+
+A CPF or CNPJ is fully determined by its base digits (9 and 12 of them),
+so the base read as a decimal number is a lossless key: it fits a
+``uint64`` (8 bytes, against ~60 for a masked ``str``) and decoding
+recomputes the check digits. Batch forms use ``INVALID_KEY`` for rows
+that are not valid documents.
+"""
+from typing import Optional, Sequence
+
+from ._batch import as_text_array, extract_digits, require_numpy
+from ._generate import format_digits, to_digits
+
+# Marks invalid rows in ``uint64`` key arrays; sorts after every real key.
+INVALID_KEY = 2 ** 64 - 1
+
+# Failure reason codes returned by ``get_failure_reason`` and its batch form.
+VALID = 0
+INVALID_LENGTH = 1
+REPEATED_DIGITS = 2
+INVALID_FIRST_DIGIT = 3
+INVALID_SECOND_DIGIT = 4
+
+FAILURE_REASONS = {
+    VALID: 'valid',
+    INVALID_LENGTH: 'length',
+    REPEATED_DIGITS: 'repeated_digits',
+    INVALID_FIRST_DIGIT: 'dv1',
+    INVALID_SECOND_DIGIT: 'dv2',
+}
+
+
+def check_digits(base: str, first_weights: Sequence[int], second_weights: Sequence[int]) -> str:
+    """Append the two mod-11 check digits to ``base``."""
+    for weights in (first_weights, second_weights):
+        remainder = sum(int(d) * w for d, w in zip(base, weights)) % 11
+        base += str(0 if remainder < 2 else 11 - remainder)
+    return base
+
+
+def decode(key, base_width: int, first_weights, second_weights) -> str:
+    """Digits of the document with integer ``key``; ``ValueError`` if none."""
+    if isinstance(key, bool) or not isinstance(key, int) or not 0 <= key < 10 ** base_width:
+        raise ValueError(f'Invalid document key: {key!r}')
+    digits = check_digits(str(key).zfill(base_width), first_weights, second_weights)
+    if len(set(digits)) == 1:
+        raise ValueError(f'Invalid document key: {key!r}')
+    return digits
+
+
+def as_keys(np, keys):
+    """Coerce integer keys to ``uint64``, mapping out-of-range ones to ``INVALID_KEY``.
+
+    Accepts an integer array or any iterable of ints; negative values and
+    Python ints beyond ``uint64`` never wrap into a real key.
+    """
+    if isinstance(keys, np.ndarray) and keys.dtype.kind in 'iu':
+        keys = keys.ravel()
+        if keys.dtype.kind == 'i':
+            return np.where(keys < 0, np.uint64(INVALID_KEY), keys.astype(np.uint64))
+        return keys.astype(np.uint64)
+    return np.array(
+        [k if 0 <= k < INVALID_KEY else INVALID_KEY for k in keys], dtype=np.uint64,
+    )
+
+
+def failure_reasons_many(values, width: int, weights):
+    """``uint8`` failure reason code of every document in ``values``.
+
+    ``weights`` is the ``(width, 2)`` matrix computing both check digits.
+    """
+    np = require_numpy()
+    arr = as_text_array(values)
+    digits, rows = extract_digits(arr, width)
+
+    sums = digits.astype(np.int32) @ np.array(weights, dtype=np.int32)
+    remainder = sums % 11
+    expected = np.where(remainder < 2, 0, 11 - remainder)
+    reasons = np.select(
+        [
+            (digits == digits[:, :1]).all(axis=1),
+            expected[:, 0] != digits[:, width - 2],
+            expected[:, 1] != digits[:, width - 1],
+        ],
+        [REPEATED_DIGITS, INVALID_FIRST_DIGIT, INVALID_SECOND_DIGIT],
+        VALID,
+    )
+
+    result = np.full(len(arr), INVALID_LENGTH, dtype=np.uint8)
+    result[rows] = reasons
+    return result
+
+
+def encode_many(values, width: int, base_width: int, complete):
+    """``uint64`` keys of many documents, ``INVALID_KEY`` where invalid."""
+    np = require_numpy()
+    arr = as_text_array(values)
+    digits, rows = extract_digits(arr, width)
+    full, ok = complete(digits[:, :base_width])
+    ok &= (full == digits).all(axis=1)
+    powers = 10 ** np.arange(base_width - 1, -1, -1, dtype=np.uint64)
+    keys = np.full(len(arr), INVALID_KEY, dtype=np.uint64)
+    keys[np.flatnonzero(rows)[ok]] = digits[ok, :base_width].astype(np.uint64) @ powers
+    return keys
+
+
+def decode_many(keys, base_width: int, complete, template: Optional[str] = None):
+    """Documents for many keys as a NumPy ``U`` array; ``''`` for invalid keys.
+
+    With ``template`` (e.g. ``'###.###.###-##'``) the output is masked.
+    """
+    np = require_numpy()
+    keys = np.asarray(keys)
+    if keys.dtype.kind not in 'iu':
+        raise TypeError('Document keys must be an integer array')
+    keys = keys.ravel()
+    in_range = (keys >= 0) & (keys < 10 ** base_width) if keys.dtype.kind == 'i' else keys < 10 ** base_width
+    digits, ok = complete(to_digits(np, np.where(in_range, keys, 0).astype(np.uint64), base_width))
+    text = np.ascontiguousarray(format_digits(np, digits, template))
+    out = text.view(f'S{text.shape[1]}').ravel().astype(str)
+    out[~(ok & in_range)] = ''
+    return out
@@ -0,0 +1,173 @@
+"""Block-wise, seeded generation of synthetic documents (NumPy backed).
+
+Each document type supplies a function that turns a ``uint8`` matrix of
+random base digits into the full digit matrix plus a mask of usable rows.
+This module draws the base digits, formats whole blocks as fixed-width
+bytes and either collects them or streams them to a file.
+"""
+import zlib
+from typing import Callable, Dict, List, Optional, Union
+
+from ._batch import require_numpy
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+
+# splitmix64 finalizer constants, used as the Feistel round function.
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+_ROUNDS = 6
+# Below this many values the permutation is simply drawn and stored.
+_TABLE_SIZE = 1 << 16
+
+
+class _FeistelPermutation:
+    """Seeded, keyed bijection over ``range(m)``.
+
+    ``m`` is split as ``a * b`` and each round maps ``x = l * b + r`` to
+    ``a * r + (l + F(r)) % a``, ``F`` being a keyed hash; every round is
+    invertible whatever ``F`` is, so no cycle-walking is needed. Walking
+    ``i = 0, 1, 2...`` yields distinct values in no visible order, without
+    keeping a set of the ones already produced: uniqueness costs no memory.
+    """
+
+    def __init__(self, rng, m: int):
+        self.m = m
+        self.next = 0
+        self.table = rng.permutation(m).astype('uint64') if m <= _TABLE_SIZE else None
+        self.a = int(m ** 0.5)
+        while m % self.a:
+            self.a -= 1
+        self.b = m // self.a
+        self.keys = [int(k) for k in rng.integers(0, 2 ** 63, size=_ROUNDS)]
+
+    def _permute(self, np, x):
+        a, b = np.uint64(self.a), np.uint64(self.b)
+        for key in self.keys:
+            left, right = x // b, x % b
+            z = (right + np.uint64(key)) * np.uint64(_MIX1)
+            z = (z ^ (z >> np.uint64(31))) * np.uint64(_MIX2)
+            z ^= z >> np.uint64(29)
+            x = a * right + (left + z % a) % a
+        return x
+
+    def take(self, np, count: int):
+        if self.next + count > self.m:
+            raise ValueError('Not enough distinct documents for the requested amount')
+        index = np.arange(self.next, self.next + count, dtype=np.uint64)
+        self.next += count
+        if self.table is not None:
+            return self.table[index.astype(np.intp)]
+        return self._permute(np, index)
+
+
+def to_digits(np, values, width: int):
+    """``(n, width)`` ``uint8`` digit matrix of non-negative ``uint64`` values."""
+    digits = np.empty((len(values), width), dtype=np.uint8)
+    for col in range(width - 1, -1, -1):
+        digits[:, col] = values % np.uint64(10)
+        values = values // np.uint64(10)
+    return digits
+
+
+def format_digits(np, digits, template: Optional[str] = None):
+    """Render a digit matrix as an ``(n, width)`` ``uint8`` matrix of ASCII.
+
+    ``template`` uses ``#`` for digit slots, e.g. ``'###.###.###-##'``;
+    without one the digits are written back to back.
+    """
+    if template is None:
+        return digits + np.uint8(48)
+    out = np.empty((len(digits), len(template)), dtype=np.uint8)
+    slots = [i for i, ch in enumerate(template) if ch == '#']
+    out[:, slots] = digits + np.uint8(48)
+    for i, ch in enumerate(template):
+        if ch != '#':
+            out[:, i] = ord(ch)
+    return out
+
+
+def _rng(np, seed, complete: Callable):
+    if isinstance(seed, (np.random.Generator, np.random.BitGenerator, np.random.SeedSequence)):
+        return np.random.default_rng(seed)
+    # Salt the seed with the document type, so e.g. CPFs and CNHs drawn
+    # with the same seed do not share their base digits.
+    salt = zlib.crc32(f'{complete.__module__}.{complete.__qualname__}'.encode())
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(salt,)))
+
+
+def generate_many(
+    n: int,
+    base_width: int,
+    complete: Callable,
+    seed=None,
+    template: Optional[str] = None,
+    unique: bool = False,
+    fixed: Optional[Dict[int, int]] = None,
+    output: Union[str, object, None] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Union[List[str], int]:
+    """Generate ``n`` documents; see the validators' ``generate_many``.
+
+    ``complete(base)`` receives a ``(k, base_width)`` digit matrix and
+    returns ``(digits, ok)``. ``fixed`` pins base digit positions (e.g. the
+    CPF fiscal region) to given values. With ``output`` (a path or binary
+    file) documents are written one per line and the count is returned.
+    """
+    np = require_numpy()
+    if n < 0:
+        raise ValueError('n must not be negative')
+    rng = _rng(np, seed, complete)
+    fixed = dict(sorted((fixed or {}).items()))
+    free_width = base_width - len(fixed)
+    permutation = _FeistelPermutation(rng, 10 ** free_width) if unique else None
+
+    close = False
+    if isinstance(output, str):
+        output = open(output, 'wb')
+        close = True
+    collected = []
+    produced = 0
+    try:
+        while produced < n:
+            # Ask for a little more than needed: a few rows get rejected.
+            count = min(block_size, n - produced)
+            count += count // 8 + 8
+            if permutation is not None:
+                count = min(count, permutation.m - permutation.next)
+                if count == 0:
+                    raise ValueError('Not enough distinct documents for the requested amount')
+                base = to_digits(np, permutation.take(np, count), free_width)
+            else:
+                base = rng.integers(0, 10, size=(count, free_width), dtype=np.uint8)
+            for position, digit in fixed.items():
+                base = np.insert(base, position, digit, axis=1)
+
+            digits, ok = complete(base)
+            digits = digits[ok][:n - produced]
+            produced += len(digits)
+            text = format_digits(np, digits, template)
+            if output is not None:
+                lines = np.empty((len(text), text.shape[1] + 1), dtype=np.uint8)
+                lines[:, :-1] = text
+                lines[:, -1] = ord('\n')
+                output.write(lines.tobytes())
+            else:
+                collected.extend(
+                    np.ascontiguousarray(text).view(f'S{text.shape[1]}').ravel().astype(str).tolist()
+                )
+    finally:
+        if close:
+            output.close()
+    return produced if output is not None else collected
+
+
+def not_repeated(np, digits):
+    """Mask of rows whose digits are not all the same (e.g. ``111.111.111-11``)."""
+    return (digits != digits[:, :1]).any(axis=1)
+
+
+def mod11_check(np, digits, weights):
+    """Vectorized ``0 if r < 2 else 11 - r`` check digit used by CPF and CNPJ."""
+    remainder = (digits.astype(np.int32) @ np.array(weights, dtype=np.int32)) % 11
+    return np.where(remainder < 2, 0, 11 - remainder).astype(np.uint8)
@@ -0,0 +1,84 @@
+"""Batch mask formatting into fixed-width byte records (NumPy backed).
+
+Each validator describes its masks as ``{digit count: template}`` (``#``
+marks a digit). Whole blocks are formatted with ``format_digits`` straight
+into the destination: a new ``S`` array, a caller's ``S`` array or
+writable buffer, or a file, one document per line.
+"""
+from typing import Dict
+
+from ._batch import as_text_array, char_codes, require_numpy, scan_digits, take_digits
+from ._generate import DEFAULT_BLOCK_SIZE, format_digits
+
+
+def _fill(np, arr, templates: Dict[int, str], clean: bool, matrix) -> None:
+    matrix[:] = 0
+    if clean:
+        # Digits only, no mask to strip: the digit count is the string length.
+        codes = char_codes(arr)
+        lengths = (codes != 0).sum(axis=1)
+    else:
+        scan = scan_digits(arr)
+    for count, template in templates.items():
+        if clean:
+            rows = lengths == count
+            if not rows.any():
+                continue
+            block = codes[rows, :count]
+            # A stray non-digit makes the row unformattable, as without ``clean``.
+            is_digits = ((block >= 48) & (block <= 57)).all(axis=1)
+            rows[rows] = is_digits
+            digits = (block[is_digits] - 48).astype(np.uint8)
+        else:
+            digits, rows = take_digits(scan, count)
+            if not rows.any():
+                continue
+        matrix[rows, :len(template)] = format_digits(np, digits, template)
+
+
+def _target(np, out, n: int, width: int):
+    """``(n, record width)`` ``uint8`` view of a preallocated ``out``."""
+    if isinstance(out, np.ndarray):
+        if out.dtype.kind != 'S' or out.shape != (n,) or not out.flags.c_contiguous:
+            raise ValueError(f'out must be a contiguous S array of length {n}')
+        if out.dtype.itemsize < width:
+            raise ValueError(f'out items must hold at least {width} bytes')
+        return out.view(np.uint8).reshape(n, out.dtype.itemsize)
+    buffer = np.frombuffer(out, dtype=np.uint8)
+    if len(buffer) < n * width:
+        raise ValueError(f'out must hold at least {n * width} bytes')
+    if not buffer.flags.writeable:
+        raise ValueError('out must be writable')
+    return buffer[:n * width].reshape(n, width)
+
+
+def mask_many(values, templates: Dict[int, str], clean: bool = False, out=None,
+              output=None, block_size: int = DEFAULT_BLOCK_SIZE):
+    """Format many documents; see the validators' ``apply_mask_many``."""
+    np = require_numpy()
+    arr = as_text_array(values)
+    width = max(len(t) for t in templates.values())
+
+    if output is not None:
+        close = False
+        if isinstance(output, str):
+            output = open(output, 'wb')
+            close = True
+        try:
+            lines = np.empty((min(block_size, len(arr)), width + 1), dtype=np.uint8)
+            for start in range(0, len(arr), block_size):
+                block = arr[start:start + block_size]
+                chunk = lines[:len(block)]
+                _fill(np, block, templates, clean, chunk[:, :width])
+                chunk[:, width] = ord('\n')
+                # Short masks and unformattable rows are NUL padded; drop it.
+                output.write(chunk[chunk != 0].tobytes())
+        finally:
+            if close:
+                output.close()
+        return len(arr)
+
+    if out is None:
+        out = np.zeros(len(arr), dtype=f'S{width}')
+    _fill(np, arr, templates, clean, _target(np, out, len(arr), width))
+    return out
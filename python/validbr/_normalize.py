@@ -0,0 +1,26 @@
+"""Mask stripping shared by every validator.
+
+Only ASCII ``0-9`` count as digits: other Unicode decimal digits (which
+``re``'s ``\\d`` and ``str.isdigit`` accept) are dropped like any other
+mask character.
+"""
+
+# Every byte value except ASCII 0-9, for ``bytes.translate(None, delete=...)``.
+NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+
+def only_digits(value) -> str:
+    """Return the ASCII digits of ``value``, or ``''`` if it is not a string."""
+    if not value or not isinstance(value, str):
+        return ''
+    if value.isascii() and value.isdigit():
+        # Already clean: no copy at all.
+        return value
+    return value.encode('ascii', 'ignore').translate(None, NON_DIGIT_BYTES).decode('ascii')
+
+
+def only_digits_bytes(value: bytes) -> bytes:
+    """Bytes counterpart of ``only_digits`` for ASCII buffers."""
+    if value.isdigit():
+        return value
+    return value.translate(None, NON_DIGIT_BYTES)
@@ -0,0 +1,156 @@
+"""asyncio facade: validate from an event loop without blocking it.
+
+``AsyncValidBR`` exposes the same validators as ``ValidBR`` with every
+method turned into a coroutine::
+
+    from validbr.aio import AsyncValidBR
+
+    avalid = AsyncValidBR(max_pending=64)
+    ok = await avalid.cpf.is_valid('123.456.789-09')
+    mask = await avalid.cpf.is_valid_many(cpfs)     # runs in the executor
+    info = await avalid.cep.get_info('01310-100')   # HTTP in the executor
+
+Cheap scalar checks run inline: handing a few microseconds of work to a
+thread would cost more than it saves. Batch methods (``*_many``,
+``validate_records``) and the blocking ViaCEP lookup go to the executor.
+At most ``max_pending`` such jobs are queued or running at once; further
+callers wait for a slot, so a burst of requests slows down instead of
+piling up unbounded work. Concurrent ``get_info`` calls for the same CEP
+share a single lookup.
+"""
+import asyncio
+import functools
+import inspect
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Optional
+
+from . import VALIDATORS, ValidBR
+
+DEFAULT_MAX_PENDING = 100
+
+# Methods that always go to the executor, besides every ``*_many`` method.
+BLOCKING_METHODS = frozenset(['cep.get_info'])
+
+
+def _is_offloaded(method: str) -> bool:
+    return method.endswith('_many') or method in BLOCKING_METHODS
+
+
+class _AsyncValidator:
+    """Coroutine versions of one validator's methods."""
+
+    def __init__(self, owner: 'AsyncValidBR', name: str, validator):
+        self._owner = owner
+        self._name = name
+        self._validator = validator
+
+    def __getattr__(self, attr):
+        value = getattr(self._validator, attr)
+        if attr.startswith('_') or not callable(value):
+            return value
+        if inspect.iscoroutinefunction(value):
+            return value
+        # Looked up on every access: ``enable_cache`` may swap ``is_valid``.
+        method = f'{self._name}.{attr}'
+        if method == 'cep.get_info':
+            return self._owner._coalesced_get_info
+        if _is_offloaded(method):
+            return functools.partial(self._owner._offload, method, value)
+        return functools.partial(self._owner._inline, value)
+
+
+class AsyncValidBR:
+    """Async counterpart of ``ValidBR``; see the module docstring.
+
+    ``validbr`` is the ``ValidBR`` instance doing the work (a new one by
+    default). ``executor`` is any ``concurrent.futures.Executor``; ``None``
+    uses the loop's default thread pool. With a ``ProcessPoolExecutor``
+    each worker process uses its own ``ValidBR``, so settings such as
+    ``enable_cache`` on ``validbr`` do not apply there.
+    """
+
+    def __init__(self, validbr: Optional[ValidBR] = None, executor: Optional[Executor] = None,
+                 max_pending: int = DEFAULT_MAX_PENDING):
+        if max_pending < 1:
+            raise ValueError('max_pending must be at least 1')
+        self.validbr = validbr if validbr is not None else ValidBR()
+        self.executor = executor
+        self.max_pending = max_pending
+        self._slots = None
+        self._pending = 0
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+        if name not in VALIDATORS:
+            # Configuration and helpers (``enable_cache``, ``sanitize``...) stay synchronous.
+            return getattr(self.validbr, name)
+        wrapper = _AsyncValidator(self, name, getattr(self.validbr, name))
+        self.__dict__[name] = wrapper
+        return wrapper
+
+    @property
+    def pending(self) -> int:
+        """Number of executor jobs currently queued or running."""
+        return self._pending
+
+    async def _inline(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    async def _offload(self, method: str, func, *args, **kwargs):
+        if self._slots is None:
+            # Created lazily so it binds to the running loop.
+            self._slots = asyncio.Semaphore(self.max_pending)
+        self._pending += 1
+        try:
+            async with self._slots:
+                loop = asyncio.get_running_loop()
+                if isinstance(self.executor, ProcessPoolExecutor):
+                    from .parallel import _run_call
+                    call = functools.partial(_run_call, method, args, kwargs)
+                else:
+                    call = functools.partial(func, *args, **kwargs)
+                return await loop.run_in_executor(self.executor, call)
+        finally:
+            self._pending -= 1
+
+    async def _coalesced_get_info(self, cep: str):
+        validator = self.validbr.cep
+        if not validator.is_valid(cep):
+            return None
+        clean = validator.remove_mask(cep)
+        future = self._in_flight.get(clean)
+        if future is None:
+            future = asyncio.ensure_future(self._offload('cep.get_info', validator.get_info, clean))
+            self._in_flight[clean] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(clean, None))
+        # Shielded so one cancelled caller does not cancel the shared lookup.
+        return await asyncio.shield(future)
+
+    async def validate_record(self, schema: dict, record: dict) -> dict:
+        return self.validbr.validate_record(schema, record)
+
+    async def validate_records(self, schema: dict, records) -> list:
+        """Validate every record in the executor; returns the list of results."""
+        def run(schema, records):
+            return list(self.validbr.validate_records(schema, records))
+        return await self._offload('validate_records', run, schema, list(records))
+
+    async def classify(self, value) -> list:
+        return self.validbr.classify(value)
+
+    async def classify_many(self, values) -> dict:
+        return await self._offload('classify_many', self.validbr.classify_many, values)
+
+    async def aclose(self) -> None:
+        """Shut down the executor (if any) without blocking the loop."""
+        if self.executor is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.executor.shutdown)
+
+    async def __aenter__(self) -> 'AsyncValidBR':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
@@ -0,0 +1,147 @@
+"""On-disk bitmap of CPFs for blocklists and allowlists of any size.
+
+A valid CPF is determined by its 9 base digits (see ``CPFValidator.to_int``),
+so one bit per base number covers every possible CPF in 10**9 bits
+(~125 MB), whatever the number of entries. The file is opened with
+``mmap``: processes that open the same index share its pages through the
+OS page cache, and lookups are a single byte read::
+
+    from validbr.bitmap import CPFBitmapIndex
+
+    CPFBitmapIndex.build('blocklist.bits', 'blocklist.txt')   # one CPF per line
+    blocked = CPFBitmapIndex.open('blocklist.bits')
+    '111.444.777-35' in blocked
+    mask = blocked.contains_many(incoming_cpfs)                # requires NumPy
+
+CPFs are normalized exactly like ``CPFValidator.is_valid``; invalid ones
+are skipped when building and never contained.
+"""
+import mmap
+import os
+import struct
+from itertools import islice
+from typing import Iterable, Union
+
+from ._batch import require_numpy
+from ._codec import INVALID_KEY
+from .validators.cpf import CPFValidator
+
+MAGIC = b'VBRCPFB1'
+# Magic followed by the number of CPFs set, as little-endian uint64.
+HEADER = struct.Struct('<8sQ')
+BITMAP_BYTES = 10 ** 9 // 8
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _popcount_table(np):
+    return np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+class CPFBitmapIndex:
+    """Read-only, memory-mapped set of CPFs; create one with ``build``."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._validator = CPFValidator()
+        with open(path, 'rb') as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or len(self._mmap) != HEADER.size + BITMAP_BYTES:
+            self._mmap.close()
+            raise ValueError(f'Not a CPF bitmap index: {path}')
+
+    @classmethod
+    def open(cls, path: str) -> 'CPFBitmapIndex':
+        """Map an index written by ``build``."""
+        return cls(path)
+
+    @classmethod
+    def build(cls, path: str, source: Union[str, Iterable[str]],
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> 'CPFBitmapIndex':
+        """Write an index of ``source`` to ``path`` and open it (requires NumPy).
+
+        ``source`` is the path of a text file with one CPF per line (masked
+        or not) or an iterable of CPFs; it is read ``chunk_size`` entries at
+        a time.
+        The bitmap is written as a sparse file, so only the pages holding
+        set bits are touched.
+        """
+        np = require_numpy()
+        validator = CPFValidator()
+        popcount = _popcount_table(np)
+        with open(path, 'wb') as fh:
+            fh.write(HEADER.pack(MAGIC, 0))
+            fh.truncate(HEADER.size + BITMAP_BYTES)
+        bitmap = np.memmap(path, dtype=np.uint8, mode='r+', offset=HEADER.size, shape=(BITMAP_BYTES,))
+        count = 0
+        lines = None
+        try:
+            if isinstance(source, (str, os.PathLike)):
+                lines = open(source, encoding='utf-8')
+                items = (line.strip() for line in lines)
+            else:
+                items = iter(source)
+            while True:
+                chunk = list(islice(items, chunk_size))
+                if not chunk:
+                    break
+                keys = validator.to_int_many(chunk)
+                keys = np.unique(keys[keys != np.uint64(INVALID_KEY)])
+                if not len(keys):
+                    continue
+                offsets = keys >> np.uint64(3)
+                bits = (np.uint8(1) << (keys & np.uint64(7)).astype(np.uint8)).astype(np.uint8)
+                starts = np.flatnonzero(np.r_[True, offsets[1:] != offsets[:-1]])
+                offsets = offsets[starts]
+                bits = np.bitwise_or.reduceat(bits, starts)
+                current = bitmap[offsets]
+                count += int(popcount[bits & ~current].sum(dtype=np.int64))
+                bitmap[offsets] = current | bits
+            bitmap.flush()
+        finally:
+            if lines is not None:
+                lines.close()
+            del bitmap
+        with open(path, 'r+b') as fh:
+            fh.write(HEADER.pack(MAGIC, count))
+        return cls(path)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def contains(self, cpf: str) -> bool:
+        """Whether ``cpf`` is a valid CPF present in the index."""
+        try:
+            key = self._validator.to_int(cpf)
+        except ValueError:
+            return False
+        return bool(self._mmap[HEADER.size + (key >> 3)] >> (key & 7) & 1)
+
+    __contains__ = contains
+
+    def contains_many(self, cpfs):
+        """Batch ``contains`` as a NumPy boolean mask (requires NumPy)."""
+        np = require_numpy()
+        keys = self._validator.to_int_many(cpfs)
+        valid = keys != np.uint64(INVALID_KEY)
+        keys = np.where(valid, keys, 0)
+        bitmap = np.frombuffer(self._mmap, dtype=np.uint8, offset=HEADER.size)
+        bits = bitmap[keys >> np.uint64(3)] >> (keys & np.uint64(7)).astype(np.uint8)
+        return valid & (bits & 1).astype(bool)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> 'CPFBitmapIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # Worker processes re-map the file instead of copying 125 MB.
+        return (type(self).open, (os.fspath(self.path),))
+
+    def __repr__(self) -> str:
+        return f'CPFBitmapIndex({self.path!r}, size={self._count})'
@@ -0,0 +1,114 @@
+"""Small thread-safe LRU cache with optional time-to-live."""
+import inspect
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Bounded least-recently-used cache.
+
+    ``ttl`` (seconds) sets a default expiry for entries; ``set`` can override
+    it per entry, which is how negative results get a shorter lifetime.
+    Hit, miss and eviction counters are kept so the cache can be sized from
+    real traffic.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None,
+                 timer: Callable[[], float] = time.monotonic):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return _MISSING
+        value, expires = entry
+        if expires is not None and expires <= self._timer():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = _MISSING) -> None:
+        if ttl is _MISSING:
+            ttl = self.ttl
+        expires = None if ttl is None else self._timer() + ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._lookup(key) is not _MISSING
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+        }
+
+
+def cached_is_valid(validator, cache: LRUCache) -> Callable:
+    """Wrap ``validator.is_valid`` so results are memoized in ``cache``.
+
+    The key is the normalized input (``remove_mask`` or ``sanitize``) plus
+    any extra argument such as the UF, so masked and unmasked spellings of
+    the same document share one entry. Keyword arguments (``state='SP'``)
+    are bound to their positions first, so both call forms share entries
+    too. Non-string input skips the cache.
+    """
+    is_valid = type(validator).is_valid.__get__(validator)
+    signature = inspect.signature(is_valid)
+    normalize = getattr(validator, 'remove_mask', None) or validator.sanitize
+
+    def cached(*args, **kwargs):
+        if kwargs:
+            args = signature.bind(*args, **kwargs).args
+        value, *args = args
+        if not isinstance(value, str):
+            return is_valid(value, *args)
+        clean = normalize(value)
+        key = (clean,) + tuple(a.upper() if isinstance(a, str) else a for a in args) if args else clean
+        result = cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = is_valid(clean, *args)
+            cache.set(key, result)
+        return result
+
+    cached.__wrapped__ = is_valid
+    return cached
@@ -0,0 +1,124 @@
+"""ViaCEP lookup client with connection pooling, retries and caching.
+
+``requests`` is imported when the first HTTP session is created, never at
+module import time.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, Iterable, List, Optional
+
+from .cache import LRUCache
+
+VIACEP_URL = 'https://viacep.com.br/ws'
+
+_MISSING = object()
+
+
+class CEPClient:
+    """Looks up CEP addresses, sharing one pooled session across calls.
+
+    Successful responses are cached for ``ttl`` seconds and ViaCEP's
+    ``{"erro": true}`` answers for ``negative_ttl`` seconds. Transport
+    errors are retried ``retries`` times and are never cached.
+    """
+
+    def __init__(
+        self,
+        base_url: str = VIACEP_URL,
+        timeout: float = 5.0,
+        retries: int = 2,
+        backoff_factor: float = 0.2,
+        cache_size: int = 10000,
+        ttl: Optional[float] = 24 * 3600,
+        negative_ttl: Optional[float] = 3600,
+        pool_size: int = 20,
+        session=None,
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.negative_ttl = negative_ttl
+        self.pool_size = pool_size
+        self.cache = LRUCache(maxsize=cache_size, ttl=ttl)
+        self._session = session
+        self._session_lock = Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def lookup(self, clean_cep: str) -> Optional[Dict]:
+        """Return ViaCEP's data for an 8-digit CEP, or ``None``."""
+        cached = self.cache.get(clean_cep, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        try:
+            resp = self.session.get(f'{self.base_url}/{clean_cep}/json/', timeout=self.timeout)
+            resp.raise_for_status()
+            data = resp.json()
+        except Exception:
+            return None
+        if 'erro' in data:
+            self.cache.set(clean_cep, None, ttl=self.negative_ttl)
+            return None
+        self.cache.set(clean_cep, data)
+        return data
+
+    async def lookup_many_async(self, clean_ceps: Iterable[str],
+                                concurrency: Optional[int] = None) -> List[Optional[Dict]]:
+        """Resolve many CEPs concurrently, keeping at most ``concurrency`` requests open.
+
+        ``concurrency`` defaults to ``pool_size`` so every request gets a
+        pooled connection. Repeated CEPs are requested once and results are
+        returned in input order.
+        """
+        clean_ceps = list(clean_ceps)
+        concurrency = concurrency or self.pool_size
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+
+        async def fetch(cep):
+            async with semaphore:
+                return await loop.run_in_executor(executor, self.lookup, cep)
+
+        try:
+            unique = list(dict.fromkeys(clean_ceps))
+            results = dict(zip(unique, await asyncio.gather(*(fetch(cep) for cep in unique))))
+        finally:
+            # Never block the event loop (e.g. on cancellation) waiting for
+            # in-flight requests. The semaphore keeps at most max_workers
+            # calls submitted, so nothing is left queued to run later.
+            executor.shutdown(wait=False)
+        return [results[cep] for cep in clean_ceps]
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
@@ -0,0 +1,212 @@
+"""Offline CEP range index: resolve a CEP's UF (and city) without HTTP.
+
+The index is three parallel sorted arrays -- range starts, range ends and a
+label per range -- searched with ``bisect``. It loads from a CSV with
+``start,end,uf,city`` columns (the shipped ``data/cep_ranges.csv`` has
+state-level ranges; supply a city-level file to resolve cities too) and can
+be compiled to a binary file that ``CEPRangeIndex.open`` memory-maps, so
+every worker process shares one copy of the pages.
+
+Binary layout (little-endian)::
+
+    magic 'VBRCEP1\\0' | uint32 ranges | uint32 names
+    uint32 starts[ranges] | uint32 ends[ranges] | uint32 cities[ranges]
+    uint32 name_offsets[names + 1] | uint8 ufs[ranges] | utf-8 names
+"""
+import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections import abc
+from typing import Optional, Sequence, Tuple
+
+UFS = (
+    'AC', 'AL', 'AM', 'AP', 'BA', 'CE', 'DF', 'ES', 'GO', 'MA', 'MG', 'MS', 'MT', 'PA',
+    'PB', 'PE', 'PI', 'PR', 'RJ', 'RN', 'RO', 'RR', 'RS', 'SC', 'SE', 'SP', 'TO',
+)
+
+DEFAULT_DATA_FILE = os.path.join(os.path.dirname(__file__), 'data', 'cep_ranges.csv')
+
+NO_CITY = 0xFFFFFFFF
+
+_MAGIC = b'VBRCEP1\x00'
+_HEADER = struct.Struct('<8sII')
+
+
+def _uint32_array(values=()) -> array:
+    # 'I' is 4 bytes on every mainstream platform; 'L' is the fallback.
+    return array('I' if array('I').itemsize == 4 else 'L', values)
+
+
+class _MappedNames(abc.Sequence):
+    """City names of a mapped index, decoded from the file on access."""
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('name index out of range')
+        return bytes(self._blob[self._offsets[i]:self._offsets[i + 1]]).decode('utf-8')
+
+
+class CEPRangeIndex:
+    """Sorted, non-overlapping CEP ranges mapped to a UF and optional city."""
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int], ufs: Sequence[int],
+                 cities: Sequence[int], names: Sequence[str], _buffer=None, _views=()):
+        self.starts = starts
+        self.ends = ends
+        self.ufs = ufs
+        self.cities = cities
+        self.names = names
+        self._buffer = _buffer
+        self._views = _views
+
+    @classmethod
+    def from_rows(cls, rows) -> 'CEPRangeIndex':
+        """Build an index from ``(start, end, uf, city)`` tuples in any order."""
+        entries = []
+        for start, end, uf, city in rows:
+            start, end, uf = int(start), int(end), uf.strip().upper()
+            if uf not in UFS:
+                raise ValueError(f'Invalid state: {uf}')
+            if not 0 <= start <= end <= 99999999:
+                raise ValueError(f'Invalid CEP range: {start}-{end}')
+            entries.append((start, end, UFS.index(uf), (city or '').strip()))
+        entries.sort()
+        for previous, current in zip(entries, entries[1:]):
+            if current[0] <= previous[1]:
+                raise ValueError(f'Overlapping CEP ranges at {current[0]:08d}')
+
+        name_ids = {}
+        names = []
+        cities = _uint32_array()
+        for _, _, _, city in entries:
+            if not city:
+                cities.append(NO_CITY)
+                continue
+            if city not in name_ids:
+                name_ids[city] = len(names)
+                names.append(city)
+            cities.append(name_ids[city])
+        return cls(
+            _uint32_array(e[0] for e in entries),
+            _uint32_array(e[1] for e in entries),
+            array('B', (e[2] for e in entries)),
+            cities,
+            names,
+        )
+
+    @classmethod
+    def from_csv(cls, path: str) -> 'CEPRangeIndex':
+        """Load a ``start,end,uf[,city]`` CSV file."""
+        with open(path, encoding='utf-8', newline='') as fh:
+            return cls.from_rows(
+                (row['start'], row['end'], row['uf'], row.get('city'))
+                for row in csv.DictReader(fh)
+            )
+
+    @classmethod
+    def open(cls, path: str) -> 'CEPRangeIndex':
+        """Memory-map an index written by ``save``; pages are shared between processes."""
+        with open(path, 'rb') as fh:
+            buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, name_count = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            buffer.close()
+            raise ValueError(f'Not a CEP range index file: {path}')
+        if sys.byteorder != 'little':
+            buffer.close()
+            raise ValueError('Memory-mapped CEP indexes require a little-endian platform')
+
+        view = memoryview(buffer)
+        offset = _HEADER.size
+
+        def take(size, fmt):
+            nonlocal offset
+            part = view[offset:offset + size].cast(fmt)
+            offset += size
+            return part
+
+        starts = take(4 * count, 'I')
+        ends = take(4 * count, 'I')
+        cities = take(4 * count, 'I')
+        name_offsets = take(4 * (name_count + 1), 'I')
+        ufs = take(count, 'B')
+        blob = view[offset:offset + name_offsets[-1]]
+        names = _MappedNames(name_offsets, blob)
+        views = (starts, ends, cities, name_offsets, ufs, blob, view)
+        return cls(starts, ends, ufs, cities, names, _buffer=buffer, _views=views)
+
+    @classmethod
+    def default(cls) -> 'CEPRangeIndex':
+        """The state-level index shipped with validbr."""
+        return cls.from_csv(DEFAULT_DATA_FILE)
+
+    def save(self, path: str) -> None:
+        """Write the binary form read by ``open``."""
+        encoded = [name.encode('utf-8') for name in self.names]
+        name_offsets = _uint32_array([0])
+        for name in encoded:
+            name_offsets.append(name_offsets[-1] + len(name))
+        parts = [self.starts, self.ends, self.cities, name_offsets]
+        with open(path, 'wb') as fh:
+            fh.write(_HEADER.pack(_MAGIC, len(self.starts), len(self.names)))
+            for part in parts:
+                values = _uint32_array(part)
+                if sys.byteorder != 'little':
+                    values.byteswap()
+                fh.write(values.tobytes())
+            fh.write(bytes(self.ufs))
+            fh.write(b''.join(encoded))
+
+    def close(self) -> None:
+        if self._buffer is not None:
+            self.starts = self.ends = self.ufs = self.cities = self.names = None
+            for view in self._views:
+                view.release()
+            self._views = ()
+            self._buffer.close()
+            self._buffer = None
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _find(self, cep) -> Optional[int]:
+        if isinstance(cep, str):
+            digits = cep.replace('-', '').replace('.', '').strip()
+            if len(digits) != 8 or not digits.isdigit() or not digits.isascii():
+                return None
+            cep = int(digits)
+        i = bisect_right(self.starts, cep) - 1
+        if i >= 0 and cep <= self.ends[i]:
+            return i
+        return None
+
+    def lookup(self, cep) -> Optional[Tuple[str, Optional[str]]]:
+        """Return ``(uf, city)`` for a CEP (string or int); ``city`` may be ``None``."""
+        i = self._find(cep)
+        if i is None:
+            return None
+        city = self.cities[i]
+        return UFS[self.ufs[i]], (None if city == NO_CITY else self.names[city])
+
+    def get_state(self, cep) -> Optional[str]:
+        i = self._find(cep)
+        return None if i is None else UFS[self.ufs[i]]
+
+    def get_city(self, cep) -> Optional[str]:
+        found = self.lookup(cep)
+        return found and found[1]
@@ -0,0 +1,82 @@
+"""Guess which document an unlabeled identifier is.
+
+The value is normalized once and its digit count picks the candidates;
+only their checksums are run. Candidates are ranked by how much a match
+says: two check digits (CPF, CNPJ, CNH, título) beat a phone number's
+DDD/prefix rules, which beat an RG without its UF (length only).
+"""
+from importlib import import_module
+from typing import Dict, List
+
+from ._batch import as_text_array, require_numpy, scan_digits, take_digits
+from ._normalize import only_digits
+
+# Digit count -> candidate document types, best evidence first.
+CANDIDATES = {
+    8: ('rg',),
+    9: ('rg',),
+    10: ('phone',),
+    11: ('cpf', 'cnh', 'phone'),
+    12: ('titulo_eleitor',),
+    14: ('cnpj',),
+}
+
+DOCUMENT_TYPES = ('cpf', 'cnpj', 'cnh', 'titulo_eleitor', 'phone', 'rg')
+
+
+def classify(validbr, value) -> List[str]:
+    """Return the document types ``value`` is valid as, best match first."""
+    clean = only_digits(value)
+    return [
+        name for name in CANDIDATES.get(len(clean), ())
+        if getattr(validbr, name).is_valid(clean)
+    ]
+
+
+def _recomputed(module, base_width):
+    # Recompute the check digits from the base digits and compare.
+    def check(np, digits, validbr):
+        complete = import_module(module, __package__)._complete_many
+        full, ok = complete(digits[:, :base_width])
+        return ok & (full == digits).all(axis=1)
+    return check
+
+
+def _phone(np, digits, validbr):
+    from .validators.phone import _valid_national_many
+    return _valid_national_many(np, digits)[0]
+
+
+def _rg(np, digits, validbr):
+    return np.ones(len(digits), dtype=bool)
+
+
+_BATCH_CHECKS = {
+    'cpf': _recomputed('.validators.cpf', 9),
+    'cnpj': _recomputed('.validators.cnpj', 12),
+    'cnh': _recomputed('.validators.cnh', 9),
+    'titulo_eleitor': _recomputed('.validators.titulo_eleitor', 10),
+    'phone': _phone,
+    'rg': _rg,
+}
+
+
+def classify_many(validbr, values) -> Dict[str, object]:
+    """Classify many values at once (requires NumPy).
+
+    Returns one boolean mask per document type, ordered as
+    ``DOCUMENT_TYPES`` (best evidence first), each matching what
+    ``classify`` reports for every item. The digits are scanned once and
+    every candidate check runs vectorized over the rows of its length.
+    """
+    np = require_numpy()
+    arr = as_text_array(values)
+    scan = scan_digits(arr)
+    masks = {name: np.zeros(len(arr), dtype=bool) for name in DOCUMENT_TYPES}
+    for width, candidates in CANDIDATES.items():
+        digits, rows = take_digits(scan, width)
+        if not len(digits):
+            continue
+        for name in candidates:
+            masks[name][rows] = _BATCH_CHECKS[name](np, digits, validbr)
+    return masks
@@ -0,0 +1,319 @@
+"""pandas and Polars accessors running the batch validators on whole columns.
+
+``register()`` adds a ``validbr`` accessor to pandas ``Series``/``DataFrame``
+and a ``validbr`` namespace to Polars ``Series``/``DataFrame``, for
+whichever of the two libraries is installed. Nothing is registered on
+import, of this module or of ``validbr``; call it once at startup::
+
+    import pandas as pd
+    import validbr.dataframe
+
+    validbr.dataframe.register()
+
+    df['cpf_ok'] = df['cpf'].validbr.cpf.is_valid()        # nullable boolean
+    df['cnpj_fmt'] = df['cnpj'].validbr.cnpj.apply_mask()  # string
+    df['ddd'] = df['fone'].validbr.phone.get_ddd()         # categorical
+    df['ie_ok'] = df.validbr.ie.is_valid('ie', 'uf')       # 'uf' names a column
+    report = df.validbr.validate({'cpf': 'cpf', 'fone': 'phone'})
+
+Methods with a ``<method>_many`` batch form run it on the column's string
+(or bytes) array. The others are called once per distinct value. Missing
+values stay missing in the result.
+"""
+from typing import Dict
+
+from . import VALIDATORS
+from ._batch import as_text_array, require_numpy
+
+# Methods whose results are categories (few distinct values).
+CATEGORICAL_METHODS = frozenset(['get_ddd', 'get_state', 'get_domain', 'get_city'])
+
+_STATE_VALIDATORS = ('ie', 'rg')
+
+
+def _default_validbr():
+    from . import validbr
+    return validbr
+
+
+def _text_array(np, values, is_bytes: bool):
+    if is_bytes:
+        return np.array([v if isinstance(v, bytes) else b'' for v in values], dtype='S')
+    return as_text_array(values)
+
+
+def _is_per_row(value) -> bool:
+    return hasattr(value, '__len__') and not isinstance(value, (str, bytes))
+
+
+def _run(validbr, name: str, method: str, values, args):
+    """Apply ``name.method`` to a text array; returns a NumPy array."""
+    np = require_numpy()
+    validator = getattr(validbr, name)
+    batch = getattr(validator, f'{method}_many', None)
+    if batch is not None:
+        result = batch(values, *args)
+        # ``phone.normalize_many`` returns several columns; use the scalar path.
+        if not isinstance(result, dict):
+            result = result if isinstance(result, np.ndarray) else np.asarray(result, dtype=object)
+            if method == 'apply_mask':
+                # The batch form leaves rows it cannot format empty, where
+                # ``apply_mask`` hands the input back: redo just those.
+                redo = np.flatnonzero((result == b'') & (values != values.dtype.type()))
+                if len(redo):
+                    result = result.astype(str).astype(object)
+                    result[redo] = _run_scalar(validator, method, values[redo], args)
+            return result
+    return _run_scalar(validator, method, values, args)
+
+
+def _run_scalar(validator, method: str, values, args):
+    """Call the scalar method, once per distinct value unless ``args`` vary per row."""
+    np = require_numpy()
+    func = getattr(validator, method)
+    decode = values.dtype.kind == 'S'
+    if any(_is_per_row(arg) for arg in args):
+        columns = [arg if _is_per_row(arg) else [arg] * len(values) for arg in args]
+        items = (v.decode('ascii', 'ignore') if decode else str(v) for v in values)
+        return np.array([func(v, *row) for v, *row in zip(items, *columns)], dtype=object)
+    uniques, inverse = np.unique(values, return_inverse=True)
+    mapped = [func(u.decode('ascii', 'ignore') if decode else str(u), *args) for u in uniques]
+    out = np.empty(len(mapped), dtype=object)
+    out[:] = mapped
+    return out[inverse.ravel()]
+
+
+def _kind(method: str, result) -> str:
+    if result.dtype == bool or method.startswith(('is_', 'has_')):
+        return 'boolean'
+    if result.dtype.kind in 'iu':
+        return 'integer'
+    if method in CATEGORICAL_METHODS:
+        return 'category'
+    if result.dtype.kind in 'SU' or all(v is None or isinstance(v, str) for v in result.tolist()):
+        return 'string'
+    return 'object'
+
+
+def _as_text(np, result):
+    if result.dtype.kind == 'S':
+        return result.astype(str).astype(object)
+    return result.astype(object)
+
+
+def _prepare(np, method, result, nulls):
+    """Return ``(kind, values, nulls)`` ready to wrap in a column."""
+    kind = _kind(method, result)
+    if kind == 'boolean':
+        return kind, result.astype(bool), nulls
+    if kind == 'integer':
+        # Batch getters mark invalid rows with -1 (``get_age_many``).
+        return kind, result, nulls | (result < 0)
+    values = _as_text(np, result)
+    values[nulls] = None
+    return kind, values, nulls
+
+
+# -- pandas -----------------------------------------------------------------
+
+def _pandas_input(series):
+    import pandas as pd
+    np = require_numpy()
+    nulls = series.isna().to_numpy()
+    values = series.to_numpy(dtype=object, na_value=None)
+    is_bytes = pd.api.types.infer_dtype(series, skipna=True) == 'bytes'
+    return _text_array(np, values, is_bytes), nulls
+
+
+def _pandas_arg(frame, arg):
+    if frame is not None and isinstance(arg, str) and arg in frame.columns:
+        arg = frame[arg]
+    if hasattr(arg, 'to_numpy'):
+        return _pandas_input(arg)[0]
+    return arg
+
+
+def _pandas_output(series, method: str, result, nulls):
+    import pandas as pd
+    np = require_numpy()
+    kind, values, nulls = _prepare(np, method, result, nulls)
+    if kind in ('boolean', 'integer'):
+        out = pd.array(values, dtype='boolean' if kind == 'boolean' else 'Int64')
+        out[nulls] = pd.NA
+    elif kind == 'category':
+        out = pd.Categorical(values)
+    elif kind == 'string':
+        out = pd.array(values, dtype='string')
+    else:
+        out = values
+    return pd.Series(out, index=series.index, name=series.name)
+
+
+class _PandasMethods:
+    def __init__(self, accessor, name: str):
+        self._accessor = accessor
+        self._name = name
+
+    def __getattr__(self, method: str):
+        validator = getattr(self._accessor._validbr, self._name)
+        if method.startswith('_') or not callable(getattr(validator, method, None)):
+            raise AttributeError(f'{self._name} has no method {method!r}')
+
+        def call(*args):
+            return self._accessor._call(self._name, method, args)
+        call.__name__ = method
+        return call
+
+
+class _PandasAccessorBase:
+    _validbr = None
+
+    def __init__(self, obj):
+        self._obj = obj
+        self._validbr = _default_validbr()
+
+    def using(self, validbr):
+        """Run on a specific ``ValidBR`` instance (e.g. with caching enabled)."""
+        clone = type(self)(self._obj)
+        clone._validbr = validbr
+        return clone
+
+    def __getattr__(self, name: str):
+        if name not in VALIDATORS:
+            raise AttributeError(f'validbr accessor has no validator {name!r}')
+        return _PandasMethods(self, name)
+
+
+class PandasSeriesAccessor(_PandasAccessorBase):
+    """``series.validbr.<validator>.<method>(*args)``."""
+
+    def _call(self, name, method, args):
+        values, nulls = _pandas_input(self._obj)
+        args = tuple(_pandas_arg(None, arg) for arg in args)
+        return _pandas_output(self._obj, method, _run(self._validbr, name, method, values, args), nulls)
+
+
+class PandasFrameAccessor(_PandasAccessorBase):
+    """``df.validbr.<validator>.<method>(column, *args)`` and ``df.validbr.validate(schema)``.
+
+    String arguments naming a column are replaced by that column, so
+    ``df.validbr.ie.is_valid('ie', 'uf')`` uses each row's state.
+    """
+
+    def _call(self, name, method, args):
+        column, *rest = args
+        series = self._obj[column]
+        values, nulls = _pandas_input(series)
+        rest = tuple(_pandas_arg(self._obj, arg) for arg in rest)
+        return _pandas_output(series, method, _run(self._validbr, name, method, values, rest), nulls)
+
+    def validate(self, schema: Dict[str, str], state_column=None):
+        """Check each column of ``schema`` (column -> validator) with ``is_valid``.
+
+        ``ie``/``rg`` columns use ``state_column`` for the state. Returns a
+        DataFrame of nullable booleans with the same columns.
+        """
+        import pandas as pd
+        results = {}
+        for column, name in schema.items():
+            args = (state_column,) if name in _STATE_VALIDATORS and state_column else ()
+            results[column] = self._call(name, 'is_valid', (column,) + args)
+        return pd.DataFrame(results, index=self._obj.index)
+
+
+# -- Polars -----------------------------------------------------------------
+
+def _polars_input(series):
+    import polars as pl
+    np = require_numpy()
+    nulls = series.is_null().to_numpy()
+    if series.dtype == pl.Binary:
+        return _text_array(np, series.fill_null(b'').to_list(), True), nulls
+    return as_text_array(series.cast(pl.Utf8).fill_null('').to_numpy()), nulls
+
+
+def _polars_arg(frame, arg):
+    import polars as pl
+    if frame is not None and isinstance(arg, str) and arg in frame.columns:
+        arg = frame[arg]
+    if isinstance(arg, pl.Series):
+        return _polars_input(arg)[0]
+    return arg
+
+
+def _polars_output(series, method: str, result, nulls):
+    import polars as pl
+    np = require_numpy()
+    kind, values, nulls = _prepare(np, method, result, nulls)
+    if kind == 'boolean':
+        out = pl.Series(series.name, values)
+    elif kind == 'integer':
+        out = pl.Series(series.name, values.astype(np.int64))
+    elif kind == 'object':
+        return pl.Series(series.name, values.tolist())
+    else:
+        out = pl.Series(series.name, values.tolist(), dtype=pl.Utf8)
+        if kind == 'category':
+            out = out.cast(pl.Categorical)
+    if nulls.any():
+        out = out.scatter(np.flatnonzero(nulls), None)
+    return out
+
+
+class _PolarsAccessorBase(_PandasAccessorBase):
+    def __getattr__(self, name: str):
+        if name not in VALIDATORS:
+            raise AttributeError(f'validbr namespace has no validator {name!r}')
+        return _PandasMethods(self, name)
+
+
+class PolarsSeriesNamespace(_PolarsAccessorBase):
+    """``series.validbr.<validator>.<method>(*args)`` for Polars."""
+
+    def _call(self, name, method, args):
+        values, nulls = _polars_input(self._obj)
+        args = tuple(_polars_arg(None, arg) for arg in args)
+        return _polars_output(self._obj, method, _run(self._validbr, name, method, values, args), nulls)
+
+
+class PolarsFrameNamespace(_PolarsAccessorBase):
+    """Polars counterpart of ``PandasFrameAccessor``."""
+
+    def _call(self, name, method, args):
+        column, *rest = args
+        series = self._obj[column]
+        values, nulls = _polars_input(series)
+        rest = tuple(_polars_arg(self._obj, arg) for arg in rest)
+        return _polars_output(series, method, _run(self._validbr, name, method, values, rest), nulls)
+
+    def validate(self, schema: Dict[str, str], state_column=None):
+        import polars as pl
+        columns = []
+        for column, name in schema.items():
+            args = (state_column,) if name in _STATE_VALIDATORS and state_column else ()
+            columns.append(self._call(name, 'is_valid', (column,) + args))
+        return pl.DataFrame(columns)
+
+
+def register() -> None:
+    """Register the accessors on every installed DataFrame library.
+
+    Safe to call more than once; libraries that are not installed are
+    skipped.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        pass
+    else:
+        if not hasattr(pd.Series, 'validbr'):
+            pd.api.extensions.register_series_accessor('validbr')(PandasSeriesAccessor)
+            pd.api.extensions.register_dataframe_accessor('validbr')(PandasFrameAccessor)
+    try:
+        import polars as pl
+    except ImportError:
+        pass
+    else:
+        if not hasattr(pl.Series, 'validbr'):
+            pl.api.register_series_namespace('validbr')(PolarsSeriesNamespace)
+            pl.api.register_dataframe_namespace('validbr')(PolarsFrameNamespace)
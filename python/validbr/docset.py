@@ -0,0 +1,166 @@
+"""Compact sets of CPFs or CNPJs stored as sorted ``uint64`` keys.
+
+A ``DocumentSet`` keeps each document as the integer key of
+``CPFValidator.to_int`` (8 bytes instead of a ~60 byte ``str`` plus the
+hash table slot), in one sorted NumPy array. Membership is a binary
+search, set operations are merges, and iteration gives back exactly what
+``apply_mask`` would::
+
+    from validbr.docset import DocumentSet, dedupe_mask
+
+    customers = DocumentSet(customer_cpfs)                 # kind='cpf'
+    '111.444.777-35' in customers
+    known = customers.contains_many(incoming_cpfs)         # boolean mask
+    both = customers & DocumentSet(supplier_cpfs)
+    rows = records[dedupe_mask(records_cpfs)]              # first of each CPF
+
+Invalid documents are never members: they are dropped when building a set.
+Requires NumPy.
+"""
+from importlib import import_module
+from typing import Iterable, Iterator, List, Union
+
+from ._batch import require_numpy
+from ._codec import INVALID_KEY, as_keys, decode_many, encode_many
+
+# kind -> (validator module, digits, base digits)
+KINDS = {
+    'cpf': ('.validators.cpf', 11, 9),
+    'cnpj': ('.validators.cnpj', 14, 12),
+}
+
+
+def _spec(kind: str):
+    if kind not in KINDS:
+        raise ValueError(f'Unsupported document kind: {kind}')
+    module, width, base_width = KINDS[kind]
+    return import_module(module, __package__), width, base_width
+
+
+def encode(documents, kind: str = 'cpf'):
+    """``uint64`` keys of ``documents``, ``INVALID_KEY`` for invalid ones."""
+    module, width, base_width = _spec(kind)
+    return encode_many(documents, width, base_width, module._complete_many)
+
+
+def dedupe_mask(documents, kind: str = 'cpf'):
+    """Mask keeping the first row of each distinct valid document.
+
+    Masked and unmasked spellings of the same document are duplicates;
+    invalid rows are dropped.
+    """
+    np = require_numpy()
+    keys = encode(documents, kind)
+    _, first = np.unique(keys, return_index=True)
+    mask = np.zeros(len(keys), dtype=bool)
+    mask[first] = True
+    mask &= keys != np.uint64(INVALID_KEY)
+    return mask
+
+
+class DocumentSet:
+    """Immutable set of valid CPFs or CNPJs (``kind``) backed by sorted keys."""
+
+    def __init__(self, documents: Iterable = (), kind: str = 'cpf'):
+        np = require_numpy()
+        _spec(kind)
+        self.kind = kind
+        keys = np.unique(encode(documents, kind))
+        # INVALID_KEY is the largest uint64, so it can only be last.
+        if len(keys) and keys[-1] == np.uint64(INVALID_KEY):
+            keys = keys[:-1]
+        self.keys = keys
+
+    @classmethod
+    def from_keys(cls, keys, kind: str = 'cpf') -> 'DocumentSet':
+        """Build a set from ``to_int`` keys, e.g. loaded with ``numpy.load``."""
+        np = require_numpy()
+        module, _, base_width = _spec(kind)
+        keys = np.unique(as_keys(np, keys))
+        valid = decode_many(keys, base_width, module._complete_many) != ''
+        return cls._wrap(keys[valid], kind)
+
+    @classmethod
+    def _wrap(cls, keys, kind: str) -> 'DocumentSet':
+        docs = cls.__new__(cls)
+        docs.kind = kind
+        docs.keys = keys
+        return docs
+
+    def _other_keys(self, other: 'DocumentSet'):
+        if not isinstance(other, DocumentSet):
+            raise TypeError(f'Expected a DocumentSet, got {type(other).__name__}')
+        if other.kind != self.kind:
+            raise ValueError(f'Cannot combine {self.kind} and {other.kind} sets')
+        return other.keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_list())
+
+    def __contains__(self, document: Union[str, int]) -> bool:
+        return bool(self.contains_many([document])[0])
+
+    def contains_many(self, documents):
+        """Membership of every item as a NumPy boolean mask.
+
+        Items may be documents (masked or not) or integer keys; integers
+        that cannot be keys (negative, too large) are not members.
+        """
+        np = require_numpy()
+        if isinstance(documents, np.ndarray) and documents.dtype.kind in 'iu':
+            keys = as_keys(np, documents)
+        else:
+            documents = list(documents)
+            if documents and all(isinstance(d, int) and not isinstance(d, bool) for d in documents):
+                keys = as_keys(np, documents)
+            else:
+                keys = encode(documents, self.kind)
+        if not len(self.keys):
+            return np.zeros(len(keys), dtype=bool)
+        found = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        return (self.keys[found] == keys) & (keys != np.uint64(INVALID_KEY))
+
+    def intersection(self, other: 'DocumentSet') -> 'DocumentSet':
+        np = require_numpy()
+        return self._wrap(np.intersect1d(self.keys, self._other_keys(other), assume_unique=True), self.kind)
+
+    def union(self, other: 'DocumentSet') -> 'DocumentSet':
+        np = require_numpy()
+        return self._wrap(np.union1d(self.keys, self._other_keys(other)), self.kind)
+
+    def difference(self, other: 'DocumentSet') -> 'DocumentSet':
+        np = require_numpy()
+        return self._wrap(np.setdiff1d(self.keys, self._other_keys(other), assume_unique=True), self.kind)
+
+    def __and__(self, other):
+        return self.intersection(other) if isinstance(other, DocumentSet) else NotImplemented
+
+    def __or__(self, other):
+        return self.union(other) if isinstance(other, DocumentSet) else NotImplemented
+
+    def __sub__(self, other):
+        return self.difference(other) if isinstance(other, DocumentSet) else NotImplemented
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DocumentSet):
+            return NotImplemented
+        return self.kind == other.kind and require_numpy().array_equal(self.keys, other.keys)
+
+    __hash__ = None
+
+    def to_list(self, masked: bool = True) -> List[str]:
+        """The documents in key order, formatted like ``apply_mask`` when ``masked``."""
+        module, _, base_width = _spec(self.kind)
+        template = module.MASK_TEMPLATE if masked else None
+        return decode_many(self.keys, base_width, module._complete_many, template).tolist()
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the keys."""
+        return self.keys.nbytes
+
+    def __repr__(self) -> str:
+        return f'DocumentSet(kind={self.kind!r}, size={len(self)})'
@@ -0,0 +1,162 @@
+"""Validation of fixed-width record files straight from their bytes.
+
+Mainframe exports put every field at a known byte offset of a fixed-length
+record. ``FixedWidthLayout`` views a ``bytes``/``memoryview``/``mmap``
+buffer as an ``(records, record_length)`` NumPy matrix without copying it,
+slices each field as a column block and runs the vectorized checksum on
+the ASCII codes; no line is ever decoded to ``str``::
+
+    from validbr.fixed_width import FixedWidthLayout
+
+    layout = FixedWidthLayout(record_length=81, fields={
+        'titular': ('cpf', 10, 14),      # kind, byte offset, byte length
+        'empresa': ('cnpj', 24, 18),
+        'cep': ('cep', 42, 8),
+        'fone': ('phone', 50, 15),
+    })
+    bad = layout.invalid_records_file('remessa.txt')   # record numbers
+    mask = layout.validate(buffer)                     # True = all fields valid
+
+A field is normalized like ``remove_mask``: every non-digit byte (spaces,
+mask characters) is ignored, and the remaining digit count must match the
+document. Requires NumPy.
+"""
+import mmap
+import traceback
+from typing import Dict, Tuple
+
+from ._batch import require_numpy, take_digits
+from .classify import _BATCH_CHECKS
+
+# kind -> accepted digit counts
+KINDS = {
+    'cpf': (11,),
+    'cnpj': (14,),
+    'cnh': (11,),
+    'titulo_eleitor': (12,),
+    'phone': (10, 11),
+    'cep': (8,),
+}
+
+DEFAULT_CHUNK_RECORDS = 1 << 18
+
+
+def _check(np, kind: str, digits):
+    if kind == 'cep':
+        # CEPValidator.is_valid only checks the digit count.
+        return np.ones(len(digits), dtype=bool)
+    return _BATCH_CHECKS[kind](np, digits, None)
+
+
+class FixedWidthLayout:
+    """Field positions of a fixed-width record file.
+
+    ``fields`` maps a field name to ``(kind, offset, length)`` in bytes,
+    ``kind`` being one of ``KINDS``. ``header`` bytes are skipped at the
+    start of the buffer. ``record_length`` includes the line terminator, if
+    any; a last record missing only its terminator is still validated.
+    """
+
+    def __init__(self, record_length: int, fields: Dict[str, Tuple[str, int, int]],
+                 header: int = 0, chunk_records: int = DEFAULT_CHUNK_RECORDS):
+        if record_length <= 0:
+            raise ValueError('record_length must be positive')
+        self.record_length = record_length
+        self.header = header
+        self.chunk_records = chunk_records
+        if not fields:
+            raise ValueError('At least one field is required')
+        self.fields = {}
+        for name, (kind, offset, length) in fields.items():
+            if kind not in KINDS:
+                raise ValueError(f'Unsupported field kind: {kind}')
+            if offset < 0 or length <= 0 or offset + length > record_length:
+                raise ValueError(f'Field {name!r} does not fit in the record')
+            self.fields[name] = (kind, offset, length)
+        self._end = max(offset + length for _, offset, length in self.fields.values())
+
+    def _records(self, np, buffer):
+        """``(n, record_length)`` view of ``buffer`` plus a padded copy of a short last record."""
+        data = np.frombuffer(buffer, dtype=np.uint8)[self.header:]
+        count, rest = divmod(len(data), self.record_length)
+        records = data[:count * self.record_length].reshape(count, self.record_length)
+        tail = None
+        if rest:
+            if rest < self._end:
+                raise ValueError('Buffer ends with a truncated record')
+            tail = np.zeros((1, self.record_length), dtype=np.uint8)
+            tail[0, :rest] = data[count * self.record_length:]
+        return records, tail
+
+    def _validate_block(self, np, records, results) -> None:
+        for name, (kind, offset, length) in self.fields.items():
+            codes = records[:, offset:offset + length]
+            is_digit = (codes >= 48) & (codes <= 57)
+            counts = is_digit.sum(axis=1, dtype=np.int32)
+            valid = np.zeros(len(records), dtype=bool)
+            for width in KINDS[kind]:
+                if width > length:
+                    continue
+                if width == length:
+                    # Bare digits filling the field: no gather needed.
+                    rows = counts == width
+                    digits = (codes[rows] - 48).astype(np.uint8)
+                else:
+                    digits, rows = take_digits((codes, is_digit, counts), width)
+                if len(digits):
+                    valid[rows] = _check(np, kind, digits)
+            results[name].append(valid)
+
+    def validate(self, buffer, by_field: bool = False):
+        """Validate every record of ``buffer``.
+
+        Returns a boolean mask with one entry per record, ``True`` when all
+        fields are valid, or with ``by_field`` a dict of masks per field.
+        """
+        np = require_numpy()
+        records, tail = self._records(np, buffer)
+        # An empty first block keeps ``concatenate`` happy for empty buffers.
+        results = {name: [np.zeros(0, dtype=bool)] for name in self.fields}
+        for start in range(0, len(records), self.chunk_records):
+            self._validate_block(np, records[start:start + self.chunk_records], results)
+        if tail is not None:
+            self._validate_block(np, tail, results)
+        masks = {name: np.concatenate(parts) for name, parts in results.items()}
+        if by_field:
+            return masks
+        valid, *others = masks.values()
+        for mask in others:
+            valid &= mask
+        return valid
+
+    def invalid_records(self, buffer):
+        """Indices (record numbers, from 0) of the records with an invalid field."""
+        return require_numpy().flatnonzero(~self.validate(buffer))
+
+    def validate_bitmap(self, buffer) -> bytes:
+        """``validate`` packed as a bitmap: bit ``i % 8`` of byte ``i // 8`` is record ``i``."""
+        np = require_numpy()
+        return np.packbits(self.validate(buffer), bitorder='little').tobytes()
+
+    def _with_file(self, path: str, method):
+        with open(path, 'rb') as fh:
+            if not fh.seek(0, 2):
+                return method(b'')
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return method(mm)
+            except BaseException as exc:
+                # The traceback's frames hold NumPy views of the map, which
+                # would make ``close`` raise BufferError over this error.
+                traceback.clear_frames(exc.__traceback__)
+                raise
+            finally:
+                mm.close()
+
+    def validate_file(self, path: str, by_field: bool = False):
+        """``validate`` on a memory-mapped file."""
+        return self._with_file(path, lambda mm: self.validate(mm, by_field=by_field))
+
+    def invalid_records_file(self, path: str):
+        """``invalid_records`` on a memory-mapped file."""
+        return self._with_file(path, self.invalid_records)
@@ -0,0 +1,223 @@
+"""Per-validator call counters, outcomes and latency histograms.
+
+Enabled with ``ValidBR.enable_metrics``, which wraps the chosen methods of
+each validator on that instance only. When metrics are disabled nothing is
+wrapped, so the validators run exactly as without this module.
+
+Failure reasons come from the validator's ``failure_reasons`` and
+``get_failure_reason``/``get_failure_reason_many``, which CPF and CNPJ
+define; other validators count valid and invalid results only.
+
+Example::
+
+    metrics = validbr.enable_metrics()
+    validbr.cnpj.is_valid('11.222.333/0001-82')
+    metrics.as_dict()['cnpj']['is_valid']['failures']   # {'dv2': 1}
+    print(metrics.to_prometheus())
+"""
+import time
+from bisect import bisect_left
+from collections import Counter
+from threading import Lock
+from typing import Dict, Iterable, Optional, Tuple
+
+from ._batch import require_numpy
+
+# Methods instrumented by default.
+DEFAULT_METHODS = ('is_valid', 'is_valid_many', 'apply_mask', 'generate', 'get_info')
+
+# Upper bounds of the latency buckets, in seconds (Prometheus ``le``).
+DEFAULT_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 1e-2, 0.1, 1.0,
+)
+
+_MISSING = object()
+
+
+class _MethodStats:
+    __slots__ = ('calls', 'valid', 'invalid', 'failures', 'buckets', 'seconds')
+
+    def __init__(self, bucket_count: int):
+        self.calls = 0
+        self.valid = 0
+        self.invalid = 0
+        self.failures = Counter()
+        # One slot per bucket plus the +Inf overflow; not cumulative.
+        self.buckets = [0] * (bucket_count + 1)
+        self.seconds = 0.0
+
+
+class Metrics:
+    """Counters and latency histograms for instrumented validator methods."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS, timer=time.perf_counter):
+        self.buckets = tuple(sorted(buckets))
+        self._timer = timer
+        self._lock = Lock()
+        self._stats: Dict[Tuple[str, str], _MethodStats] = {}
+
+    def _observe(self, stats: _MethodStats, elapsed: float, valid: int = 0, invalid: int = 0,
+                 failures: Optional[Dict[str, int]] = None) -> None:
+        with self._lock:
+            stats.calls += 1
+            stats.seconds += elapsed
+            stats.buckets[bisect_left(self.buckets, elapsed)] += 1
+            stats.valid += valid
+            stats.invalid += invalid
+            if failures:
+                stats.failures.update(failures)
+
+    def wrap(self, name: str, method: str, validator, func):
+        """Return ``func`` instrumented as ``name.method``."""
+        stats = self._stats.setdefault((name, method), _MethodStats(len(self.buckets)))
+        timer = self._timer
+        observe = self._observe
+        labels = getattr(validator, 'failure_reasons', {})
+
+        if method == 'is_valid':
+            reason_of = getattr(validator, 'get_failure_reason', None)
+
+            def wrapper(*args, **kwargs):
+                start = timer()
+                result = func(*args, **kwargs)
+                elapsed = timer() - start
+                if result:
+                    observe(stats, elapsed, valid=1)
+                else:
+                    # Only failures pay for the reason, and it is not timed.
+                    reason = labels.get(reason_of(*args, **kwargs)) if reason_of else None
+                    observe(stats, elapsed, invalid=1, failures={reason: 1} if reason else None)
+                return result
+        elif method == 'is_valid_many':
+            reasons_of = getattr(validator, 'get_failure_reason_many', None)
+
+            def wrapper(*args, **kwargs):
+                start = timer()
+                if reasons_of is not None:
+                    # The reason codes give the mask too: no second pass.
+                    reasons = reasons_of(*args, **kwargs)
+                    result = reasons == 0
+                else:
+                    result = func(*args, **kwargs)
+                elapsed = timer() - start
+                valid = int(result.sum())
+                failures = None
+                if reasons_of is not None:
+                    codes, counts = require_numpy().unique(reasons, return_counts=True)
+                    failures = {
+                        labels.get(int(c), str(c)): int(n) for c, n in zip(codes, counts) if c
+                    }
+                observe(stats, elapsed, valid=valid, invalid=len(result) - valid, failures=failures)
+                return result
+        else:
+            def wrapper(*args, **kwargs):
+                start = timer()
+                result = func(*args, **kwargs)
+                observe(stats, timer() - start)
+                return result
+
+        wrapper.__name__ = method
+        wrapper.__wrapped__ = func
+        wrapper._restore = validator.__dict__.get(method, _MISSING)
+        return wrapper
+
+    def reset(self) -> None:
+        """Zero every counter and histogram."""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key].__init__(len(self.buckets))
+
+    def as_dict(self) -> Dict[str, Dict[str, Dict]]:
+        """``{validator: {method: {...}}}`` with counts, failures and latency."""
+        result = {}
+        with self._lock:
+            for (name, method), stats in self._stats.items():
+                if not stats.calls:
+                    continue
+                cumulative, running = {}, 0
+                for bound, count in zip(self.buckets + (float('inf'),), stats.buckets):
+                    running += count
+                    cumulative[bound] = running
+                result.setdefault(name, {})[method] = {
+                    'calls': stats.calls,
+                    'valid': stats.valid,
+                    'invalid': stats.invalid,
+                    'failures': dict(stats.failures),
+                    'seconds': stats.seconds,
+                    'buckets': cumulative,
+                }
+        return result
+
+    def to_prometheus(self, prefix: str = 'validbr') -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        data = self.as_dict()
+        lines = [
+            f'# HELP {prefix}_calls_total Validator method calls.',
+            f'# TYPE {prefix}_calls_total counter',
+        ]
+        series = [(name, method, s) for name, methods in data.items() for method, s in methods.items()]
+        for name, method, s in series:
+            lines.append(f'{prefix}_calls_total{{validator="{name}",method="{method}"}} {s["calls"]}')
+
+        lines += [
+            f'# HELP {prefix}_results_total Values checked, by outcome.',
+            f'# TYPE {prefix}_results_total counter',
+        ]
+        for name, method, s in series:
+            if s['valid'] or s['invalid']:
+                for outcome in ('valid', 'invalid'):
+                    lines.append(
+                        f'{prefix}_results_total{{validator="{name}",method="{method}",'
+                        f'result="{outcome}"}} {s[outcome]}'
+                    )
+
+        lines += [
+            f'# HELP {prefix}_failures_total Invalid values, by failure reason.',
+            f'# TYPE {prefix}_failures_total counter',
+        ]
+        for name, method, s in series:
+            for reason, count in sorted(s['failures'].items()):
+                lines.append(
+                    f'{prefix}_failures_total{{validator="{name}",method="{method}",'
+                    f'reason="{reason}"}} {count}'
+                )
+
+        lines += [
+            f'# HELP {prefix}_duration_seconds Time spent per call.',
+            f'# TYPE {prefix}_duration_seconds histogram',
+        ]
+        for name, method, s in series:
+            labels = f'validator="{name}",method="{method}"'
+            for bound, count in s['buckets'].items():
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{prefix}_duration_seconds_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f'{prefix}_duration_seconds_sum{{{labels}}} {s["seconds"]!r}')
+            lines.append(f'{prefix}_duration_seconds_count{{{labels}}} {s["calls"]}')
+        return '\n'.join(lines) + '\n'
+
+
+def install(validbr, metrics: Metrics, validators, methods) -> None:
+    """Wrap ``methods`` of each of ``validators`` on ``validbr``."""
+    for name in validators:
+        validator = getattr(validbr, name)
+        for method in methods:
+            func = getattr(validator, method, None)
+            if callable(func):
+                setattr(validator, method, metrics.wrap(name, method, validator, func))
+
+
+def uninstall(validbr, validators, methods) -> None:
+    """Undo ``install``, putting back whatever the methods were before."""
+    for name in validators:
+        validator = validbr.__dict__.get(name)
+        if validator is None:
+            continue
+        for method in methods:
+            restore = getattr(validator.__dict__.get(method), '_restore', None)
+            if restore is None:
+                continue
+            if restore is _MISSING:
+                del validator.__dict__[method]
+            else:
+                validator.__dict__[method] = restore
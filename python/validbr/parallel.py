@@ -0,0 +1,148 @@
+"""Multi-process validation for large datasets.
+
+Inputs are split into chunks and shipped to a pool of worker processes.
+Each worker builds its own ``ValidBR`` once, when it starts, and reuses it
+for every chunk it receives; results come back in input order.
+
+Example::
+
+    from validbr.parallel import ParallelValidator
+
+    with ParallelValidator(max_workers=8, chunk_size=20000) as pool:
+        cpf_ok = pool.map('cpf.is_valid', cpfs)
+        ie_ok = pool.map('ie.is_valid', ies, states)
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# Per-process state, filled in by ``_init_worker``.
+_worker_validbr = None
+_worker_methods = {}
+
+
+def _init_worker() -> None:
+    global _worker_validbr
+    from . import ValidBR
+    _worker_validbr = ValidBR()
+    _worker_methods.clear()
+
+
+def _resolve(method: str):
+    func = _worker_methods.get(method)
+    if func is None:
+        func = _worker_validbr
+        for attr in method.split('.'):
+            func = getattr(func, attr)
+        _worker_methods[method] = func
+    return func
+
+
+def _run_chunk(method: str, chunk: List, vectorize: bool) -> List:
+    if _worker_validbr is None:
+        _init_worker()
+    func = _resolve(method)
+    if isinstance(chunk, tuple):
+        # Several argument columns, e.g. ('ie.is_valid', ies, states).
+        return [func(*args) for args in zip(*chunk)]
+    if vectorize and method.endswith('.is_valid'):
+        is_valid_many = getattr(func.__self__, 'is_valid_many', None)
+        if is_valid_many is not None:
+            try:
+                return is_valid_many(chunk).tolist()
+            except ImportError:
+                pass
+    return [func(value) for value in chunk]
+
+
+def _run_call(method: str, args: tuple, kwargs: dict):
+    # One plain call in a worker, used by ``validbr.aio`` with process pools.
+    if _worker_validbr is None:
+        _init_worker()
+    result = _resolve(method)(*args, **kwargs)
+    # Generators (e.g. ``validate_records``) cannot be sent back.
+    return list(result) if isinstance(result, Iterator) else result
+
+
+def _resolve_method_name(method) -> str:
+    if isinstance(method, str):
+        return method
+    # Accept a bound validator method, e.g. ``validbr.cpf.is_valid``.
+    from . import VALIDATORS
+    owner_class = type(getattr(method, '__self__', None)).__name__
+    for name, (_, class_name) in VALIDATORS.items():
+        if class_name == owner_class:
+            return f'{name}.{method.__name__}'
+    raise ValueError(f'Cannot run {method!r} in worker processes; pass its name, e.g. "cpf.is_valid"')
+
+
+class ParallelValidator:
+    """Validate large batches across a reusable pool of worker processes."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        vectorize: bool = True,
+        mp_context=None,
+    ):
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.vectorize = vectorize
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=mp_context, initializer=_init_worker
+        )
+
+    def imap(self, method, values: Iterable, *args: Iterable, chunk_size: Optional[int] = None) -> Iterator:
+        """Lazily yield ``method(value, *args)`` for every value, in input order.
+
+        ``method`` is a ``ValidBR`` method name such as ``'cpf.is_valid'`` (or
+        the bound method itself); extra iterables are zipped with ``values``
+        and passed as further arguments and must be as long as ``values``
+        (``ValueError`` otherwise). At most two chunks per worker are in
+        flight, so arbitrarily long iterables can be streamed.
+        """
+        method = _resolve_method_name(method)
+        chunk_size = chunk_size or self.chunk_size
+        columns = [iter(values)] + [iter(arg) for arg in args]
+        pending = deque()
+        while True:
+            while len(pending) < self.max_workers * 2:
+                chunk = [list(islice(column, chunk_size)) for column in columns]
+                if len({len(column) for column in chunk}) > 1:
+                    for future in pending:
+                        future.cancel()
+                    raise ValueError('values and args must have the same length')
+                if not chunk[0]:
+                    break
+                payload = tuple(chunk) if args else chunk[0]
+                pending.append(self._executor.submit(_run_chunk, method, payload, self.vectorize))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+    def map(self, method, values: Iterable, *args: Iterable, chunk_size: Optional[int] = None) -> List:
+        """Like ``imap`` but returns all results as a list."""
+        return list(self.imap(method, values, *args, chunk_size=chunk_size))
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def validate_parallel(method, values: Iterable, *args: Iterable, max_workers: Optional[int] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> List:
+    """One-off helper: run ``method`` over ``values`` with a temporary pool."""
+    with ParallelValidator(max_workers=max_workers, chunk_size=chunk_size) as pool:
+        return pool.map(method, values, *args)
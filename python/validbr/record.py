@@ -0,0 +1,123 @@
+"""Whole-record validation: every field normalized once, checked once.
+
+A schema maps record keys to validator names, e.g.::
+
+    schema = {'nome': 'name', 'cpf': 'cpf', 'celular': 'phone',
+              'nascimento': 'birth_date', 'rg': 'rg', 'uf': 'uf'}
+
+The ``uf`` pseudo-validator checks the state code and supplies it to the
+``rg`` and ``ie`` fields of the same record.
+"""
+from typing import Dict, Iterable, Iterator
+
+from .cep_index import UFS
+
+
+def _digits(field_validator, value, *args) -> Dict:
+    clean = field_validator.remove_mask(value)
+    return {'value': clean, 'valid': field_validator.is_valid(clean, *args)}
+
+
+def _cpf(v, value, state) -> Dict:
+    result = _digits(v.cpf, value)
+    if result['valid']:
+        result['region'] = v.cpf.state_map[int(result['value'][8])]
+    return result
+
+
+def _phone(v, value, state) -> Dict:
+    result = _digits(v.phone, value)
+    if result['valid']:
+        clean = result['value']
+        result['ddd'] = clean[:2]
+        result['state'] = v.phone.ddd_map[clean[:2]]
+        result['mobile'] = len(clean) == 11
+    return result
+
+
+def _cep(v, value, state) -> Dict:
+    result = _digits(v.cep, value)
+    if result['valid']:
+        result['state'] = v.cep.index.get_state(result['value'])
+    return result
+
+
+def _email(v, value, state) -> Dict:
+    clean = v.email.sanitize(value)
+    result = {'value': clean, 'valid': v.email.is_valid(clean)}
+    if result['valid']:
+        result['domain'] = v.email.get_domain(clean)
+    return result
+
+
+def _name(v, value, state) -> Dict:
+    parsed = v.name.parse(value)
+    if parsed is None:
+        return {'value': v.name.sanitize(value), 'valid': False}
+    return {
+        'value': parsed['name'], 'valid': True, 'first_name': parsed['first_name'],
+        'last_name': parsed['last_name'], 'initials': parsed['initials'],
+    }
+
+
+def _birth_date(v, value, state) -> Dict:
+    date = v.birth_date.parse_date(value)
+    result = {'value': date.isoformat() if date else None, 'valid': v.birth_date.is_valid_date(date)}
+    if result['valid']:
+        result['age'] = v.birth_date.age_of(date)
+    return result
+
+
+def _uf(v, value, state) -> Dict:
+    clean = value.strip().upper() if isinstance(value, str) else None
+    return {'value': clean, 'valid': clean in UFS}
+
+
+FIELD_HANDLERS = {
+    'cpf': _cpf,
+    'cnpj': lambda v, value, state: _digits(v.cnpj, value),
+    'phone': _phone,
+    'email': _email,
+    'name': _name,
+    'birth_date': _birth_date,
+    'cep': _cep,
+    'rg': lambda v, value, state: _digits(v.rg, value, state),
+    'ie': lambda v, value, state: _digits(v.ie, value, state),
+    'cnh': lambda v, value, state: _digits(v.cnh, value),
+    'titulo_eleitor': lambda v, value, state: _digits(v.titulo_eleitor, value),
+    'uf': _uf,
+}
+
+
+def validate_record(validbr, schema: Dict[str, str], record: Dict) -> Dict:
+    """Validate ``record`` against ``schema``; see ``ValidBR.validate_record``."""
+    handlers = []
+    state = None
+    for field, name in schema.items():
+        handler = FIELD_HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f'Unknown validator: {name}')
+        if name == 'uf':
+            uf = _uf(validbr, record.get(field), None)
+            state = uf['value'] if uf['valid'] else None
+        handlers.append((field, name, handler))
+
+    fields = {}
+    errors = []
+    for field, name, handler in handlers:
+        value = record.get(field)
+        if value is None:
+            result = {'value': None, 'valid': False, 'missing': True}
+        else:
+            result = handler(validbr, value, state)
+        result['validator'] = name
+        fields[field] = result
+        if not result['valid']:
+            errors.append(field)
+    return {'valid': not errors, 'errors': errors, 'fields': fields}
+
+
+def validate_records(validbr, schema: Dict[str, str], records: Iterable[Dict]) -> Iterator[Dict]:
+    """Lazily validate every record of ``records`` with the same schema."""
+    for record in records:
+        yield validate_record(validbr, schema, record)
@@ -0,0 +1,129 @@
+"""Streaming validation of CSV and JSONL files.
+
+Rows are read lazily, validated in fixed-size chunks and written back out
+annotated with one ``<column>_valid`` field per checked column, so memory
+use depends on ``chunk_size`` and not on the size of the input.
+"""
+import csv
+import json
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+# Validators that take the row's state (UF) as a second argument.
+STATE_VALIDATORS = ('ie', 'rg')
+
+VALIDATOR_NAMES = (
+    'cpf', 'cnpj', 'phone', 'email', 'name', 'birth_date',
+    'cep', 'rg', 'ie', 'cnh', 'titulo_eleitor',
+)
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class ValidationSummary:
+    """Running valid/invalid counts for every checked column."""
+
+    def __init__(self):
+        self.rows = 0
+        self.columns = {}
+
+    def update(self, column: str, validator: str, results: List[bool]) -> None:
+        counts = self.columns.setdefault(
+            column, {'validator': validator, 'valid': 0, 'invalid': 0}
+        )
+        valid = sum(results)
+        counts['valid'] += valid
+        counts['invalid'] += len(results) - valid
+
+    def as_dict(self) -> Dict:
+        return {'rows': self.rows, 'columns': self.columns}
+
+
+def read_csv(file: TextIO, delimiter: str = ',') -> Iterator[Dict]:
+    """Yield the rows of a CSV file as dicts."""
+    return csv.DictReader(file, delimiter=delimiter)
+
+
+def read_jsonl(file: TextIO) -> Iterator[Dict]:
+    """Yield the objects of a JSON Lines file, skipping blank lines."""
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def write_csv(rows: Iterable[Dict], file: TextIO, delimiter: str = ',') -> None:
+    """Write dict rows as CSV, taking the header from the first row.
+
+    Later rows are written against that header: missing keys are left
+    empty and keys it does not have are dropped.
+    """
+    writer = None
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(
+                file, fieldnames=list(row), delimiter=delimiter, restval='', extrasaction='ignore',
+            )
+            writer.writeheader()
+        writer.writerow(row)
+
+
+def write_jsonl(rows: Iterable[Dict], file: TextIO) -> None:
+    """Write dict rows as JSON Lines."""
+    for row in rows:
+        file.write(json.dumps(row, ensure_ascii=False))
+        file.write('\n')
+
+
+def validate_stream(
+    rows: Iterable[Dict],
+    columns: Dict[str, str],
+    state_column: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    summary: Optional[ValidationSummary] = None,
+    validator=None,
+) -> Iterator[Dict]:
+    """Validate ``rows`` lazily, yielding each row annotated with the results.
+
+    ``columns`` maps a column name to a validator name (``'cpf'``,
+    ``'phone'``, ``'ie'``...). ``ie`` and ``rg`` read the UF from
+    ``state_column``. Pass a ``ValidationSummary`` to collect counts.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    if validator is None:
+        from . import validbr as validator
+    for column, name in columns.items():
+        if name not in VALIDATOR_NAMES:
+            raise ValueError(f'Unknown validator: {name}')
+        if name == 'ie' and not state_column:
+            raise ValueError('IE validation requires a state column')
+
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        states = [row.get(state_column) for row in chunk] if state_column else None
+        for column, name in columns.items():
+            values = [row.get(column) for row in chunk]
+            results = _validate_column(getattr(validator, name), name, values, states)
+            for row, result in zip(chunk, results):
+                row[f'{column}_valid'] = result
+            if summary is not None:
+                summary.update(column, name, results)
+        if summary is not None:
+            summary.rows += len(chunk)
+        yield from chunk
+
+
+def _validate_column(field_validator, name: str, values: List, states: Optional[List]) -> List[bool]:
+    if name in STATE_VALIDATORS:
+        states = states or [None] * len(values)
+        return [field_validator.is_valid(v, s) for v, s in zip(values, states)]
+    is_valid_many = getattr(field_validator, 'is_valid_many', None)
+    if is_valid_many is not None:
+        try:
+            return is_valid_many(values).tolist()
+        except ImportError:
+            pass
+    return [field_validator.is_valid(v) for v in values]
@@ -1,26 +1,140 @@
-from datetime import datetime
-from typing import Optional
+import time
+from datetime import date as Date, datetime, timedelta
+from typing import Callable, Optional, Union
+
+from .._batch import as_text_array, char_codes, require_numpy
+
+MAX_AGE = 130
+
+
+def _is_digits(text: str) -> bool:
+    return text.isdigit() and text.isascii()
+
 
 class BirthDateValidator:
+    """Birth date validator.
+
+    ``today`` fixes the reference date used for validity and ages: a
+    ``date``, or a callable returning one. By default the local date is
+    read once and reused until midnight, instead of on every call.
+    """
+
+    def __init__(self, today: Union[Date, Callable[[], Date], None] = None):
+        self.today = today
+        self._cached = None
+        self._cached_until = 0.0
+
+    def _reference(self):
+        """Return ``(today, oldest valid birth date)``."""
+        today = self.today
+        if today is None:
+            now = time.time()
+            if now >= self._cached_until:
+                day = Date.today()
+                midnight = datetime.combine(day + timedelta(days=1), datetime.min.time())
+                self._cached = (day, self._min_date(day))
+                self._cached_until = midnight.timestamp()
+            return self._cached
+        if callable(today):
+            today = today()
+        return today, self._min_date(today)
+
+    @staticmethod
+    def _min_date(today: Date) -> Date:
+        try:
+            return today.replace(year=today.year - MAX_AGE)
+        except ValueError:
+            # Feb 29 of a leap year: that day does not exist 130 years back.
+            return today.replace(year=today.year - MAX_AGE, day=28)
+
     def is_valid(self, birth_date: str) -> bool:
-        date = self.parse_date(birth_date)
+        return self.is_valid_date(self.parse_date(birth_date))
+
+    def is_valid_date(self, date) -> bool:
+        """``is_valid`` for a date already returned by ``parse_date``."""
         if not date:
             return False
-        today = datetime.today().date()
-        min_date = datetime(today.year - 130, today.month, today.day).date()
-        max_date = today
-        return min_date <= date <= max_date
+        today, min_date = self._reference()
+        return min_date <= date <= today
 
     def get_age(self, birth_date: str) -> Optional[int]:
-        if not self.is_valid(birth_date):
-            return None
         date = self.parse_date(birth_date)
-        today = datetime.today().date()
+        if not date:
+            return None
+        # One reference date for both the range check and the age.
+        today, min_date = self._reference()
+        if not min_date <= date <= today:
+            return None
+        return self._years(date, today)
+
+    def age_of(self, date) -> int:
+        """Age in full years today for a parsed birth date."""
+        return self._years(date, self._reference()[0])
+
+    @staticmethod
+    def _years(date, today) -> int:
         age = today.year - date.year
         if (today.month, today.day) < (date.month, date.day):
             age -= 1
         return age
 
+    def get_age_many(self, birth_dates):
+        """Ages of a whole column as a NumPy ``int16`` array (requires NumPy).
+
+        Invalid or out-of-range dates give ``-1``. Zero-padded ``YYYY-MM-DD``
+        and ``DD/MM/YYYY`` values are parsed with vectorized arithmetic;
+        anything else goes through ``parse_date`` one by one.
+        """
+        np = require_numpy()
+        arr = as_text_array(birth_dates)
+        today, min_date = self._reference()
+        year = np.zeros(len(arr), dtype=np.int32)
+        month = np.zeros(len(arr), dtype=np.int32)
+        day = np.zeros(len(arr), dtype=np.int32)
+        parsed = np.zeros(len(arr), dtype=bool)
+
+        codes = char_codes(arr)
+        if codes.shape[1] >= 10:
+            exact = codes[:, 10] == 0 if codes.shape[1] > 10 else np.ones(len(arr), dtype=bool)
+            values = codes[:, :10].astype(np.int32) - 48
+            is_digit = (values >= 0) & (values <= 9)
+
+            def number(cols):
+                total = np.zeros(len(arr), dtype=np.int32)
+                for col in cols:
+                    total = total * 10 + values[:, col]
+                return total
+
+            for sep, ycols, mcols, dcols in (
+                (ord('-'), (0, 1, 2, 3), (5, 6), (8, 9)),
+                (ord('/'), (6, 7, 8, 9), (3, 4), (0, 1)),
+            ):
+                seps = [c for c in range(10) if c not in ycols + mcols + dcols]
+                rows = exact & (codes[:, seps] == sep).all(axis=1)
+                rows &= is_digit[:, list(ycols + mcols + dcols)].all(axis=1)
+                year[rows] = number(ycols)[rows]
+                month[rows] = number(mcols)[rows]
+                day[rows] = number(dcols)[rows]
+                parsed |= rows
+
+        for i in np.flatnonzero(~parsed):
+            # Unpadded or otherwise unusual spellings.
+            value = arr[i]
+            date = self.parse_date(value.decode('ascii', 'ignore') if isinstance(value, bytes) else str(value))
+            if date is not None:
+                year[i], month[i], day[i] = date.year, date.month, date.day
+
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        days_in_month = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int32)
+        month_days = days_in_month[np.clip(month, 0, 12)] + (leap & (month == 2))
+        key = year * 10000 + month * 100 + day
+        valid = (month >= 1) & (month <= 12) & (day >= 1) & (day <= month_days) & (year >= 1)
+        valid &= (key >= min_date.year * 10000 + min_date.month * 100 + min_date.day)
+        valid &= (key <= today.year * 10000 + today.month * 100 + today.day)
+
+        age = today.year - year - ((month * 100 + day) > (today.month * 100 + today.day))
+        return np.where(valid, age, -1).astype(np.int16)
+
     def is_adult(self, birth_date: str) -> bool:
         age = self.get_age(birth_date)
         return age is not None and age >= 18
@@ -34,9 +148,9 @@ class BirthDateValidator:
         return age is not None and age < 18
 
     def format(self, birth_date: str, fmt: str = 'YYYY-MM-DD') -> Optional[str]:
-        if not self.is_valid(birth_date):
-            return None
         date = self.parse_date(birth_date)
+        if not self.is_valid_date(date):
+            return None
         if fmt == 'YYYY-MM-DD':
             return date.strftime('%Y-%m-%d')
         elif fmt == 'DD/MM/YYYY':
@@ -45,16 +159,27 @@ class BirthDateValidator:
             return date.strftime('%m/%d/%Y')
         return date.strftime('%Y-%m-%d')
 
-    def parse_date(self, date_str: str) -> Optional[datetime.date]:
+    def parse_date(self, date_str: str) -> Optional[Date]:
+        """Parse ``YYYY-MM-DD`` or ``DD/MM/YYYY`` (month and day may be unpadded)."""
         if not date_str or not isinstance(date_str, str):
             return None
+        if '-' in date_str:
+            parts = date_str.split('-')
+            if len(parts) != 3:
+                return None
+            year, month, day = parts
+        elif '/' in date_str:
+            parts = date_str.split('/')
+            if len(parts) != 3:
+                return None
+            day, month, year = parts
+        else:
+            return None
+        if len(year) != 4 or not 1 <= len(month) <= 2 or not 1 <= len(day) <= 2:
+            return None
+        if not (_is_digits(year) and _is_digits(month) and _is_digits(day)):
+            return None
         try:
-            if '-' in date_str:
-                return datetime.strptime(date_str, '%Y-%m-%d').date()
-            elif '/' in date_str:
-                parts = date_str.split('/')
-                if len(parts[2]) == 4:
-                    return datetime.strptime(date_str, '%d/%m/%Y').date()
-        except Exception:
-            return None
-        return None
\ No newline at end of file
+            return Date(int(year), int(month), int(day))
+        except ValueError:
+            return None
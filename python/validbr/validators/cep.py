@@ -1,13 +1,20 @@
-import re
-import requests
-from typing import Optional, Dict
+from typing import Optional, Dict, List
+
+from .._mask import mask_many
+from .._normalize import only_digits
+
+MASK_TEMPLATE = '#####-###'
+
 
 class CEPValidator:
+    _client = None
+    _index = None
+
     def is_valid(self, cep: str) -> bool:
         if not cep or not isinstance(cep, str):
             return False
         clean_cep = self.remove_mask(cep)
-        return bool(re.match(r'^\d{8}$', clean_cep))
+        return len(clean_cep) == 8
 
     def apply_mask(self, cep: str) -> str:
         if not cep or not isinstance(cep, str):
@@ -17,32 +24,56 @@ class CEPValidator:
             return cep
         return f'{clean_cep[:5]}-{clean_cep[5:]}'
 
+    def apply_mask_many(self, ceps, clean: bool = False, out=None, output=None):
+        """Batch ``apply_mask`` into fixed-width bytes; see ``CPFValidator.apply_mask_many``."""
+        return mask_many(ceps, {8: MASK_TEMPLATE}, clean=clean, out=out, output=output)
+
     def remove_mask(self, cep: str) -> str:
-        if not cep or not isinstance(cep, str):
-            return ''
-        return re.sub(r'\D', '', cep)
+        return only_digits(cep)
 
     def get_info(self, cep: str) -> Optional[Dict]:
         if not self.is_valid(cep):
             return None
-        clean_cep = self.remove_mask(cep)
-        try:
-            resp = requests.get(f'https://viacep.com.br/ws/{clean_cep}/json/')
-            data = resp.json()
-            if 'erro' in data:
-                return None
-            return data
-        except Exception:
-            return None
+        return self.client.lookup(self.remove_mask(cep))
+
+    async def get_info_many_async(self, ceps: List[str], concurrency: Optional[int] = None) -> List[Optional[Dict]]:
+        """Look up many CEPs concurrently; invalid ones resolve to ``None``."""
+        clean = [self.remove_mask(cep) if self.is_valid(cep) else None for cep in ceps]
+        found = await self.client.lookup_many_async([c for c in clean if c], concurrency)
+        results = iter(found)
+        return [next(results) if c else None for c in clean]
+
+    @property
+    def client(self):
+        """The ``CEPClient`` used by ``get_info``; assign one to customize it."""
+        if self._client is None:
+            from ..cep_client import CEPClient
+            self._client = CEPClient()
+        return self._client
+
+    @client.setter
+    def client(self, client) -> None:
+        self._client = client
 
     def get_state(self, cep: str) -> Optional[str]:
         if not self.is_valid(cep):
             return None
-        clean_cep = self.remove_mask(cep)
-        first_digit = int(clean_cep[0])
-        state_map = {
-            0: 'SP', 1: 'SP', 2: 'RJ', 3: 'ES', 4: 'MG', 5: 'BA',
-            6: 'CE, PE, AL, PB, RN', 7: 'DF, GO, TO, MT, MS, RO, AC',
-            8: 'PR, SC', 9: 'RS'
-        }
-        return state_map.get(first_digit)
\ No newline at end of file
+        return self.index.get_state(self.remove_mask(cep))
+
+    def get_city(self, cep: str) -> Optional[str]:
+        """City for a CEP, when the loaded range index has city-level data."""
+        if not self.is_valid(cep):
+            return None
+        return self.index.get_city(self.remove_mask(cep))
+
+    @property
+    def index(self):
+        """The offline ``CEPRangeIndex`` used by ``get_state``; assign one to customize it."""
+        if self._index is None:
+            from ..cep_index import CEPRangeIndex
+            self._index = CEPRangeIndex.default()
+        return self._index
+
+    @index.setter
+    def index(self, index) -> None:
+        self._index = index
@@ -1,13 +1,31 @@
-import re
 import random
 
+from .._batch import require_numpy
+from .._generate import generate_many, not_repeated
+from .._normalize import only_digits
+
+
+def _complete_many(base):
+    np = require_numpy()
+    values = base.astype(np.int32)
+    dv1 = (values @ np.arange(9, 0, -1, dtype=np.int32)) % 11
+    dsc = np.where(dv1 >= 10, 2, 0)
+    dv1 = np.where(dv1 >= 10, 0, dv1)
+    dv2 = (values @ np.arange(1, 10, dtype=np.int32)) % 11
+    dv2 = np.where(dv2 >= 10, 0, dv2) - dsc
+    dv2 = np.where(dv2 < 0, dv2 + 11, dv2)
+    digits = np.column_stack([base, dv1, dv2]).astype(np.uint8)
+    # A second check digit of 10 cannot be written as one digit.
+    return digits, (dv2 < 10) & not_repeated(np, digits)
+
+
 class CNHValidator:
     """Validador de CNH (Carteira Nacional de Habilitação)"""
     def is_valid(self, cnh: str) -> bool:
         if not cnh or not isinstance(cnh, str):
             return False
         clean = self.remove_mask(cnh)
-        if not re.match(r'^\d{11}$', clean):
+        if len(clean) != 11:
             return False
         if len(set(clean)) == 1:
             return False
@@ -28,9 +46,7 @@ class CNHValidator:
         return self.remove_mask(cnh)  # CNH não tem máscara oficial
 
     def remove_mask(self, cnh: str) -> str:
-        if not cnh or not isinstance(cnh, str):
-            return ''
-        return re.sub(r'\D', '', cnh)
+        return only_digits(cnh)
 
     def generate(self) -> str:
         while True:
@@ -46,6 +62,14 @@ class CNHValidator:
             if dv2 >= 10:
                 dv2 = 0
             dv2_final = dv2 - dsc if dv2 - dsc >= 0 else dv2 - dsc + 11
-            cnh = n + str(dv1) + str(dv2_final)
-            if self.is_valid(cnh):
-                return cnh
+            # Redraw when the second digit would be 10 or all digits repeat.
+            if dv2_final < 10 and len(set(n)) > 1:
+                return n + str(dv1) + str(dv2_final)
+
+    def generate_many(self, n: int, seed=None, unique: bool = False, output=None):
+        """Generate ``n`` valid CNHs in vectorized blocks (requires NumPy).
+
+        CNH has no official mask. See ``CPFValidator.generate_many`` for
+        ``seed``, ``unique`` and ``output``.
+        """
+        return generate_many(n, 9, _complete_many, seed=seed, unique=unique, output=output)
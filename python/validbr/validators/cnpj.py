@@ -1,10 +1,37 @@
 import random
-import re
 from typing import Optional
 
+from .._batch import require_numpy
+from .._codec import (
+    FAILURE_REASONS, INVALID_FIRST_DIGIT, INVALID_LENGTH, INVALID_SECOND_DIGIT, REPEATED_DIGITS,
+    VALID, decode, decode_many, encode_many, failure_reasons_many,
+)
+from .._generate import generate_many, mod11_check, not_repeated
+from .._mask import mask_many
+from .._normalize import only_digits
+
+FIRST_DIGIT_WEIGHTS = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+SECOND_DIGIT_WEIGHTS = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Weights for both check digits as one (14, 2) matrix used by the batch path.
+CHECK_DIGIT_WEIGHTS = tuple(
+    zip(FIRST_DIGIT_WEIGHTS + (0, 0), SECOND_DIGIT_WEIGHTS + (0,))
+)
+
+MASK_TEMPLATE = '##.###.###/####-##'
+
+
+def _complete_many(base):
+    np = require_numpy()
+    digits = np.column_stack([base, mod11_check(np, base, FIRST_DIGIT_WEIGHTS)])
+    digits = np.column_stack([digits, mod11_check(np, digits, SECOND_DIGIT_WEIGHTS)])
+    return digits, not_repeated(np, digits)
+
 
 class CNPJValidator:
     """CNPJ (Cadastro Nacional da Pessoa Jurídica) validator."""
+
+    failure_reasons = FAILURE_REASONS
     
     def __init__(self):
         self.state_map = {
@@ -22,56 +49,80 @@ class CNPJValidator:
 
     def is_valid(self, cnpj: str) -> bool:
         """Validate CNPJ format and check digits."""
+        return self.get_failure_reason(cnpj) == VALID
+
+    def get_failure_reason(self, cnpj: str) -> int:
+        """Return the failure reason code for a CNPJ (``VALID`` when it passes)."""
         if not cnpj or not isinstance(cnpj, str):
-            return False
+            return INVALID_LENGTH
         
         clean_cnpj = self.remove_mask(cnpj)
         
         # Check if it has 14 digits
         if len(clean_cnpj) != 14:
-            return False
+            return INVALID_LENGTH
         
         # Check if all digits are the same
         if len(set(clean_cnpj)) == 1:
-            return False
+            return REPEATED_DIGITS
         
         # Validate first check digit
-        weights1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_val = sum(int(clean_cnpj[i]) * weights1[i] for i in range(12))
+        sum_val = sum(int(clean_cnpj[i]) * FIRST_DIGIT_WEIGHTS[i] for i in range(12))
         remainder = sum_val % 11
         first_digit = 0 if remainder < 2 else 11 - remainder
         
         if int(clean_cnpj[12]) != first_digit:
-            return False
+            return INVALID_FIRST_DIGIT
         
         # Validate second check digit
-        weights2 = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_val = sum(int(clean_cnpj[i]) * weights2[i] for i in range(13))
+        sum_val = sum(int(clean_cnpj[i]) * SECOND_DIGIT_WEIGHTS[i] for i in range(13))
         remainder = sum_val % 11
         second_digit = 0 if remainder < 2 else 11 - remainder
         
-        return int(clean_cnpj[13]) == second_digit
+        if int(clean_cnpj[13]) != second_digit:
+            return INVALID_SECOND_DIGIT
+        return VALID
+
+    def is_valid_many(self, cnpjs):
+        """Validate many CNPJs at once, returning a NumPy boolean mask."""
+        return self.get_failure_reason_many(cnpjs) == VALID
+
+    def get_failure_reason_many(self, cnpjs):
+        """Return a ``uint8`` array with the failure reason code of every CNPJ.
+
+        Accepts any iterable of strings or a NumPy ``U``/``S`` array; each code
+        matches what ``get_failure_reason`` returns for the same item.
+        """
+        return failure_reasons_many(cnpjs, 14, CHECK_DIGIT_WEIGHTS)
 
     def generate(self) -> str:
         """Generate a valid CNPJ."""
         digits = [random.randint(0, 9) for _ in range(12)]
         
         # Calculate first check digit
-        weights1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_val = sum(digits[i] * weights1[i] for i in range(12))
+        sum_val = sum(digits[i] * FIRST_DIGIT_WEIGHTS[i] for i in range(12))
         remainder = sum_val % 11
         first_digit = 0 if remainder < 2 else 11 - remainder
         digits.append(first_digit)
         
         # Calculate second check digit
-        weights2 = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_val = sum(digits[i] * weights2[i] for i in range(13))
+        sum_val = sum(digits[i] * SECOND_DIGIT_WEIGHTS[i] for i in range(13))
         remainder = sum_val % 11
         second_digit = 0 if remainder < 2 else 11 - remainder
         digits.append(second_digit)
         
         return self.apply_mask(''.join(map(str, digits)))
 
+    def generate_many(self, n: int, seed=None, masked: bool = True, unique: bool = False, output=None):
+        """Generate ``n`` valid CNPJs in vectorized blocks (requires NumPy).
+
+        See ``CPFValidator.generate_many`` for ``seed``, ``unique`` and ``output``.
+        """
+        return generate_many(
+            n, 12, _complete_many, seed=seed, template=MASK_TEMPLATE if masked else None,
+            unique=unique, output=output,
+        )
+
     def apply_mask(self, cnpj: str) -> str:
         """Apply CNPJ mask (00.000.000/0000-00)."""
         if not cnpj or not isinstance(cnpj, str):
@@ -83,11 +134,32 @@ class CNPJValidator:
         
         return f"{clean_cnpj[:2]}.{clean_cnpj[2:5]}.{clean_cnpj[5:8]}/{clean_cnpj[8:12]}-{clean_cnpj[12:]}"
 
+    def to_int(self, cnpj: str) -> int:
+        """Compact integer key of a valid CNPJ (its 12 base digits); see ``CPFValidator.to_int``."""
+        if not self.is_valid(cnpj):
+            raise ValueError(f'Invalid CNPJ: {cnpj!r}')
+        return int(self.remove_mask(cnpj)[:12])
+
+    def from_int(self, key: int, masked: bool = True) -> str:
+        """Inverse of ``to_int``; raises ``ValueError`` if ``key`` is no valid CNPJ."""
+        digits = decode(key, 12, FIRST_DIGIT_WEIGHTS, SECOND_DIGIT_WEIGHTS)
+        return self.apply_mask(digits) if masked else digits
+
+    def to_int_many(self, cnpjs):
+        """Batch ``to_int`` as ``uint64``, ``INVALID_KEY`` for invalid CNPJs (requires NumPy)."""
+        return encode_many(cnpjs, 14, 12, _complete_many)
+
+    def from_int_many(self, keys, masked: bool = True):
+        """Batch ``from_int``: a NumPy ``U`` array, ``''`` for invalid keys."""
+        return decode_many(keys, 12, _complete_many, MASK_TEMPLATE if masked else None)
+
+    def apply_mask_many(self, cnpjs, clean: bool = False, out=None, output=None):
+        """Batch ``apply_mask`` into fixed-width bytes; see ``CPFValidator.apply_mask_many``."""
+        return mask_many(cnpjs, {14: MASK_TEMPLATE}, clean=clean, out=out, output=output)
+
     def remove_mask(self, cnpj: str) -> str:
         """Remove CNPJ mask."""
-        if not cnpj or not isinstance(cnpj, str):
-            return ""
-        return re.sub(r'\D', '', cnpj)
+        return only_digits(cnpj)
 
     def get_state(self, cnpj: str) -> Optional[str]:
         """Get state from CNPJ first two digits."""
@@ -1,10 +1,38 @@
 import random
-import re
 from typing import Optional
 
+from .._batch import as_text_array, extract_digits, require_numpy
+from .._codec import (
+    FAILURE_REASONS, INVALID_FIRST_DIGIT, INVALID_LENGTH, INVALID_SECOND_DIGIT, REPEATED_DIGITS,
+    VALID, decode, decode_many, encode_many, failure_reasons_many,
+)
+from .._generate import generate_many, mod11_check, not_repeated
+from .._mask import mask_many
+from .._normalize import only_digits
+
+FIRST_DIGIT_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+SECOND_DIGIT_WEIGHTS = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Weights for both check digits as one (11, 2) matrix: the first column
+# computes DV1 over digits 1-9, the second DV2 over digits 1-10.
+CHECK_DIGIT_WEIGHTS = tuple(
+    zip(FIRST_DIGIT_WEIGHTS + (0, 0), SECOND_DIGIT_WEIGHTS + (0,))
+)
+
+MASK_TEMPLATE = '###.###.###-##'
+
+
+def _complete_many(base):
+    np = require_numpy()
+    digits = np.column_stack([base, mod11_check(np, base, FIRST_DIGIT_WEIGHTS)])
+    digits = np.column_stack([digits, mod11_check(np, digits, SECOND_DIGIT_WEIGHTS)])
+    return digits, not_repeated(np, digits)
+
 
 class CPFValidator:
     """CPF (Cadastro de Pessoas Físicas) validator."""
+
+    failure_reasons = FAILURE_REASONS
     
     def __init__(self):
         self.state_map = {
@@ -50,6 +78,69 @@ class CPFValidator:
         
         return int(clean_cpf[10]) == second_digit
 
+    def get_failure_reason(self, cpf: str) -> int:
+        """Return the failure reason code for a CPF (``VALID`` when it passes).
+
+        Kept apart from ``is_valid`` so the hot path does not pay for it.
+        """
+        if not cpf or not isinstance(cpf, str):
+            return INVALID_LENGTH
+        
+        clean_cpf = self.remove_mask(cpf)
+        
+        # Check if it has 11 digits
+        if len(clean_cpf) != 11:
+            return INVALID_LENGTH
+        
+        # Check if all digits are the same
+        if len(set(clean_cpf)) == 1:
+            return REPEATED_DIGITS
+        
+        # Validate first check digit
+        sum_val = sum(int(clean_cpf[i]) * (10 - i) for i in range(9))
+        remainder = sum_val % 11
+        first_digit = 0 if remainder < 2 else 11 - remainder
+        
+        if int(clean_cpf[9]) != first_digit:
+            return INVALID_FIRST_DIGIT
+        
+        # Validate second check digit
+        sum_val = sum(int(clean_cpf[i]) * (11 - i) for i in range(10))
+        remainder = sum_val % 11
+        second_digit = 0 if remainder < 2 else 11 - remainder
+        
+        if int(clean_cpf[10]) != second_digit:
+            return INVALID_SECOND_DIGIT
+        return VALID
+
+    def is_valid_many(self, cpfs):
+        """Validate many CPFs at once, returning a NumPy boolean mask.
+
+        Accepts any iterable of strings or a NumPy ``U``/``S`` array and gives
+        the same answer as ``is_valid`` for every item.
+        """
+        np = require_numpy()
+        arr = as_text_array(cpfs)
+        digits, rows = extract_digits(arr, 11)
+
+        sums = digits.astype(np.int32) @ np.array(CHECK_DIGIT_WEIGHTS, dtype=np.int32)
+        remainder = sums % 11
+        expected = np.where(remainder < 2, 0, 11 - remainder)
+        valid = (expected == digits[:, 9:]).all(axis=1)
+        valid &= (digits != digits[:, :1]).any(axis=1)
+
+        result = np.zeros(len(arr), dtype=bool)
+        result[rows] = valid
+        return result
+
+    def get_failure_reason_many(self, cpfs):
+        """Return a ``uint8`` array with the failure reason code of every CPF.
+
+        Accepts any iterable of strings or a NumPy ``U``/``S`` array; each code
+        matches what ``get_failure_reason`` returns for the same item.
+        """
+        return failure_reasons_many(cpfs, 11, CHECK_DIGIT_WEIGHTS)
+
     def generate(self) -> str:
         """Generate a valid CPF."""
         digits = [random.randint(0, 9) for _ in range(9)]
@@ -68,6 +159,25 @@ class CPFValidator:
         
         return self.apply_mask(''.join(map(str, digits)))
 
+    def generate_many(self, n: int, seed=None, masked: bool = True, unique: bool = False,
+                      region: Optional[int] = None, output=None):
+        """Generate ``n`` valid CPFs in vectorized blocks (requires NumPy).
+
+        ``seed`` makes the output reproducible, ``unique`` guarantees no
+        repeats and ``region`` pins the fiscal-region (ninth) digit. With
+        ``output`` (a path or binary file) CPFs are streamed one per line
+        and the count is returned; otherwise a list is returned.
+        """
+        fixed = None
+        if region is not None:
+            if region not in self.state_map:
+                raise ValueError(f'Invalid CPF region: {region}')
+            fixed = {8: region}
+        return generate_many(
+            n, 9, _complete_many, seed=seed, template=MASK_TEMPLATE if masked else None,
+            unique=unique, fixed=fixed, output=output,
+        )
+
     def apply_mask(self, cpf: str) -> str:
         """Apply CPF mask (000.000.000-00)."""
         if not cpf or not isinstance(cpf, str):
@@ -79,22 +189,51 @@ class CPFValidator:
         
         return f"{clean_cpf[:3]}.{clean_cpf[3:6]}.{clean_cpf[6:9]}-{clean_cpf[9:]}"
 
+    def to_int(self, cpf: str) -> int:
+        """Compact integer key of a valid CPF: its 9 base digits as a number.
+
+        The check digits are implied, so ``from_int`` restores the exact
+        ``apply_mask`` output. Raises ``ValueError`` for invalid CPFs.
+        """
+        if not self.is_valid(cpf):
+            raise ValueError(f'Invalid CPF: {cpf!r}')
+        return int(self.remove_mask(cpf)[:9])
+
+    def from_int(self, key: int, masked: bool = True) -> str:
+        """Inverse of ``to_int``; raises ``ValueError`` if ``key`` is no valid CPF."""
+        digits = decode(key, 9, FIRST_DIGIT_WEIGHTS, SECOND_DIGIT_WEIGHTS)
+        return self.apply_mask(digits) if masked else digits
+
+    def to_int_many(self, cpfs):
+        """Batch ``to_int``: a NumPy ``uint64`` array (requires NumPy).
+
+        Invalid CPFs get ``validbr._codec.INVALID_KEY`` instead of raising.
+        """
+        return encode_many(cpfs, 11, 9, _complete_many)
+
+    def from_int_many(self, keys, masked: bool = True):
+        """Batch ``from_int``: a NumPy ``U`` array, ``''`` for invalid keys."""
+        return decode_many(keys, 9, _complete_many, MASK_TEMPLATE if masked else None)
+
+    def apply_mask_many(self, cpfs, clean: bool = False, out=None, output=None):
+        """Format many CPFs at once into fixed-width ASCII (requires NumPy).
+
+        Returns an ``S14`` array, or fills ``out``: a NumPy ``S`` array of the
+        same length, or a writable buffer (``bytearray``, ``mmap``...) laid
+        out as 14-byte records. With ``output`` (a path or binary file) the
+        CPFs are streamed one per line in blocks and the count is returned.
+        ``clean=True`` skips mask stripping for input that is digits only.
+        Rows without exactly 11 digits are left empty (NUL bytes) instead
+        of being copied through as ``apply_mask`` does.
+        """
+        return mask_many(cpfs, {11: MASK_TEMPLATE}, clean=clean, out=out, output=output)
+
     def remove_mask(self, cpf: str) -> str:
         """Remove CPF mask."""
-        if not cpf or not isinstance(cpf, str):
-            return ""
-        return re.sub(r'\D', '', cpf)
+        return only_digits(cpf)
 
     def get_state(self, cpf: str) -> Optional[str]:
-        """Get state from CPF first two digits."""
+        """Get the states of the CPF's fiscal region (its ninth digit)."""
         if not self.is_valid(cpf):
             return None
-        
-        clean_cpf = self.remove_mask(cpf)
-        first_two_digits = int(clean_cpf[:2])
-        
-        for range_start, states in self.state_map.items():
-            if range_start * 10 <= first_two_digits <= range_start * 10 + 9:
-                return states
-        
-        return None 
\ No newline at end of file
+        return self.state_map[int(self.remove_mask(cpf)[8])]
@@ -1,19 +1,95 @@
 import re
-from typing import Optional
+from typing import Iterable, Optional
+
+from .._batch import require_numpy
+
+# The address is split on its single '@' and each side matched on its own,
+# which is equivalent to the former whole-address pattern.
+LOCAL_PART_RE = re.compile(r"[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+")
+DOMAIN_RE = re.compile(
+    r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*"
+)
+
+DEFAULT_TLDS = frozenset(['com', 'com.br', 'br', 'net', 'org', 'edu', 'gov'])
+
+BRAZILIAN_PROVIDERS = frozenset([
+    'gmail.com', 'hotmail.com', 'outlook.com', 'yahoo.com',
+    'uol.com.br', 'bol.com.br', 'ig.com.br', 'terra.com.br',
+    'globo.com', 'oi.com.br',
+])
+
+DEFAULT_DOMAIN_CACHE_SIZE = 100000
+
 
 class EmailValidator:
+    """E-mail validator.
+
+    ``tlds`` are the accepted domain suffixes, without the leading dot
+    (``'com.br'`` accepts ``x.com.br``). The verdict for each domain is
+    memoized, since real lists repeat a few domains over and over; at most
+    ``domain_cache_size`` domains are kept.
+    """
+
+    def __init__(self, tlds: Optional[Iterable[str]] = None,
+                 domain_cache_size: int = DEFAULT_DOMAIN_CACHE_SIZE):
+        self.domain_cache_size = domain_cache_size
+        self.valid_tlds = DEFAULT_TLDS if tlds is None else tlds
+
+    @property
+    def valid_tlds(self) -> frozenset:
+        return self._tlds
+
+    @valid_tlds.setter
+    def valid_tlds(self, tlds: Iterable[str]) -> None:
+        self._tlds = frozenset(tld.lower().lstrip('.') for tld in tlds)
+        self._domains = {}
+
     def is_valid(self, email: str) -> bool:
         if not email or not isinstance(email, str):
             return False
-        clean_email = self.sanitize(email)
-        email_regex = re.compile(r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$")
-        if not email_regex.match(clean_email):
-            return False
-        domain = self.get_domain(clean_email)
-        if not domain:
-            return False
-        valid_tlds = ['.com', '.com.br', '.br', '.net', '.org', '.edu', '.gov']
-        return any(domain.endswith(tld) for tld in valid_tlds)
+        local, _, domain = self.sanitize(email).partition('@')
+        return self.is_valid_domain(domain) and LOCAL_PART_RE.fullmatch(local) is not None
+
+    def is_valid_domain(self, domain: str) -> bool:
+        """Whether ``domain`` is well formed and ends with an accepted TLD (memoized)."""
+        verdict = self._domains.get(domain)
+        if verdict is None:
+            verdict = DOMAIN_RE.fullmatch(domain) is not None and self._has_valid_tld(domain)
+            if len(self._domains) >= self.domain_cache_size:
+                # Cheaper than LRU bookkeeping on every hit; hot domains come back quickly.
+                self._domains.clear()
+            self._domains[domain] = verdict
+        return verdict
+
+    def _has_valid_tld(self, domain: str) -> bool:
+        tlds = self._tlds
+        _, dot, suffix = domain.partition('.')
+        while dot:
+            if suffix in tlds:
+                return True
+            _, dot, suffix = suffix.partition('.')
+        return False
+
+    def is_valid_many(self, emails):
+        """Validate many addresses, returning a NumPy boolean mask (requires NumPy).
+
+        Addresses are grouped by domain so each distinct domain is checked
+        once; only the local parts of addresses on valid domains are matched.
+        """
+        np = require_numpy()
+        emails = list(emails)
+        result = np.zeros(len(emails), dtype=bool)
+        by_domain = {}
+        for i, email in enumerate(emails):
+            if email and isinstance(email, str):
+                local, _, domain = email.strip().lower().partition('@')
+                by_domain.setdefault(domain, []).append((i, local))
+        match = LOCAL_PART_RE.fullmatch
+        for domain, items in by_domain.items():
+            if self.is_valid_domain(domain):
+                for i, local in items:
+                    result[i] = match(local) is not None
+        return result
 
     def sanitize(self, email: str) -> str:
         if not email or not isinstance(email, str):
@@ -34,9 +110,4 @@ class EmailValidator:
         domain = self.get_domain(email)
         if not domain:
             return False
-        brazilian_providers = [
-            'gmail.com', 'hotmail.com', 'outlook.com', 'yahoo.com',
-            'uol.com.br', 'bol.com.br', 'ig.com.br', 'terra.com.br',
-            'globo.com', 'oi.com.br'
-        ]
-        return domain in brazilian_providers
\ No newline at end of file
+        return domain in BRAZILIAN_PROVIDERS
@@ -1,92 +1,359 @@
-from typing import Optional
+import random
+from collections import namedtuple
+from typing import Dict, List, Optional
+
+from .._batch import as_text_array, require_numpy, scan_digits, take_digits
+from .._generate import generate_many
+from .._normalize import only_digits
+
+# Check digit formulas. Each receives the weighted sum and the digits (a list
+# of ints, or a list of NumPy columns in batch mode) and only uses arithmetic
+# and comparisons, so the same rule table drives both paths.
+
+
+def _mod11(total, digits):
+    r = total % 11
+    return (11 - r) * (r >= 2)
+
+
+def _mod11_minus10(total, digits):
+    # 11 - r, minus 10 when that is 10 or 11 (RO, old PE).
+    return (11 - total % 11) % 10
+
+
+def _mod11_times10(total, digits):
+    # (sum * 10) mod 11, 10 becomes 0 (AL, RN).
+    return total * 10 % 11 % 10
+
+
+def _mod11_remainder(total, digits):
+    # Rightmost digit of the remainder (SP).
+    return total % 11 % 10
+
+
+def _mod10(total, digits):
+    return (10 - total % 10) % 10
+
+
+def _mod9(total, digits):
+    return total % 9
+
+
+def _number(digits, count):
+    value = 0
+    for i in range(count):
+        value = value * 10 + digits[i]
+    return value
+
+
+def _amapa(total, digits):
+    number = _number(digits, 8)
+    low = number <= 3017000
+    mid = (number >= 3017001) & (number <= 3019022)
+    dv = 11 - (total + 5 * low + 9 * mid) % 11
+    return dv * (dv < 10) + mid * (dv == 11)
+
+
+def _bahia(total, digits):
+    # Mod 10 unless the selector digit (first for 8 digits, second for 9) is 6, 7 or 9.
+    selector = digits[1] if len(digits) == 9 else digits[0]
+    eleven = (selector == 6) | (selector == 7) | (selector == 9)
+    return eleven * _mod11(total, digits) + (1 - eleven) * _mod10(total, digits)
+
+
+def _goias(total, digits):
+    r = total % 11
+    number = _number(digits, 8)
+    special = (number >= 10103105) & (number <= 10119997)
+    return (11 - r) * (r >= 2) + (r == 1) * special
+
+
+def _tocantins_type(digits):
+    kind = digits[2] * 10 + digits[3]
+    return (kind == 1) | (kind == 2) | (kind == 3) | (kind == 99)
+
+
+IEFormat = namedtuple('IEFormat', 'length prefixes checks constraint')
+IEFormat.__new__.__defaults__ = (None,)
+
+CheckDigit = namedtuple('CheckDigit', 'target terms method digit_sum')
+
+
+def _dv(target, weights, method, positions=None, digit_sum=False):
+    """Compile one check digit: ``digits[target] == method(sum(d[p] * w))``."""
+    positions = positions or range(len(weights))
+    return CheckDigit(target, tuple(zip(positions, weights)), method, digit_sum)
+
+
+def _desc(first, last=2):
+    return tuple(range(first, last - 1, -1))
+
+
+def _simple9(prefixes=()):
+    return IEFormat(9, prefixes, (_dv(8, _desc(9), _mod11),))
+
+
+_DF_AC_CHECKS = (
+    _dv(11, (4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), _mod11),
+    _dv(12, (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), _mod11),
+)
+
+# One entry per UF, following the SINTEGRA algorithms. Check digits are
+# listed in the order they must be computed (BA computes its last digit first).
+IE_RULES = {
+    'AC': (IEFormat(13, ('01',), _DF_AC_CHECKS),),
+    'AL': (IEFormat(9, ('24',), (_dv(8, _desc(9), _mod11_times10),)),),
+    'AP': (IEFormat(9, ('03',), (_dv(8, _desc(9), _amapa),)),),
+    'AM': (_simple9(),),
+    'BA': (
+        IEFormat(8, (), (
+            _dv(7, _desc(7), _bahia),
+            _dv(6, _desc(8), _bahia, positions=(0, 1, 2, 3, 4, 5, 7)),
+        )),
+        IEFormat(9, (), (
+            _dv(8, _desc(8), _bahia),
+            _dv(7, _desc(9), _bahia, positions=(0, 1, 2, 3, 4, 5, 6, 8)),
+        )),
+    ),
+    'CE': (_simple9(),),
+    'DF': (IEFormat(13, ('07',), _DF_AC_CHECKS),),
+    'ES': (_simple9(),),
+    'GO': (IEFormat(9, ('10', '11', '15') + tuple(str(p) for p in range(20, 30)), (
+        _dv(8, _desc(9), _goias),
+    )),),
+    'MA': (_simple9(('12',)),),
+    'MG': (IEFormat(13, (), (
+        # Weights 1, 2, 1, 2... after inserting a 0 behind the municipality
+        # code, adding the digits of each product.
+        _dv(11, (1, 2, 1, 1, 2, 1, 2, 1, 2, 1, 2), _mod10, digit_sum=True),
+        _dv(12, (3, 2, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2), _mod11),
+    )),),
+    'MS': (_simple9(('28', '50')),),
+    'MT': (IEFormat(11, (), (_dv(10, (3, 2, 9, 8, 7, 6, 5, 4, 3, 2), _mod11),)),),
+    'PA': (_simple9(('15',)),),
+    'PB': (_simple9(),),
+    'PE': (
+        IEFormat(9, (), (_dv(7, _desc(8), _mod11), _dv(8, _desc(9), _mod11))),
+        IEFormat(14, (), (_dv(13, (5, 4, 3, 2, 1, 9, 8, 7, 6, 5, 4, 3, 2), _mod11_minus10),)),
+    ),
+    'PI': (_simple9(),),
+    'PR': (IEFormat(10, (), (
+        _dv(8, (3, 2, 7, 6, 5, 4, 3, 2), _mod11),
+        _dv(9, (4, 3, 2, 7, 6, 5, 4, 3, 2), _mod11),
+    )),),
+    'RJ': (IEFormat(8, (), (_dv(7, (2, 7, 6, 5, 4, 3, 2), _mod11),)),),
+    'RN': (
+        IEFormat(9, ('20',), (_dv(8, _desc(9), _mod11_times10),)),
+        IEFormat(10, ('20',), (_dv(9, _desc(10), _mod11_times10),)),
+    ),
+    'RO': (
+        IEFormat(14, (), (_dv(13, (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), _mod11_minus10),)),
+        IEFormat(9, (), (_dv(8, _desc(6), _mod11_minus10, positions=(3, 4, 5, 6, 7)),)),
+    ),
+    'RR': (IEFormat(9, ('24',), (_dv(8, (1, 2, 3, 4, 5, 6, 7, 8), _mod9),)),),
+    'RS': (IEFormat(10, (), (_dv(9, (2, 9, 8, 7, 6, 5, 4, 3, 2), _mod11),)),),
+    'SC': (_simple9(),),
+    'SE': (_simple9(),),
+    'SP': (IEFormat(12, (), (
+        _dv(8, (1, 3, 4, 5, 6, 7, 8, 10), _mod11_remainder),
+        _dv(11, (3, 2, 10, 9, 8, 7, 6, 5, 4, 3, 2), _mod11_remainder),
+    )),),
+    'TO': (
+        _simple9(),
+        IEFormat(11, (), (
+            _dv(10, _desc(9), _mod11, positions=(0, 1, 4, 5, 6, 7, 8, 9)),
+        ), _tocantins_type),
+    ),
+}
+
+# SP rural producers: 'P' followed by 12 digits, one check digit.
+SP_RURAL_FORMAT = IEFormat(12, ('0',), (_dv(8, (1, 3, 4, 5, 6, 7, 8, 10), _mod11_remainder),))
+
+# Compiled lookup: state -> {length: format}.
+_FORMATS = {state: {f.length: f for f in formats} for state, formats in IE_RULES.items()}
+
+
+def _weighted_sum(check, digits):
+    total = 0
+    for position, weight in check.terms:
+        product = digits[position] * weight
+        if check.digit_sum:
+            product = product - 9 * (product >= 10)
+        total = total + product
+    return total
+
+
+def _matches(fmt, digits):
+    """Whether ``digits`` satisfies every check digit (and constraint) of ``fmt``."""
+    ok = fmt.constraint(digits) if fmt.constraint else True
+    for check in fmt.checks:
+        ok = ok & (check.method(_weighted_sum(check, digits), digits) == digits[check.target])
+    return ok
+
+
+def _fill_check_digits(fmt, digits) -> None:
+    """Compute the check digits of ``digits`` in place."""
+    for check in fmt.checks:
+        digits[check.target] = check.method(_weighted_sum(check, digits), digits)
+
 
 class IEValidator:
-    state_weights = {
-        'AC': [4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2],
-        'AL': [9, 8, 7, 6, 5, 4, 3, 2],
-        'AP': [9, 8, 7, 6, 5, 4, 3, 2],
-        'AM': [9, 8, 7, 6, 5, 4, 3, 2],
-        'BA': [9, 8, 7, 6, 5, 4, 3, 2],
-        'CE': [9, 8, 7, 6, 5, 4, 3, 2],
-        'DF': [4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2],
-        'ES': [9, 8, 7, 6, 5, 4, 3, 2],
-        'GO': [9, 8, 7, 6, 5, 4, 3, 2],
-        'MA': [9, 8, 7, 6, 5, 4, 3, 2],
-        'MG': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
-        'MS': [9, 8, 7, 6, 5, 4, 3, 2],
-        'MT': [3, 2, 9, 8, 7, 6, 5, 4, 3, 2],
-        'PA': [9, 8, 7, 6, 5, 4, 3, 2],
-        'PB': [9, 8, 7, 6, 5, 4, 3, 2],
-        'PE': [9, 8, 7, 6, 5, 4, 3, 2],
-        'PI': [9, 8, 7, 6, 5, 4, 3, 2],
-        'PR': [3, 2, 7, 6, 5, 4, 3, 2],
-        'RJ': [2, 7, 6, 5, 4, 3, 2],
-        'RN': [9, 8, 7, 6, 5, 4, 3, 2],
-        'RO': [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2],
-        'RR': [9, 8, 7, 6, 5, 4, 3, 2],
-        'RS': [4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2],
-        'SC': [9, 8, 7, 6, 5, 4, 3, 2],
-        'SE': [9, 8, 7, 6, 5, 4, 3, 2],
-        'SP': [1, 3, 4, 5, 6, 7, 8, 10],
-        'TO': [9, 8, 7, 6, 5, 4, 3, 2]
-    }
+    """Inscrição Estadual validator with each state's own algorithm."""
+
+    rules = IE_RULES
 
     def is_valid(self, ie: str, state: str) -> bool:
         if not ie or not isinstance(ie, str) or not state:
             return False
-        clean_ie = self.remove_mask(ie)
         state = state.upper()
-        if state not in self.state_weights:
-            return False
-        if len(clean_ie) != len(self.state_weights[state]):
+        clean_ie = self.remove_mask(ie)
+        if clean_ie[:1] == 'P':
+            clean_ie = clean_ie[1:]
+            fmt = SP_RURAL_FORMAT if state == 'SP' and len(clean_ie) == 12 else None
+        else:
+            fmt = _FORMATS.get(state, {}).get(len(clean_ie))
+        if fmt is None:
             return False
-        if not clean_ie.isdigit():
+        if fmt.prefixes and not clean_ie.startswith(fmt.prefixes):
             return False
-        return self.validate_check_digit(clean_ie, state)
+        return bool(_matches(fmt, [ord(c) - 48 for c in clean_ie]))
+
+    def is_valid_many(self, ies, states):
+        """Validate many IEs, returning a NumPy boolean mask (requires NumPy).
+
+        ``states`` is one UF for the whole batch or a sequence with one UF per
+        IE (``ValueError`` if the lengths differ). Rows are grouped by state
+        and length so each group is checked with vectorized arithmetic over
+        its digit columns.
+        """
+        np = require_numpy()
+        arr = as_text_array(ies)
+        result = np.zeros(len(arr), dtype=bool)
+        if isinstance(states, str):
+            groups = {states.upper(): np.arange(len(arr))}
+        else:
+            states = as_text_array(states)
+            if len(states) != len(arr):
+                raise ValueError(f'Got {len(arr)} IEs but {len(states)} states')
+            if states.dtype.kind == 'S':
+                states = states.astype(str)
+            codes, inverse = np.unique(np.char.upper(states), return_inverse=True)
+            inverse = inverse.ravel()
+            order = np.argsort(inverse, kind='stable')
+            bounds = np.searchsorted(inverse[order], np.arange(len(codes) + 1))
+            groups = {str(code): order[bounds[i]:bounds[i + 1]] for i, code in enumerate(codes)}
+
+        for state, index in groups.items():
+            formats = _FORMATS.get(state)
+            if not formats or not len(index):
+                continue
+            group = arr[index]
+            # Rare 'P'-prefixed SP rural inscriptions take the scalar path.
+            marker = b'P' if group.dtype.kind == 'S' else 'P'
+            rural = np.char.startswith(np.char.upper(np.char.lstrip(group)), marker)
+            if rural.any():
+                for i in np.flatnonzero(rural):
+                    value = group[i].decode('ascii', 'ignore') if marker == b'P' else str(group[i])
+                    result[index[i]] = self.is_valid(value, state)
+                index, group = index[~rural], group[~rural]
+            scan = scan_digits(group)
+            for length, fmt in formats.items():
+                digits, rows = take_digits(scan, length)
+                if not len(digits):
+                    continue
+                ok = np.zeros(len(digits), dtype=bool)
+                for prefix in fmt.prefixes or ('',):
+                    head = digits[:, :len(prefix)]
+                    ok |= (head == np.frombuffer(prefix.encode(), dtype=np.uint8) - 48).all(axis=1)
+                columns = list(digits.T.astype(np.int64))
+                result[index[rows]] = ok & _matches(fmt, columns)
+        return result
 
     def apply_mask(self, ie: str, state: str) -> str:
         if not ie or not isinstance(ie, str) or not state:
             return ''
         clean_ie = self.remove_mask(ie)
         state = state.upper()
-        if state not in self.state_weights:
+        if state not in _FORMATS:
             return ie
-        if len(clean_ie) != len(self.state_weights[state]):
+        if len(clean_ie) not in _FORMATS[state]:
             return ie
         # Simplified: just return the number for now
         return clean_ie
 
     def remove_mask(self, ie: str) -> str:
-        if not ie or not isinstance(ie, str):
-            return ''
-        return ''.join(filter(str.isdigit, ie))
+        """Digits only, keeping the leading ``P`` of SP rural producer inscriptions."""
+        clean_ie = only_digits(ie)
+        if clean_ie and ie.lstrip()[:1] in ('P', 'p'):
+            return 'P' + clean_ie
+        return clean_ie
 
     def generate(self, state: str) -> str:
         state = state.upper()
-        if state not in self.state_weights:
+        if state not in IE_RULES:
             raise ValueError(f'Invalid state: {state}')
-        weights = self.state_weights[state]
-        from random import randint
-        digits = [randint(0, 9) for _ in range(len(weights) - 1)]
-        check_digit = self.calculate_check_digit(''.join(map(str, digits)), state)
-        digits.append(check_digit)
+        fmt = IE_RULES[state][0]
+        digits = [random.randint(0, 9) for _ in range(fmt.length)]
+        if fmt.prefixes:
+            prefix = random.choice(fmt.prefixes)
+            digits[:len(prefix)] = [int(c) for c in prefix]
+        _fill_check_digits(fmt, digits)
         return ''.join(map(str, digits))
 
+    def generate_many(self, state: str, n: int, seed=None, unique: bool = False, output=None):
+        """Generate ``n`` valid IEs for ``state`` in vectorized blocks (requires NumPy).
+
+        Uses the state's first format (with its first prefix). See
+        ``CPFValidator.generate_many`` for ``seed``, ``unique`` and ``output``.
+        """
+        state = state.upper()
+        if state not in IE_RULES:
+            raise ValueError(f'Invalid state: {state}')
+        fmt = IE_RULES[state][0]
+        targets = {check.target for check in fmt.checks}
+        free = [i for i in range(fmt.length) if i not in targets]
+        prefix = fmt.prefixes[0] if fmt.prefixes else ''
+
+        def complete(base):
+            np = require_numpy()
+            full = np.zeros((len(base), fmt.length), dtype=np.int64)
+            full[:, free] = base
+            columns = list(full.T)
+            _fill_check_digits(fmt, columns)
+            digits = np.column_stack(columns).astype(np.uint8)
+            ok = fmt.constraint(columns) if fmt.constraint else np.ones(len(base), dtype=bool)
+            return digits, ok
+
+        return generate_many(
+            n, len(free), complete, seed=seed, unique=unique, output=output,
+            fixed={i: int(c) for i, c in enumerate(prefix)},
+        )
+
     def validate_check_digit(self, ie: str, state: str) -> bool:
-        weights = self.state_weights[state]
-        sum_ = sum(int(ie[i]) * weights[i] for i in range(len(weights) - 1))
-        remainder = sum_ % 11
-        expected = 0 if remainder == 0 else 11 - remainder
-        return int(ie[len(weights) - 1]) == expected
+        fmt = _FORMATS.get(state.upper(), {}).get(len(ie))
+        return fmt is not None and bool(_matches(fmt, [int(c) for c in ie]))
 
     def calculate_check_digit(self, ie: str, state: str) -> int:
-        weights = self.state_weights[state]
-        sum_ = sum(int(ie[i]) * weights[i] for i in range(len(weights) - 1))
-        remainder = sum_ % 11
-        return 0 if remainder == 0 else 11 - remainder
+        """Return the last check digit of ``ie`` under the state's first format.
+
+        The digits of ``ie`` are padded or cut to that format's length and
+        its own check digits are ignored. The digit returned is the one the
+        state checks last, which is not always the final position: for BA it
+        is the seventh digit (the second DV is computed first). Before the
+        per-state rule table this was one mod-11 digit over the SP weights
+        for every state.
+        """
+        fmt = IE_RULES[state.upper()][0]
+        digits = [int(c) for c in ie.ljust(fmt.length, '0')[:fmt.length]]
+        _fill_check_digits(fmt, digits)
+        return digits[fmt.checks[-1].target]
+
+    def get_valid_states(self) -> List[str]:
+        return list(IE_RULES.keys())
 
-    def get_valid_states(self):
-        return list(self.state_weights.keys())
+    def get_formats(self, state: str) -> Dict[int, IEFormat]:
+        """The compiled formats of a state, keyed by number of digits."""
+        return dict(_FORMATS.get(state.upper(), {}))
 
     def is_state_supported(self, state: str) -> bool:
-        return state.upper() in self.state_weights
\ No newline at end of file
+        return state.upper() in IE_RULES
@@ -1,14 +1,59 @@
 import re
-from typing import Optional, List
+from typing import Dict, Iterable, List, Optional
+
+
+class _Punctuation(dict):
+    """``str.translate`` table deleting what ``sanitize`` strips.
+
+    Characters are classified the first time they are seen and remembered,
+    so long columns are cleaned without running a regex per value.
+    """
+
+    def __missing__(self, code: int):
+        char = chr(code)
+        keep = char.isalnum() or char == '_' or char.isspace() or 'À' <= char <= 'ÿ'
+        self[code] = code if keep else None
+        return self[code]
+
+
+_PUNCTUATION = _Punctuation()
+
+NAME_CHARS_RE = re.compile(r'[a-zA-ZÀ-ÿ\s]+')
+
+# Distinct names ``normalize_many`` remembers before starting over.
+NORMALIZE_CACHE_SIZE = 100000
+
+COMMON_NAMES = frozenset([
+    'joão', 'josé', 'maria', 'ana', 'pedro', 'carlos', 'paulo', 'lucas',
+    'gabriel', 'rafael', 'daniel', 'marcelo', 'bruno', 'eduardo', 'felipe',
+    'andré', 'luiz', 'marcos', 'leonardo', 'rodrigo', 'thiago',
+    'silva', 'santos', 'oliveira', 'souza', 'rodrigues', 'ferreira',
+    'alves', 'pereira', 'lima', 'gomes', 'ribeiro', 'carvalho', 'lopes',
+    'soares', 'fernandes', 'vieira', 'barbosa', 'rocha', 'dias', 'nascimento',
+])
+
 
 class NameValidator:
+    """Person name validator.
+
+    ``lexicon`` is the set of common Brazilian first and last names used by
+    ``has_common_brazilian_name`` (lower case); extend it with
+    ``add_to_lexicon`` or ``load_lexicon``.
+    """
+
+    def __init__(self, lexicon: Optional[Iterable[str]] = None):
+        self.lexicon = COMMON_NAMES if lexicon is None else frozenset(w.lower() for w in lexicon)
+
     def is_valid(self, name: str) -> bool:
         if not name or not isinstance(name, str):
             return False
-        clean_name = self.sanitize(name)
+        return self.is_valid_sanitized(self.sanitize(name))
+
+    def is_valid_sanitized(self, clean_name: str) -> bool:
+        """``is_valid`` for a name that already went through ``sanitize``."""
         if len(clean_name) < 2 or len(clean_name) > 100:
             return False
-        if not re.match(r'^[a-zA-ZÀ-ÿ\s]+$', clean_name):
+        if not NAME_CHARS_RE.fullmatch(clean_name):
             return False
         name_parts = [part for part in clean_name.split(' ') if part]
         if len(name_parts) < 2:
@@ -21,45 +66,87 @@ class NameValidator:
     def sanitize(self, name: str) -> str:
         if not name or not isinstance(name, str):
             return ''
-        name = name.strip()
-        name = re.sub(r'\s+', ' ', name)
-        name = re.sub(r'[^\w\sÀ-ÿ]', '', name)
+        name = ' '.join(name.split()).translate(_PUNCTUATION)
         return ' '.join([n.capitalize() for n in name.split(' ')])
 
-    def get_first_name(self, name: str) -> Optional[str]:
-        if not self.is_valid(name):
+    def _clean(self, name: str) -> str:
+        # ``sanitize`` collapses whitespace before stripping punctuation, so
+        # 'Ana - Maria' keeps a double space; collapse it afterwards too.
+        if not name or not isinstance(name, str):
+            return ''
+        return ' '.join([n.capitalize() for n in name.translate(_PUNCTUATION).split()])
+
+    def parse(self, name: str) -> Optional[Dict]:
+        """Sanitize and validate once, returning every component.
+
+        Returns ``None`` for invalid names, otherwise a dict with ``name``
+        (sanitized), ``first_name``, ``middle_names``, ``last_name``,
+        ``initials`` and ``common`` (any part in the lexicon).
+        """
+        clean = self._clean(name)
+        if not self.is_valid_sanitized(clean):
             return None
-        return self.sanitize(name).split(' ')[0]
+        parts = clean.split(' ')
+        return {
+            'name': clean,
+            'first_name': parts[0],
+            'middle_names': parts[1:-1],
+            'last_name': parts[-1],
+            'initials': '.'.join([p[0].upper() for p in parts]) + '.',
+            'common': any(p.lower() in self.lexicon for p in parts),
+        }
+
+    def normalize_many(self, names: Iterable) -> List[str]:
+        """Sanitize a whole column; invalid names become ``''``.
+
+        Names are cleaned like ``parse``, so ``'Ana - Maria'`` and
+        ``'ana maria'`` both give ``'Ana Maria'``. Repeated values are only
+        processed once, remembering up to ``NORMALIZE_CACHE_SIZE`` of them.
+        """
+        seen = {}
+        result = []
+        for name in names:
+            clean = seen.get(name) if isinstance(name, str) else ''
+            if clean is None:
+                clean = self._clean(name)
+                if not self.is_valid_sanitized(clean):
+                    clean = ''
+                if len(seen) >= NORMALIZE_CACHE_SIZE:
+                    seen.clear()
+                seen[name] = clean
+            result.append(clean)
+        return result
+
+    def get_first_name(self, name: str) -> Optional[str]:
+        parsed = self.parse(name)
+        return parsed and parsed['first_name']
 
     def get_last_name(self, name: str) -> Optional[str]:
-        if not self.is_valid(name):
-            return None
-        return self.sanitize(name).split(' ')[-1]
+        parsed = self.parse(name)
+        return parsed and parsed['last_name']
 
     def get_middle_names(self, name: str) -> List[str]:
-        if not self.is_valid(name):
-            return []
-        parts = self.sanitize(name).split(' ')
-        if len(parts) <= 2:
-            return []
-        return parts[1:-1]
+        parsed = self.parse(name)
+        return parsed['middle_names'] if parsed else []
 
     def get_initials(self, name: str) -> Optional[str]:
-        if not self.is_valid(name):
-            return None
-        parts = self.sanitize(name).split(' ')
-        return '.'.join([p[0].upper() for p in parts]) + '.'
+        parsed = self.parse(name)
+        return parsed and parsed['initials']
 
     def has_common_brazilian_name(self, name: str) -> bool:
-        if not self.is_valid(name):
-            return False
-        parts = self.sanitize(name).lower().split(' ')
-        common = [
-            'joão', 'josé', 'maria', 'ana', 'pedro', 'carlos', 'paulo', 'lucas',
-            'gabriel', 'rafael', 'daniel', 'marcelo', 'bruno', 'eduardo', 'felipe',
-            'andré', 'luiz', 'marcos', 'leonardo', 'rodrigo', 'thiago', 'marcelo',
-            'silva', 'santos', 'oliveira', 'souza', 'rodrigues', 'ferreira',
-            'alves', 'pereira', 'lima', 'gomes', 'ribeiro', 'carvalho', 'lopes',
-            'soares', 'fernandes', 'vieira', 'barbosa', 'rocha', 'dias', 'nascimento'
-        ]
-        return any(p in common for p in parts)
\ No newline at end of file
+        parsed = self.parse(name)
+        return bool(parsed and parsed['common'])
+
+    def add_to_lexicon(self, *words: str) -> None:
+        """Add names to this validator's lexicon."""
+        self.lexicon = self.lexicon | {w.strip().lower() for w in words if w.strip()}
+
+    def load_lexicon(self, path: str, replace: bool = False) -> None:
+        """Load names from a UTF-8 file, one per line (``#`` starts a comment).
+
+        The names are added to the lexicon, or replace it with ``replace=True``.
+        """
+        with open(path, encoding='utf-8') as fh:
+            words = {line.split('#', 1)[0].strip().lower() for line in fh}
+        words.discard('')
+        self.lexicon = frozenset(words) if replace else self.lexicon | words
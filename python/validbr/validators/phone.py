@@ -1,31 +1,72 @@
-import re
-from typing import Optional
+from typing import Dict, Optional
+
+from .._batch import as_text_array, require_numpy, scan_digits, take_digits
+from .._mask import mask_many
+from .._normalize import only_digits
+
+DDD_MAP = {
+    '11': 'São Paulo', '12': 'São Paulo', '13': 'São Paulo',
+    '14': 'São Paulo', '15': 'São Paulo', '16': 'São Paulo',
+    '17': 'São Paulo', '18': 'São Paulo', '19': 'São Paulo',
+    '21': 'Rio de Janeiro', '22': 'Rio de Janeiro', '24': 'Rio de Janeiro',
+    '27': 'Espírito Santo', '28': 'Espírito Santo',
+    '31': 'Minas Gerais', '32': 'Minas Gerais', '33': 'Minas Gerais',
+    '34': 'Minas Gerais', '35': 'Minas Gerais', '37': 'Minas Gerais',
+    '38': 'Minas Gerais', '41': 'Paraná', '42': 'Paraná',
+    '43': 'Paraná', '44': 'Paraná', '45': 'Paraná', '46': 'Paraná',
+    '47': 'Santa Catarina', '48': 'Santa Catarina', '49': 'Santa Catarina',
+    '51': 'Rio Grande do Sul', '53': 'Rio Grande do Sul',
+    '54': 'Rio Grande do Sul', '55': 'Rio Grande do Sul',
+    '61': 'Distrito Federal', '62': 'Goiás', '63': 'Tocantins',
+    '64': 'Goiás', '65': 'Mato Grosso', '66': 'Mato Grosso',
+    '67': 'Mato Grosso do Sul', '68': 'Acre', '69': 'Rondônia',
+    '71': 'Bahia', '73': 'Bahia', '74': 'Bahia', '75': 'Bahia',
+    '77': 'Bahia', '79': 'Sergipe', '81': 'Pernambuco',
+    '82': 'Alagoas', '83': 'Paraíba', '84': 'Rio Grande do Norte',
+    '85': 'Ceará', '86': 'Piauí', '87': 'Pernambuco',
+    '88': 'Ceará', '89': 'Piauí', '91': 'Pará', '92': 'Amazonas',
+    '93': 'Pará', '94': 'Pará', '95': 'Roraima', '96': 'Amapá',
+    '97': 'Amazonas', '98': 'Maranhão', '99': 'Maranhão'
+}
+
+# DDD integer -> state name (``None`` for unused DDDs), for O(1) array lookups.
+DDD_STATES = tuple(DDD_MAP.get(f'{ddd:02d}') for ddd in range(100))
+
+# Digit count -> mask: mobile (11 digits) and landline (10).
+MASK_TEMPLATES = {11: '(##) #####-####', 10: '(##) ####-####'}
+
+# International/trunk prefixes stripped before validation, tried in order:
+# (prefix, total digit counts it applies to, digits to drop).
+PREFIX_RULES = (
+    ('0055', (14, 15), 4),  # 00 + country code
+    ('0', (13, 14), 3),     # 0 + carrier code (0xx)
+    ('0', (11, 12), 1),     # trunk prefix
+    ('55', (12, 13), 2),    # country code, with or without '+'
+)
+
+
+def _valid_national_many(np, digits):
+    """Vectorized ``is_valid`` over a ``(n, 10)`` or ``(n, 11)`` digit matrix.
+
+    Returns ``(valid, ddd)`` with the DDD as an integer column.
+    """
+    known = np.array([state is not None for state in DDD_STATES])
+    ddd = digits[:, 0].astype(np.intp) * 10 + digits[:, 1]
+    third = digits[:, 2]
+    if digits.shape[1] == 11:
+        return known[ddd] & (third == 9), ddd
+    return known[ddd] & (third >= 2) & (third <= 8), ddd
+
+
+def _national(clean: str) -> str:
+    for prefix, lengths, drop in PREFIX_RULES:
+        if len(clean) in lengths and clean.startswith(prefix):
+            return clean[drop:]
+    return clean
+
 
 class PhoneValidator:
-    ddd_map = {
-        '11': 'São Paulo', '12': 'São Paulo', '13': 'São Paulo',
-        '14': 'São Paulo', '15': 'São Paulo', '16': 'São Paulo',
-        '17': 'São Paulo', '18': 'São Paulo', '19': 'São Paulo',
-        '21': 'Rio de Janeiro', '22': 'Rio de Janeiro', '24': 'Rio de Janeiro',
-        '27': 'Espírito Santo', '28': 'Espírito Santo',
-        '31': 'Minas Gerais', '32': 'Minas Gerais', '33': 'Minas Gerais',
-        '34': 'Minas Gerais', '35': 'Minas Gerais', '37': 'Minas Gerais',
-        '38': 'Minas Gerais', '41': 'Paraná', '42': 'Paraná',
-        '43': 'Paraná', '44': 'Paraná', '45': 'Paraná', '46': 'Paraná',
-        '47': 'Santa Catarina', '48': 'Santa Catarina', '49': 'Santa Catarina',
-        '51': 'Rio Grande do Sul', '53': 'Rio Grande do Sul',
-        '54': 'Rio Grande do Sul', '55': 'Rio Grande do Sul',
-        '61': 'Distrito Federal', '62': 'Goiás', '63': 'Tocantins',
-        '64': 'Goiás', '65': 'Mato Grosso', '66': 'Mato Grosso',
-        '67': 'Mato Grosso do Sul', '68': 'Acre', '69': 'Rondônia',
-        '71': 'Bahia', '73': 'Bahia', '74': 'Bahia', '75': 'Bahia',
-        '77': 'Bahia', '79': 'Sergipe', '81': 'Pernambuco',
-        '82': 'Alagoas', '83': 'Paraíba', '84': 'Rio Grande do Norte',
-        '85': 'Ceará', '86': 'Piauí', '87': 'Pernambuco',
-        '88': 'Ceará', '89': 'Piauí', '91': 'Pará', '92': 'Amazonas',
-        '93': 'Pará', '94': 'Pará', '95': 'Roraima', '96': 'Amapá',
-        '97': 'Amazonas', '98': 'Maranhão', '99': 'Maranhão'
-    }
+    ddd_map = DDD_MAP
 
     def is_valid(self, phone: str) -> bool:
         if not phone or not isinstance(phone, str):
@@ -39,7 +80,7 @@ class PhoneValidator:
         if len(clean_phone) == 11:
             return clean_phone[2] == '9'
         else:
-            return re.match(r'^[2-8]', clean_phone[2:]) is not None
+            return '2' <= clean_phone[2] <= '8'
 
     def get_ddd(self, phone: str) -> Optional[str]:
         if not phone or not isinstance(phone, str):
@@ -51,8 +92,68 @@ class PhoneValidator:
         return ddd if ddd in self.ddd_map else None
 
     def get_state(self, ddd: str) -> Optional[str]:
+        """State of a DDD (``'11'``) or of a whole phone number."""
+        if ddd and isinstance(ddd, str) and len(ddd) > 2:
+            ddd = self.get_ddd(ddd)
         return self.ddd_map.get(ddd)
 
+    def normalize(self, phone: str) -> Optional[str]:
+        """Return ``phone`` in E.164 (``+5511912345678``), or ``None`` if invalid.
+
+        Accepts national numbers plus ``+55``/``0055`` country codes, a ``0``
+        trunk prefix and ``0xx`` carrier-selection prefixes.
+        """
+        national = _national(self.remove_mask(phone))
+        return '+55' + national if self.is_valid(national) else None
+
+    def normalize_many(self, phones) -> Dict[str, object]:
+        """Batch form of ``normalize`` returning columnar NumPy arrays (requires NumPy).
+
+        Keys: ``e164`` (``''`` when invalid), ``valid``, ``ddd`` (``0`` when
+        invalid), ``state`` (``''`` when invalid) and ``mobile``. DDDs are
+        checked against a 100-entry table indexed by the DDD number.
+        """
+        np = require_numpy()
+        arr = as_text_array(phones)
+        n = len(arr)
+        e164 = np.zeros(n, dtype='U14')
+        valid = np.zeros(n, dtype=bool)
+        ddd = np.zeros(n, dtype=np.uint8)
+        mobile = np.zeros(n, dtype=bool)
+
+        scan = scan_digits(arr)
+        for length in range(10, 16):
+            digits, rows = take_digits(scan, length)
+            if not len(digits):
+                continue
+            index = np.flatnonzero(rows)
+            drop = np.full(len(digits), -1 if length > 11 else 0, dtype=np.int8)
+            pending = np.ones(len(digits), dtype=bool)
+            for prefix, lengths, count in PREFIX_RULES:
+                if length in lengths:
+                    head = np.frombuffer(prefix.encode(), dtype=np.uint8) - 48
+                    match = pending & (digits[:, :len(prefix)] == head).all(axis=1)
+                    drop[match] = count
+                    pending &= ~match
+            for count in np.unique(drop[drop >= 0]):
+                width = length - count
+                if width not in (10, 11):
+                    continue
+                group = drop == count
+                national = digits[group, count:]
+                ok, codes = _valid_national_many(np, national)
+                target = index[group][ok]
+                valid[target] = True
+                ddd[target] = codes[ok]
+                mobile[target] = width == 11
+                text = np.empty((int(ok.sum()), width + 3), dtype=np.uint8)
+                text[:, :3] = np.frombuffer(b'+55', dtype=np.uint8)
+                text[:, 3:] = national[ok] + 48
+                e164[target] = text.view(f'S{width + 3}').ravel().astype('U14')
+
+        names = np.array([state or '' for state in DDD_STATES])
+        return {'e164': e164, 'valid': valid, 'ddd': ddd, 'state': names[ddd], 'mobile': mobile}
+
     def apply_mask(self, phone: str) -> str:
         if not phone or not isinstance(phone, str):
             return ''
@@ -63,10 +164,12 @@ class PhoneValidator:
             return f'({clean_phone[:2]}) {clean_phone[2:6]}-{clean_phone[6:]}'
         return phone
 
+    def apply_mask_many(self, phones, clean: bool = False, out=None, output=None):
+        """Batch ``apply_mask`` (``S15`` records, landlines NUL padded); see ``CPFValidator.apply_mask_many``."""
+        return mask_many(phones, MASK_TEMPLATES, clean=clean, out=out, output=output)
+
     def remove_mask(self, phone: str) -> str:
-        if not phone or not isinstance(phone, str):
-            return ''
-        return re.sub(r'\D', '', phone)
+        return only_digits(phone)
 
     def get_valid_ddds(self):
         return list(self.ddd_map.keys())
@@ -1,6 +1,12 @@
-import re
 from typing import Optional
 
+from .._mask import mask_many
+from .._normalize import only_digits
+
+# Digit count -> mask; 9-digit RGs end in a check digit.
+MASK_TEMPLATES = {8: '##.###.###', 9: '##.###.###-#'}
+
+
 class RGValidator:
     state_weights = {
         'SP': [2, 3, 4, 5, 6, 7, 8, 9],
@@ -38,8 +44,6 @@ class RGValidator:
         clean_rg = self.remove_mask(rg)
         if len(clean_rg) not in (8, 9):
             return False
-        if not re.match(r'^\d{8,9}$', clean_rg):
-            return False
         if state and state.upper() in self.state_weights:
             return self.validate_check_digit(clean_rg, state.upper())
         return True
@@ -54,10 +58,12 @@ class RGValidator:
             return f'{clean_rg[:2]}.{clean_rg[2:5]}.{clean_rg[5:8]}-{clean_rg[8]}'
         return rg
 
+    def apply_mask_many(self, rgs, clean: bool = False, out=None, output=None):
+        """Batch ``apply_mask`` (``S12`` records, 8-digit RGs NUL padded); see ``CPFValidator.apply_mask_many``."""
+        return mask_many(rgs, MASK_TEMPLATES, clean=clean, out=out, output=output)
+
     def remove_mask(self, rg: str) -> str:
-        if not rg or not isinstance(rg, str):
-            return ''
-        return re.sub(r'\D', '', rg)
+        return only_digits(rg)
 
     def validate_check_digit(self, rg: str, state: str) -> bool:
         if len(rg) != 9:
@@ -1,13 +1,29 @@
-import re
 import random
 
+from .._batch import require_numpy
+from .._generate import generate_many, not_repeated
+from .._mask import mask_many
+from .._normalize import only_digits
+
+MASK_TEMPLATE = '#### #### ####'
+
+
+def _complete_many(base):
+    np = require_numpy()
+    values = base.astype(np.int32)
+    d1 = (values[:, :8] @ np.arange(9, 1, -1, dtype=np.int32)) % 11
+    d2 = (values[:, 8] * 4 + values[:, 9] * 3) % 11
+    digits = np.column_stack([base, d1 % 10, d2 % 10]).astype(np.uint8)
+    return digits, not_repeated(np, digits)
+
+
 class TituloEleitorValidator:
     """Validador de Título de Eleitor"""
     def is_valid(self, titulo: str) -> bool:
         if not titulo or not isinstance(titulo, str):
             return False
         clean = self.remove_mask(titulo)
-        if not re.match(r'^\d{12}$', clean):
+        if len(clean) != 12:
             return False
         if len(set(clean)) == 1:
             return False
@@ -22,12 +38,16 @@ class TituloEleitorValidator:
 
     def apply_mask(self, titulo: str) -> str:
         clean = self.remove_mask(titulo)
-        return re.sub(r'^(\d{4})(\d{4})(\d{4})$', r'\1 \2 \3', clean)
+        if len(clean) != 12:
+            return clean
+        return f'{clean[:4]} {clean[4:8]} {clean[8:]}'
+
+    def apply_mask_many(self, titulos, clean: bool = False, out=None, output=None):
+        """Batch ``apply_mask`` into fixed-width bytes; see ``CPFValidator.apply_mask_many``."""
+        return mask_many(titulos, {12: MASK_TEMPLATE}, clean=clean, out=out, output=output)
 
     def remove_mask(self, titulo: str) -> str:
-        if not titulo or not isinstance(titulo, str):
-            return ''
-        return re.sub(r'\D', '', titulo)
+        return only_digits(titulo)
 
     def generate(self) -> str:
         while True:
@@ -38,6 +58,16 @@ class TituloEleitorValidator:
             d2 = sum(n[i] * (4 - (i - 8)) for i in range(8, 10)) % 11
             if d2 == 10:
                 d2 = 0
-            titulo = ''.join(str(x) for x in n) + str(d1) + str(d2)
-            if self.is_valid(titulo):
-                return titulo
+            # Redraw only in the (rare) all-digits-equal case is_valid rejects.
+            if len(set(n + [d1, d2])) > 1:
+                return ''.join(str(x) for x in n) + str(d1) + str(d2)
+
+    def generate_many(self, n: int, seed=None, masked: bool = False, unique: bool = False, output=None):
+        """Generate ``n`` valid títulos in vectorized blocks (requires NumPy).
+
+        See ``CPFValidator.generate_many`` for ``seed``, ``unique`` and ``output``.
+        """
+        return generate_many(
+            n, 10, _complete_many, seed=seed, template=MASK_TEMPLATE if masked else None,
+            unique=unique, output=output,
+        )